@@ -18,14 +18,13 @@ import logging
 import json
 import os
 
-import librosa
 import numpy as np
 # -- import whatever you need here and remove
 # -- example imports you won't use
 
 from mirdata import download_utils
 from mirdata import jams_utils
-from mirdata import core, annotations
+from mirdata import core, annotations, io
 
 # -- Add any relevant citations here
 BIBTEX = """
@@ -113,11 +112,13 @@ class Track(core.Track):
 
     # -- `audio` will behave like an attribute, but it will only be loaded
     # -- when someone accesses it and it won't be stored. By default, we make
-    # -- any memory heavy information (like audio) properties
+    # -- any memory heavy information (like audio) properties. Audio is loaded
+    # -- through self._load_audio, which applies the dataset's audio options
+    # -- (e.g. the audio cache)
     @property
     def audio(self):
         """(np.ndarray, float): DESCRIPTION audio signal, sample rate"""
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
 
     # -- we use the to_jams function to convert all the annotations in the JAMS format.
     # -- The converter takes as input all the annotations in the proper format (e.g. beats
@@ -172,7 +173,7 @@ class MultiTrack(core.MultiTrack):
     @property
     def audio(self):
         """(np.ndarray, float): DESCRIPTION audio signal, sample rate"""
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
 
     # -- multitrack classes are themselves Tracks, and also need a to_jams method
     # -- for any mixture-level annotations
@@ -201,7 +202,8 @@ def load_audio(fhandle):
     # -- for example, the code below. This should be dataset specific!
     # -- By default we load to mono
     # -- change this if it doesn't make sense for your dataset.
-    return librosa.load(audio_path, sr=None, mono=True)
+    # -- Always decode with io.load_audio (a wrapper around librosa.load)
+    return io.load_audio(fhandle, sr=None, mono=True)
 
 
 # -- Write any necessary loader functions for loading the dataset's data
@@ -248,7 +250,7 @@ class Dataset(core.Dataset):
     # -- load_ function
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_annotation)
     def load_annotation(self, *args, **kwargs):
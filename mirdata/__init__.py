@@ -4,7 +4,6 @@ import pkgutil
 
 from .version import version as __version__
 
-
 DATASETS = [
     d.name
     for d in pkgutil.iter_modules(
@@ -22,7 +21,15 @@ def list_datasets():
     return DATASETS
 
 
-def initialize(dataset_name, data_home=None):
+def initialize(
+    dataset_name,
+    data_home=None,
+    annotation_cache=None,
+    audio_cache=None,
+    sample_rate=None,
+    mono=None,
+    resample_quality=None,
+):
     """Load a mirdata dataset by name
 
     Example:
@@ -40,6 +47,22 @@ def initialize(dataset_name, data_home=None):
             see mirdata.DATASETS for a complete list of possibilities
         data_home (str or None): path where the data lives. If None
             uses the default location.
+        annotation_cache (bool, str or None): if True or a path, parsed annotations
+            are cached on disk, in the default cache folder or in the given
+            folder respectively. See mirdata.cache.AnnotationCache
+        audio_cache (bool, str, mirdata.cache.AudioCache or None): if True or a
+            path, decoded audio is cached on disk, in the default cache folder or
+            in the given folder respectively. Pass a mirdata.cache.AudioCache to
+            set the size budget of the cache.
+        sample_rate (float or None): if not None, all audio of the dataset is
+            loaded at this sample rate. Resampled audio is stored in the audio
+            cache when there is one, so each file is only resampled once.
+        mono (bool or None): if True, all audio is loaded as mono with shape
+            (n_samples,). If False, all audio has shape (n_channels, n_samples).
+            If None, each loader's default is used.
+        resample_quality (str or None): resampler speed/quality tier, one of
+            "best", "high", "medium" or "fast" (see mirdata.io.RESAMPLE_QUALITY),
+            or any ``res_type`` supported by librosa. If None, uses librosa's default.
 
     Returns:
         Dataset: a mirdata.core.Dataset object
@@ -49,4 +72,24 @@ def initialize(dataset_name, data_home=None):
         raise ValueError("Invalid dataset {}".format(dataset_name))
 
     module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
-    return module.Dataset(data_home=data_home)
+    dataset = module.Dataset(data_home=data_home)
+
+    if annotation_cache:
+        from mirdata import cache
+
+        dataset.annotation_cache = cache.AnnotationCache(
+            None if annotation_cache is True else annotation_cache
+        )
+
+    if audio_cache:
+        from mirdata import cache
+
+        if not isinstance(audio_cache, cache.AudioCache):
+            audio_cache = cache.AudioCache(None if audio_cache is True else audio_cache)
+        dataset.audio_cache = audio_cache
+
+    dataset.sample_rate = sample_rate
+    dataset.mono = mono
+    dataset.resample_quality = resample_quality
+
+    return dataset
@@ -0,0 +1,413 @@
+"""Fixed-length batches of audio crops and aligned annotations
+
+`BatchIterator` turns a dataset into a stream of training batches without
+depending on any deep learning framework. Tracks are loaded by a pool of
+prefetch threads, each track is cut into fixed-length crops, and crops are
+stacked into contiguous numpy arrays together with the annotations cropped
+to the same time window.
+
+Example:
+    .. code-block:: python
+
+        beatles = mirdata.initialize("beatles", audio_cache=True)
+        batches = beatles.iter_batches(16, 3.0, 22050, annotations=["beats"])
+        for batch in batches:
+            batch["audio"]  # np.ndarray of shape (16, 66150)
+            batch["beats"]  # list of 16 BeatData, with times relative to each crop
+        batches.stats  # throughput of the loaders and of the consumer
+
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+
+import numpy as np
+
+from mirdata import annotations, io
+
+DEFAULT_QUEUE_SIZE = 64
+_DONE = object()
+
+
+def audio_duration(track, audio_property):
+    """Get the duration of a track's audio from its file header, without decoding it
+
+    The audio file is found from the track attributes read by the audio
+    property (e.g. ``self.audio_path``).
+
+    Args:
+        track (core.Track): a track object
+        audio_property (str): the track's audio property, e.g. "audio"
+
+    Returns:
+        float or None: the duration in seconds, or None if the audio file
+            cannot be found or its header cannot be read by soundfile
+
+    """
+    prop = getattr(type(track), audio_property, None)
+    func = getattr(prop, "fget", None) or getattr(prop, "func", None)
+    if func is None:
+        return None
+    paths = {
+        value
+        for value in (vars(track).get(name) for name in func.__code__.co_names)
+        if isinstance(value, str) and os.path.isfile(value)
+    }
+    if len(paths) != 1:
+        return None
+    try:
+        info = io.sf.info(paths.pop())
+    except (RuntimeError, OSError):
+        return None
+    return info.frames / float(info.samplerate)
+
+
+def crop_annotation(annotation, start, end):
+    """Crop an annotation to a time window
+
+    Events (times) are kept if they fall in [start, end), intervals are kept
+    if they overlap the window and are clipped to it. Times in the cropped
+    annotation are relative to `start`. Other attributes of the same length
+    (e.g. labels, frequencies) are cropped along.
+
+    Args:
+        annotation (annotations.Annotation or Any): the annotation to crop
+        start (float): start time of the window (in seconds)
+        end (float): end time of the window (in seconds)
+
+    Returns:
+        annotations.Annotation or Any: the cropped annotation. Anything other
+            than an annotation with times or intervals (e.g. None, or a
+            track-level label) is returned unchanged.
+
+    """
+    if not isinstance(annotation, annotations.Annotation):
+        return annotation
+
+    attributes = vars(annotation)
+    if attributes.get("times") is not None:
+        time_key = "times"
+        times = attributes["times"]
+        mask = (times >= start) & (times < end)
+        cropped_times = times[mask] - start
+    elif attributes.get("intervals") is not None:
+        time_key = "intervals"
+        intervals = attributes["intervals"]
+        mask = (intervals[:, 1] > start) & (intervals[:, 0] < end)
+        cropped_times = np.clip(intervals[mask], start, end) - start
+    else:
+        return annotation
+
+    annotation_class = type(annotation)
+    cropped = annotation_class.__new__(annotation_class)
+    for name, value in attributes.items():
+        if name == time_key:
+            value = cropped_times
+        elif isinstance(value, np.ndarray) and len(value) == len(mask):
+            value = value[mask]
+        elif isinstance(value, list) and len(value) == len(mask):
+            value = [v for v, keep in zip(value, mask) if keep]
+        setattr(cropped, name, value)
+    return cropped
+
+
+class BatchIterator(object):
+    """Iterator over batches of fixed-length audio crops, loaded in the background
+
+    Each batch is a dictionary with:
+
+    - ``audio`` (np.ndarray): contiguous array of shape (batch_size, n_samples),
+      or (batch_size, n_channels, n_samples) if mono is False
+    - ``track_ids`` (list): the track id of each crop
+    - ``offsets`` (np.ndarray): the start time of each crop (in seconds)
+    - one list per requested annotation, with the annotations cropped to each
+      crop's time window (see `crop_annotation`)
+
+    Only the audio of each crop is read (see `core.Track.get_audio`), when
+    the track's duration can be read from its audio file's header (see
+    `audio_duration`). Otherwise the whole track is decoded and cropped.
+
+    Tracks shorter than the crop duration are zero-padded. Tracks which fail
+    to load are skipped and their errors collected in `errors`.
+
+    Batches are produced in the order in which tracks finish loading, so with
+    several workers the order is not deterministic, even with a seed.
+
+    Attributes:
+        errors (dict): {`track_id`: exception} of the tracks which failed to load
+
+    """
+
+    def __init__(
+        self,
+        dataset,
+        batch_size,
+        duration,
+        sample_rate,
+        annotations=None,
+        audio_property="audio",
+        track_ids=None,
+        crops_per_track=1,
+        mono=True,
+        shuffle=True,
+        drop_last=False,
+        seed=None,
+        workers=4,
+        queue_size=DEFAULT_QUEUE_SIZE,
+    ):
+        """BatchIterator init method
+
+        Args:
+            dataset (core.Dataset): the dataset to load tracks from
+            batch_size (int): number of crops per batch
+            duration (float): duration of each crop (in seconds)
+            sample_rate (float): sample rate of the batches' audio
+            annotations (list or None): names of track properties to crop
+                along with the audio, e.g. ["beats", "chords"]
+            audio_property (str): the track's audio property, e.g. "audio"
+            track_ids (list or None): tracks to load. If None, uses every track.
+            crops_per_track (int): number of random crops taken from each track
+            mono (bool): if True, audio is mixed down to mono
+            shuffle (bool): if True, tracks are loaded in random order
+            drop_last (bool): if True, the last batch is dropped if it is
+                smaller than batch_size
+            seed (int or None): seed for the track order and crop positions
+            workers (int): number of threads loading tracks
+            queue_size (int): maximum number of crops loaded ahead of the consumer
+
+        Raises:
+            ValueError: if batch_size, duration, crops_per_track, workers or
+                queue_size are not positive
+
+        """
+        for name, value in [
+            ("batch_size", batch_size),
+            ("duration", duration),
+            ("crops_per_track", crops_per_track),
+            ("workers", workers),
+            ("queue_size", queue_size),
+        ]:
+            if value <= 0:
+                raise ValueError("{} must be positive, got {}".format(name, value))
+
+        self._dataset = dataset
+        self.batch_size = batch_size
+        self.duration = duration
+        self.sample_rate = sample_rate
+        self.n_samples = int(round(duration * sample_rate))
+        self.annotations = list(annotations or [])
+        self.audio_property = audio_property
+        self.crops_per_track = crops_per_track
+        self.mono = mono
+        self.drop_last = drop_last
+        self.workers = workers
+
+        self._rng = np.random.default_rng(seed)
+        track_ids = list(dataset.track_ids if track_ids is None else track_ids)
+        if shuffle:
+            self._rng.shuffle(track_ids)
+        self._track_ids = track_ids
+
+        self._tasks = queue.Queue()
+        for track_id in track_ids:
+            self._tasks.put((track_id, self._rng.integers(2**32)))
+        self._examples = queue.Queue(maxsize=queue_size)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._finished_workers = 0
+        self._started = None
+
+        self.errors = {}
+        self._n_tracks = 0
+        self._n_examples = 0
+        self._n_batches = 0
+        self._load_seconds = 0.0
+        self._wait_seconds = 0.0
+
+    def __repr__(self):
+        return "BatchIterator({} tracks, batch_size={}, duration={})".format(
+            len(self._track_ids), self.batch_size, self.duration
+        )
+
+    @property
+    def stats(self):
+        """dict: throughput statistics
+
+        - ``tracks``, ``examples``, ``batches``: number of tracks loaded,
+          crops produced and batches returned so far
+        - ``errors``: number of tracks which failed to load
+        - ``elapsed``: seconds since iteration started
+        - ``examples_per_second``, ``batches_per_second``: consumer throughput
+        - ``load_seconds``: time spent loading tracks, summed over workers
+        - ``wait_seconds``: time the consumer spent waiting for crops. If it
+          is a large fraction of ``elapsed``, loading is the bottleneck.
+
+        """
+        elapsed = 0.0 if self._started is None else time.perf_counter() - self._started
+        with self._lock:
+            return {
+                "tracks": self._n_tracks,
+                "examples": self._n_examples,
+                "batches": self._n_batches,
+                "errors": len(self.errors),
+                "elapsed": elapsed,
+                "examples_per_second": self._n_examples / elapsed if elapsed else 0.0,
+                "batches_per_second": self._n_batches / elapsed if elapsed else 0.0,
+                "load_seconds": self._load_seconds,
+                "wait_seconds": self._wait_seconds,
+            }
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._examples.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _load_track(self, track_id, seed):
+        track = self._dataset.track(track_id)
+        audio_options = dict(
+            self._dataset._audio_options, sample_rate=self.sample_rate, mono=self.mono
+        )
+        track._audio_options = audio_options
+        duration = audio_duration(track, self.audio_property)
+        if duration is None:
+            audio, _ = getattr(track, self.audio_property)
+            length = audio.shape[-1]
+        else:
+            audio = None
+            length = int(duration * self.sample_rate)
+        values = {name: getattr(track, name) for name in self.annotations}
+
+        rng = np.random.default_rng(seed)
+        if length > self.n_samples:
+            starts = rng.integers(0, length - self.n_samples + 1, self.crops_per_track)
+        else:
+            starts = np.zeros(self.crops_per_track, dtype=int)
+
+        examples = []
+        for start in starts:
+            offset = start / float(self.sample_rate)
+            if audio is None:
+                crop, _ = track.get_audio(
+                    offset, self.duration, audio_property=self.audio_property
+                )
+                crop = np.array(crop[..., : self.n_samples])
+            else:
+                # copy the crop so that the full track can be freed
+                crop = np.array(audio[..., start : start + self.n_samples])
+            cropped = {
+                name: crop_annotation(value, offset, offset + self.duration)
+                for name, value in values.items()
+            }
+            examples.append((track_id, offset, crop, cropped))
+        return examples
+
+    def _work(self):
+        try:
+            while not self._stop.is_set():
+                try:
+                    track_id, seed = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                tic = time.perf_counter()
+                try:
+                    examples = self._load_track(track_id, seed)
+                except Exception as exc:
+                    with self._lock:
+                        self.errors[track_id] = exc
+                    continue
+                finally:
+                    with self._lock:
+                        self._load_seconds += time.perf_counter() - tic
+                with self._lock:
+                    self._n_tracks += 1
+                for example in examples:
+                    if not self._put(example):
+                        return
+        finally:
+            self._put(_DONE)
+
+    def _start(self):
+        self._started = time.perf_counter()
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._work, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _next_example(self):
+        tic = time.perf_counter()
+        while self._finished_workers < self.workers:
+            item = self._examples.get()
+            if item is _DONE:
+                self._finished_workers += 1
+                continue
+            with self._lock:
+                self._wait_seconds += time.perf_counter() - tic
+            return item
+        return None
+
+    def _make_batch(self, examples):
+        crops = [crop for _, _, crop, _ in examples]
+        shape = (len(crops),) + crops[0].shape[:-1] + (self.n_samples,)
+        audio = np.zeros(shape, dtype=crops[0].dtype)
+        for i, crop in enumerate(crops):
+            audio[i, ..., : crop.shape[-1]] = crop
+
+        batch = {
+            "audio": audio,
+            "track_ids": [track_id for track_id, _, _, _ in examples],
+            "offsets": np.array([offset for _, offset, _, _ in examples]),
+        }
+        for name in self.annotations:
+            batch[name] = [cropped[name] for _, _, _, cropped in examples]
+        return batch
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._started is None:
+            self._start()
+        examples = []
+        while len(examples) < self.batch_size:
+            example = self._next_example()
+            if example is None:
+                break
+            examples.append(example)
+
+        if not examples or (self.drop_last and len(examples) < self.batch_size):
+            self.close()
+            if self.errors:
+                logging.warning(
+                    "{} of {} tracks failed to load, see .errors".format(
+                        len(self.errors), len(self._track_ids)
+                    )
+                )
+            raise StopIteration
+        with self._lock:
+            self._n_examples += len(examples)
+            self._n_batches += 1
+        return self._make_batch(examples)
+
+    def close(self):
+        """Stop the workers and release the loaded crops"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._finished_workers = self.workers
+        while not self._examples.empty():
+            self._examples.get_nowait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,591 @@
+"""On-disk caches for data loaded by mirdata
+
+The annotation cache stores parsed annotations (``mirdata.annotations``
+objects) as ``.npz`` files, so that each annotation file is only parsed once
+across processes. Cache entries are keyed by the dataset, the loader and the
+checksum stored in the dataset's index for the annotation file, so they are
+invalidated automatically when that file changes in the index.
+
+Example:
+    .. code-block:: python
+
+        beatles = mirdata.initialize("beatles", annotation_cache=True)
+        beatles.track("0111").beats  # parsed and stored in the cache
+        # in any later process, this is a single binary read
+        beatles.track("0111").beats
+
+The audio cache stores decoded audio as ``.npy`` files, which are read back
+memory-mapped (copy-on-write). Entries are keyed by the checksum of the audio
+file in the dataset's index and the decoding parameters (sample rate, mono,
+dtype), and the least recently used entries are evicted when the cache grows
+over its size budget.
+
+Example:
+    .. code-block:: python
+
+        saraga = mirdata.initialize("saraga_carnatic", audio_cache=True)
+        track = saraga.choice_track()
+        audio, sr = track.audio  # decoded and stored in the cache
+        audio, sr = track.audio  # memory-mapped from the cache
+
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import time
+import uuid
+
+import numpy as np
+
+from mirdata import annotations
+from mirdata import validate
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.getenv("HOME", "/tmp"), ".cache")),
+    "mirdata",
+)
+DEFAULT_AUDIO_CACHE_SIZE = 10 * 1024**3  # bytes
+
+
+def atomic_write(path, data):
+    """Write bytes to a file so that readers never see a partial file
+
+    Args:
+        path (str): file path
+        data (bytes): file contents
+
+    """
+    dir_name = os.path.dirname(path)
+    if not os.path.exists(dir_name):
+        os.makedirs(dir_name, exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(path, uuid.uuid4().hex)
+    try:
+        with open(tmp_path, "wb") as fhandle:
+            fhandle.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def track_checksum(track):
+    """Get a checksum of all the files of a track, as stored in the index
+
+    Args:
+        track (core.Track): a track object
+
+    Returns:
+        str or None: md5 hash of the track's index entry, or None if the
+            track has no index entry
+
+    """
+    track_paths = getattr(track, "_track_paths", None)
+    if not track_paths:
+        return None
+    entries = sorted(
+        "{}:{}".format(key, value[1]) for key, value in track_paths.items()
+    )
+    return hashlib.md5("\n".join(entries).encode("utf-8")).hexdigest()
+
+
+def property_checksum(track, func):
+    """Get the checksum of the files a track property is parsed from
+
+    The files are found from the track attributes read by the property (e.g.
+    ``self.beats_path``) which point to a file of the track's index entry, so
+    changes to the track's other files (e.g. its audio) do not affect it.
+
+    Args:
+        track (core.Track): a track object
+        func (function): the function computing the property from the track
+
+    Returns:
+        str or None: the index checksum of the property's file, or a hash of
+            the checksums if it reads several files. If the property reads
+            none of the track's files, falls back to `track_checksum`.
+
+    """
+    track_paths = getattr(track, "_track_paths", None)
+    data_home = getattr(track, "_data_home", None)
+    if not track_paths or data_home is None:
+        return track_checksum(track)
+
+    checksums = {
+        os.path.normpath(os.path.join(data_home, value[0])): value[1]
+        for value in track_paths.values()
+        if value[0] is not None
+    }
+    sources = set()
+    for name in func.__code__.co_names:
+        value = vars(track).get(name)
+        if isinstance(value, str) and os.path.normpath(value) in checksums:
+            sources.add(checksums[os.path.normpath(value)])
+    if not sources:
+        return track_checksum(track)
+    if len(sources) == 1:
+        return sources.pop()
+    return hashlib.md5("\n".join(sorted(sources)).encode("utf-8")).hexdigest()
+
+
+def annotation_to_bytes(annotation):
+    """Serialize an annotation object to npz bytes
+
+    Args:
+        annotation (annotations.Annotation): annotation object
+
+    Returns:
+        bytes or None: npz file contents, or None if the annotation has
+            attributes which cannot be serialized
+
+    """
+    if not isinstance(annotation, annotations.Annotation):
+        return None
+
+    arrays = {}
+    fields = {}
+    for name, value in vars(annotation).items():
+        if value is None:
+            fields[name] = "none"
+        elif isinstance(value, np.ndarray) and value.dtype != object:
+            fields[name] = "array"
+            arrays[name] = value
+        elif isinstance(value, list) and all(isinstance(v, str) for v in value):
+            fields[name] = "str_list"
+            arrays[name] = np.array(value, dtype=str)
+        elif isinstance(value, list) and all(isinstance(v, list) for v in value):
+            fields[name] = "nested_list"
+            arrays[name] = np.array([x for v in value for x in v], dtype=float)
+            arrays[name + ".lengths"] = np.array([len(v) for v in value], dtype=int)
+        else:
+            return None
+
+    meta = {"class": type(annotation).__name__, "fields": fields}
+    arrays["__meta__"] = np.array(json.dumps(meta))
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def annotation_from_file(path):
+    """Load an annotation object stored with `annotation_to_bytes`
+
+    Args:
+        path (str): path to an npz file
+
+    Returns:
+        annotations.Annotation: annotation object
+
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["__meta__"]))
+        annotation_class = getattr(annotations, meta["class"])
+        # the annotation was validated when it was first loaded
+        annotation = annotation_class.__new__(annotation_class)
+        for name, kind in meta["fields"].items():
+            if kind == "none":
+                value = None
+            elif kind == "array":
+                value = data[name]
+            elif kind == "str_list":
+                value = data[name].tolist()
+            else:
+                flat = data[name].tolist()
+                offsets = np.cumsum(np.concatenate([[0], data[name + ".lengths"]]))
+                value = [flat[s:e] for s, e in zip(offsets[:-1], offsets[1:])]
+            setattr(annotation, name, value)
+    return annotation
+
+
+class AnnotationCache(object):
+    """Persistent cache of parsed annotations
+
+    Entries are stored in ``cache_dir/annotations/<dataset>/<loader>/<checksum>.npz``.
+    Writes are atomic, so the cache can be shared by concurrent processes.
+
+    Attributes:
+        cache_dir (str): root folder of the cache
+
+    """
+
+    def __init__(self, cache_dir=None):
+        """AnnotationCache init method
+
+        Args:
+            cache_dir (str or None): root folder of the cache.
+                If None, uses `DEFAULT_CACHE_DIR`
+
+        """
+        self.cache_dir = DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+
+    def __repr__(self):
+        return "AnnotationCache({})".format(self.cache_dir)
+
+    def path(self, dataset_name, loader_name, checksum):
+        """Get the path of a cache entry
+
+        Args:
+            dataset_name (str): the identifier of the dataset
+            loader_name (str): the identifier of the loader, e.g. "Track.beats"
+            checksum (str): checksum of the source data
+
+        Returns:
+            str: path to the cache entry
+
+        """
+        return os.path.join(
+            self.cache_dir,
+            "annotations",
+            dataset_name,
+            loader_name,
+            "{}.npz".format(checksum),
+        )
+
+    def get(self, dataset_name, loader_name, checksum):
+        """Get an annotation from the cache
+
+        Args:
+            dataset_name (str): the identifier of the dataset
+            loader_name (str): the identifier of the loader
+            checksum (str): checksum of the source data
+
+        Returns:
+            annotations.Annotation or None: the cached annotation, or None if
+                it is not in the cache
+
+        """
+        path = self.path(dataset_name, loader_name, checksum)
+        if not os.path.exists(path):
+            return None
+        try:
+            return annotation_from_file(path)
+        except Exception as exc:
+            logging.warning("Ignoring unreadable cache entry {}: {}".format(path, exc))
+            return None
+
+    def put(self, dataset_name, loader_name, checksum, annotation):
+        """Store an annotation in the cache
+
+        Args:
+            dataset_name (str): the identifier of the dataset
+            loader_name (str): the identifier of the loader
+            checksum (str): checksum of the source data
+            annotation (annotations.Annotation): the annotation to store
+
+        Returns:
+            bool: True if the annotation was stored
+
+        """
+        data = annotation_to_bytes(annotation)
+        if data is None:
+            return False
+        try:
+            atomic_write(self.path(dataset_name, loader_name, checksum), data)
+        except OSError as exc:
+            logging.warning("Could not write to the annotation cache: {}".format(exc))
+            return False
+        return True
+
+    def load_property(self, track, func):
+        """Compute a track property, going through the cache
+
+        Only properties returning an ``annotations.Annotation`` are cached.
+        The cache key is the track's dataset, the property and the index
+        checksum of the file the property is parsed from (see
+        `property_checksum`).
+
+        Args:
+            track (core.Track): a track object
+            func (function): the function computing the property from the track
+
+        Returns:
+            Any: the property's value
+
+        """
+        checksum = property_checksum(track, func)
+        if checksum is None:
+            return func(track)
+
+        dataset_name = track._dataset_name
+        loader_name = "{}.{}".format(type(track).__name__, func.__name__)
+        value = self.get(dataset_name, loader_name, checksum)
+        if value is None:
+            value = func(track)
+            if isinstance(value, annotations.Annotation):
+                self.put(dataset_name, loader_name, checksum, value)
+        return value
+
+    def clear(self, dataset_name=None):
+        """Delete cached annotations
+
+        Args:
+            dataset_name (str or None): only delete this dataset's annotations.
+                If None, delete all cached annotations.
+
+        """
+        path = os.path.join(self.cache_dir, "annotations")
+        if dataset_name is not None:
+            path = os.path.join(path, dataset_name)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+
+
+class AudioCache(object):
+    """Persistent cache of decoded audio, with a size budget
+
+    Decoded audio is stored in ``cache_dir/audio`` as ``.npy`` files, and
+    bookkeeping (sizes, access times, checksums of source files) is kept in
+    an sqlite database next to them. The cache can be shared by concurrent
+    processes: entries are written atomically and evictions are serialized
+    by the database.
+
+    Audio read from the cache is a copy-on-write memory-mapped array: it can
+    be modified in place, without changing the cache entry.
+
+    Attributes:
+        cache_dir (str): root folder of the cache
+        max_bytes (int): size budget of the cache, in bytes
+
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_AUDIO_CACHE_SIZE):
+        """AudioCache init method
+
+        Args:
+            cache_dir (str or None): root folder of the cache.
+                If None, uses `DEFAULT_CACHE_DIR`
+            max_bytes (int): size budget of the cache, in bytes. When it is
+                exceeded, the least recently used entries are deleted.
+
+        """
+        self.cache_dir = DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+        self.max_bytes = max_bytes
+
+    def __repr__(self):
+        return "AudioCache({}, max_bytes={})".format(self.cache_dir, self.max_bytes)
+
+    @property
+    def _audio_dir(self):
+        return os.path.join(self.cache_dir, "audio")
+
+    def _connect(self):
+        if not os.path.exists(self._audio_dir):
+            os.makedirs(self._audio_dir, exist_ok=True)
+        connection = sqlite3.connect(
+            os.path.join(self._audio_dir, "cache.db"), timeout=60, isolation_level=None
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, sample_rate NUMERIC, size INTEGER, last_access REAL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS checksums "
+            "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, md5 TEXT)"
+        )
+        return connection
+
+    def file_checksum(self, file_path):
+        """Get the md5 checksum of a file
+
+        Used for audio files which are not in a dataset index. Checksums are
+        stored in the cache and only recomputed when the file's size or
+        modification time change.
+
+        Args:
+            file_path (str): path to a file
+
+        Returns:
+            str: md5 hash of the file
+
+        """
+        file_path = os.path.realpath(file_path)
+        stat = os.stat(file_path)
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT size, mtime_ns, md5 FROM checksums WHERE path = ?",
+                (file_path,),
+            ).fetchone()
+            if row is not None and row[:2] == (stat.st_size, stat.st_mtime_ns):
+                return row[2]
+            checksum = validate.md5(file_path)
+            connection.execute(
+                "INSERT OR REPLACE INTO checksums VALUES (?, ?, ?, ?)",
+                (file_path, stat.st_size, stat.st_mtime_ns, checksum),
+            )
+            return checksum
+        finally:
+            connection.close()
+
+    @staticmethod
+    def key(checksum, sr, mono, dtype, res_type=None):
+        """Get the key of a cache entry
+
+        Args:
+            checksum (str): md5 checksum of the audio file
+            sr (float or None): sample rate, or None for the native sample rate
+            mono (bool): if the audio is downmixed to mono
+            dtype (numpy.dtype): data type of the audio samples
+            res_type (str or None): librosa resampler, or None for the default one
+
+        Returns:
+            str: the entry's key
+
+        """
+        if sr is None:
+            rate = "native"
+        elif res_type is None:
+            rate = "{:g}".format(sr)
+        else:
+            rate = "{:g}-{}".format(sr, res_type)
+        return "{}_{}_{}_{}".format(
+            checksum, rate, "mono" if mono else "multi", np.dtype(dtype).name
+        )
+
+    def path(self, key):
+        """Get the path of a cache entry
+
+        Args:
+            key (str): the entry's key, see `AudioCache.key`
+
+        Returns:
+            str: path to the cache entry
+
+        """
+        return os.path.join(self._audio_dir, key[:2], "{}.npy".format(key))
+
+    def get(self, key):
+        """Get decoded audio from the cache
+
+        Args:
+            key (str): the entry's key, see `AudioCache.key`
+
+        Returns:
+            tuple or None: (audio, sample rate), or None if the audio is not
+                in the cache
+
+        """
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                "SELECT sample_rate FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            try:
+                audio = np.load(self.path(key), mmap_mode="c", allow_pickle=False)
+            except (OSError, ValueError) as exc:
+                logging.warning(
+                    "Ignoring unreadable cache entry {}: {}".format(self.path(key), exc)
+                )
+                connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            connection.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            return audio, row[0]
+        finally:
+            connection.close()
+
+    def put(self, key, audio, sr):
+        """Store decoded audio in the cache, evicting old entries if needed
+
+        Args:
+            key (str): the entry's key, see `AudioCache.key`
+            audio (np.ndarray): the audio signal
+            sr (float): the sample rate of the audio signal
+
+        Returns:
+            bool: True if the audio was stored
+
+        """
+        path = self.path(key)
+        buffer = io.BytesIO()
+        np.save(buffer, audio, allow_pickle=False)
+        size = buffer.tell()
+        if size > self.max_bytes:
+            return False
+
+        try:
+            atomic_write(path, buffer.getbuffer())
+            connection = self._connect()
+        except OSError as exc:
+            logging.warning("Could not write to the audio cache: {}".format(exc))
+            return False
+        try:
+            # serialize the bookkeeping between processes
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, sr, size, time.time()),
+            )
+            self._evict(connection, self.max_bytes)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        finally:
+            connection.close()
+        return True
+
+    def _evict(self, connection, max_bytes):
+        total = connection.execute("SELECT SUM(size) FROM entries").fetchone()[0] or 0
+        if total <= max_bytes:
+            return
+        rows = connection.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ).fetchall()
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(self.path(key))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # e.g. the file is in use on Windows, try again later
+                continue
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+
+    def load(self, file_path, sr, mono, dtype, decode, res_type=None, checksum=None):
+        """Load decoded audio, going through the cache
+
+        Args:
+            file_path (str): path to the audio file
+            sr (float or None): sample rate, or None for the native sample rate
+            mono (bool): if the audio is downmixed to mono
+            dtype (numpy.dtype): data type of the audio samples
+            decode (function): function taking no arguments which decodes the
+                audio file and returns (audio, sample rate)
+            res_type (str or None): librosa resampler, or None for the default one
+            checksum (str or None): checksum of the audio file in the dataset's
+                index. If None, the file is hashed (see `file_checksum`)
+
+        Returns:
+            * np.ndarray - the audio signal
+            * float - the sample rate of the audio signal
+
+        """
+        try:
+            if checksum is None:
+                checksum = self.file_checksum(file_path)
+        except OSError:
+            return decode()
+        key = self.key(checksum, sr, mono, dtype, res_type)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        audio, sample_rate = decode()
+        self.put(key, audio, sample_rate)
+        return audio, sample_rate
+
+    def clear(self):
+        """Delete all cached audio"""
+        if os.path.exists(self._audio_dir):
+            shutil.rmtree(self._audio_dir)
@@ -1,17 +1,29 @@
-"""Core mirdata classes
-"""
+"""Core mirdata classes"""
+
+import collections
+from collections.abc import Mapping
+from concurrent import futures
+import functools
 import json
+import logging
 import os
 import random
+import shutil
+import threading
 import types
 from typing import Any
 
 import numpy as np
 
+from mirdata import batching
 from mirdata import download_utils
+from mirdata import index_utils
+from mirdata import io
 from mirdata import validate
 
 MAX_STR_LEN = 100
+DEFAULT_TRACK_CACHE_SIZE = None
+MIX_CHUNK_SIZE = 65536  # samples
 DOCS_URL = "https://mirdata.readthedocs.io/en/stable/source/mirdata.html"
 DISCLAIMER = """
 ******************************************************************************************
@@ -31,6 +43,8 @@ class cached_property(object):
     A property that is only computed once per instance and then replaces
     itself with an ordinary attribute. Deleting the attribute resets the
     property.
+    If the instance has an ``_annotation_cache`` (see `mirdata.cache`), the
+    value is read from/written to this on-disk cache.
     Source: https://github.com/bottlepy/bottle/commit/fa7733e075da0d790d809aa3d2f53071897e6f76
 
     """
@@ -42,7 +56,12 @@ class cached_property(object):
     def __get__(self, obj: Any, cls: type) -> Any:
         if obj is None:
             return self
-        value = obj.__dict__[self.func.__name__] = self.func(obj)
+        annotation_cache = obj.__dict__.get("_annotation_cache")
+        if annotation_cache is not None:
+            value = annotation_cache.load_property(obj, self.func)
+        else:
+            value = self.func(obj)
+        obj.__dict__[self.func.__name__] = value
         return value
 
 
@@ -91,6 +110,15 @@ class Dataset(object):
         remotes (dict or None): data to be downloaded
         readme (str): information about the dataset
         track (function): a function mapping a track_id to a mirdata.core.Track
+        annotation_cache (mirdata.cache.AnnotationCache or None): on-disk cache
+            of parsed annotations used by the dataset's tracks
+        audio_cache (mirdata.cache.AudioCache or None): on-disk cache of
+            decoded audio used by the dataset's tracks
+        sample_rate (float or None): if not None, all audio is loaded at this
+            sample rate
+        mono (bool or None): if True, all audio is loaded as mono. If False, all
+            audio has shape (n_channels, n_samples)
+        resample_quality (str or None): resampler quality, see mirdata.io.RESAMPLE_QUALITY
 
     """
 
@@ -127,6 +155,11 @@ class Dataset(object):
         self._download_info = download_info
         self._license_info = license_info
         self.readme = "{}#module-mirdata.datasets.{}".format(DOCS_URL, self.name)
+        self.annotation_cache = None
+        self.audio_cache = None
+        self.sample_rate = None
+        self.mono = None
+        self.resample_quality = None
 
         # this is a hack to be able to have dataset-specific docstrings
         self.track = lambda track_id: self._track(track_id)
@@ -150,6 +183,31 @@ class Dataset(object):
     def _metadata(self):
         return None
 
+    @property
+    def _audio_options(self):
+        """dict: options passed to io.audio_options when tracks load audio"""
+        options = {
+            "audio_cache": self.audio_cache,
+            "sample_rate": self.sample_rate,
+            "mono": self.mono,
+            "resample_quality": self.resample_quality,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+    def _load_audio(self, loader, *args, **kwargs):
+        """Call an audio loader with the dataset's audio options (see io.audio_options)
+
+        Args:
+            loader (function): an audio loader, e.g. the dataset's ``load_audio``
+            *args: positional arguments passed to the loader
+            **kwargs: keyword arguments passed to the loader
+
+        Returns:
+            Any: the loader's output
+
+        """
+        return load_audio_with_options(loader, self._audio_options, *args, **kwargs)
+
     @property
     def default_path(self):
         """Get the default path for the dataset
@@ -176,22 +234,138 @@ class Dataset(object):
         if self._track_class is None:
             raise NotImplementedError
         else:
-            return self._track_class(
+            track = self._track_class(
                 track_id, self.data_home, self.name, self._index, self._metadata
             )
-
-    def load_tracks(self):
+            if self.annotation_cache is not None:
+                track._annotation_cache = self.annotation_cache
+            audio_options = self._audio_options
+            if audio_options:
+                track._audio_options = audio_options
+            return track
+
+    def load_tracks(
+        self,
+        cache_size=DEFAULT_TRACK_CACHE_SIZE,
+        prefetch=None,
+        workers=None,
+        executor="thread",
+    ):
         """Load all tracks in the dataset
 
+        Tracks are created when they are first accessed, so this is cheap
+        even for very large datasets, unless `prefetch` is given.
+
+        Example:
+            .. code-block:: python
+
+                tracks = dataset.load_tracks(prefetch=["beats", "sections"], workers=8)
+                tracks.errors  # {track_id: {property: exception}} of failed loaders
+
+        Args:
+            cache_size (int or None): maximum number of created tracks to keep,
+                the least recently used ones being dropped. If None (default),
+                every accessed track is kept. If 0, tracks are not kept.
+                Ignored if `prefetch` is given, as every track is kept.
+            prefetch (list or None): names of cached properties (e.g. "beats")
+                to load for every track before returning
+            workers (int or None): number of workers used to prefetch.
+                If None, uses the executor's default.
+            executor (str): "thread" or "process", the kind of pool used to prefetch
+
+        Returns:
+            TrackMapping:
+                read-only mapping of {`track_id`: track data}
+
+        Raises:
+            NotImplementedError: If the dataset does not support Tracks
+            ValueError: If `prefetch` contains something other than a cached property
+
+        """
+        if self._track_class is None:
+            raise NotImplementedError
+        if prefetch is None:
+            return TrackMapping(
+                self._track, self._index["tracks"], cache_size=cache_size
+            )
+
+        tracks = TrackMapping(self._track, self._index["tracks"], cache_size=None)
+        tracks.prefetch(prefetch, workers=workers, executor=executor)
+        return tracks
+
+    def iter_batches(
+        self,
+        batch_size,
+        duration,
+        sample_rate,
+        annotations=None,
+        audio_property="audio",
+        track_ids=None,
+        crops_per_track=1,
+        mono=True,
+        shuffle=True,
+        drop_last=False,
+        seed=None,
+        workers=4,
+        queue_size=batching.DEFAULT_QUEUE_SIZE,
+    ):
+        """Iterate over batches of fixed-length audio crops and aligned annotations
+
+        Tracks are loaded by a pool of background threads (see
+        mirdata.batching.BatchIterator), using the dataset's audio cache and
+        resample quality if they are set.
+
+        Example:
+            .. code-block:: python
+
+                with dataset.iter_batches(32, 2.0, 16000, annotations=["beats"]) as batches:
+                    for batch in batches:
+                        train_step(batch["audio"], batch["beats"])
+                    print(batches.stats)
+
+        Args:
+            batch_size (int): number of crops per batch
+            duration (float): duration of each crop (in seconds)
+            sample_rate (float): sample rate of the batches' audio
+            annotations (list or None): names of track properties to crop
+                along with the audio, e.g. ["beats", "chords"]
+            audio_property (str): the track's audio property, e.g. "audio"
+            track_ids (list or None): tracks to load. If None, uses every track.
+            crops_per_track (int): number of random crops taken from each track
+            mono (bool): if True, audio is mixed down to mono
+            shuffle (bool): if True, tracks are loaded in random order
+            drop_last (bool): if True, the last batch is dropped if it is
+                smaller than batch_size
+            seed (int or None): seed for the track order and crop positions
+            workers (int): number of threads loading tracks
+            queue_size (int): maximum number of crops loaded ahead of the consumer
+
         Returns:
-            dict:
-                {`track_id`: track data}
+            batching.BatchIterator: iterator over batches, see its docstring
+                for the contents of a batch
 
         Raises:
             NotImplementedError: If the dataset does not support Tracks
 
         """
-        return {track_id: self.track(track_id) for track_id in self.track_ids}
+        if self._track_class is None:
+            raise NotImplementedError
+        return batching.BatchIterator(
+            self,
+            batch_size,
+            duration,
+            sample_rate,
+            annotations=annotations,
+            audio_property=audio_property,
+            track_ids=track_ids,
+            crops_per_track=crops_per_track,
+            mono=mono,
+            shuffle=shuffle,
+            drop_last=drop_last,
+            seed=seed,
+            workers=workers,
+            queue_size=queue_size,
+        )
 
     def choice_track(self):
         """Choose a random track
@@ -217,9 +391,38 @@ class Dataset(object):
         print(self._license_info)
         print(DISCLAIMER)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+        track_ids=None,
+        file_keys=None,
+        verify=False,
+    ):
         """Download data to `save_dir` and optionally print a message.
 
+        With track_ids and/or file_keys, only the remotes which provide the
+        selected files are downloaded, and only these files are extracted
+        from archives. Files which are already there with the right checksum
+        are skipped (unless force_overwrite).
+
+        Example:
+            .. code-block:: python
+
+                # only the annotations and the mic audio of two tracks
+                dataset.download(
+                    track_ids=["00_BN1-129-Eb_comp", "00_BN1-129-Eb_solo"],
+                    file_keys=["jams", "audio_mic"],
+                )
+
+                # check the extracted files against the index as they are written
+                missing, invalid = dataset.download(verify=True)
+
         Args:
             partial_download (list or None):
                 A list of keys of remotes to partially download.
@@ -228,20 +431,166 @@ class Dataset(object):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
+            track_ids (list or None):
+                If given, only download the files of these tracks (and the
+                dataset's metadata files).
+            file_keys (list or None):
+                If given, only download the track files with these keys,
+                e.g. ["audio"] (and the dataset's metadata files).
+            verify (bool):
+                If True, extracted files are hashed as they are written and
+                checked against the index, so the downloaded files are
+                validated without reading them again. Their checksums are
+                recorded for later validations (see `validate`).
+
+        Returns:
+            None, or if verify is True:
+                * dict - files of the download which are missing locally
+                * dict - files of the download which have an invalid checksum
 
         Raises:
-            ValueError: if invalid keys are passed to partial_download
+            ValueError: if invalid keys are passed to partial_download, or
+                invalid track_ids or file_keys are passed
             IOError: if a downloaded file's checksum is different from expected
 
         """
-        download_utils.downloader(
-            self.data_home,
-            remotes=self.remotes,
-            partial_download=partial_download,
-            info_message=self._download_info,
-            force_overwrite=force_overwrite,
-            cleanup=cleanup,
+        kwargs = {}
+        selected = track_ids is not None or file_keys is not None
+        if selected:
+            partial_download, members = self._select_download(
+                partial_download, track_ids, file_keys, force_overwrite
+            )
+            kwargs["members"] = members
+        if verify:
+            kwargs["checksums"] = {}
+
+        if selected and not partial_download:
+            logging.info("The selected files are already in {}".format(self.data_home))
+        else:
+            download_utils.downloader(
+                self.data_home,
+                remotes=self.remotes,
+                partial_download=partial_download,
+                info_message=self._download_info,
+                force_overwrite=force_overwrite,
+                cleanup=cleanup,
+                max_workers=max_workers,
+                connections=connections,
+                stream=stream,
+                extract_workers=extract_workers,
+                **kwargs,
+            )
+
+        if not verify:
+            return None
+        validate.ValidationStore(self.data_home).record(kwargs["checksums"])
+        if selected:
+            index = self._selection_index(track_ids, file_keys)
+        else:
+            index = self._downloaded_index(partial_download)
+        return validate.validator(index, self.data_home, verbose=True)
+
+    def _selection_index(self, track_ids, file_keys):
+        """Get the index of some tracks or files, and of the dataset's metadata
+
+        Args:
+            track_ids (list or None): see `download`
+            file_keys (list or None): see `download`
+
+        Returns:
+            dict: the selected part of the index
+
+        """
+        selection = validate.subset_index(
+            self._index, track_ids=track_ids, file_keys=file_keys
         )
+        # tracks cannot be loaded without the dataset's metadata
+        if self._index.get("metadata") is not None:
+            selection["metadata"] = self._index["metadata"]
+        return selection
+
+    def _downloaded_index(self, partial_download):
+        """Get the index of the files provided by some remotes
+
+        Args:
+            partial_download (list or None): keys of the remotes, or None for
+                all of them
+
+        Returns:
+            dict: the part of the index provided by the remotes, or the whole
+                index if it cannot be determined (see validate.remote_file_map)
+
+        """
+        if partial_download is None:
+            return self._index
+        remote_entries = [self._remote_files.get(key) for key in partial_download]
+        if any(entries is None for entries in remote_entries):
+            return self._index
+        return validate.subset_index(self._index, remote_entries=remote_entries)
+
+    def _select_download(self, partial_download, track_ids, file_keys, force_overwrite):
+        """Find the remotes and archive members needed for some tracks or files
+
+        Args:
+            partial_download (list or None): keys of the remotes to consider,
+                or None for all of them
+            track_ids (list or None): see `download`
+            file_keys (list or None): see `download`
+            force_overwrite (bool): if False, files which are already there
+                with the right checksum are not selected
+
+        Returns:
+            * list - keys of the remotes to download
+            * set - paths (relative to data_home) of the files to extract
+
+        """
+        selection = self._selection_index(track_ids, file_keys)
+        if force_overwrite:
+            paths = validate.index_paths(selection)
+        else:
+            missing, invalid = validate.validate_index(
+                selection, self.data_home, verbose=False
+            )
+            paths = {
+                os.path.normpath(os.path.relpath(path, self.data_home))
+                for report in [missing, invalid]
+                for files in report.values()
+                for file_paths in files.values()
+                for path in file_paths
+            }
+
+        keys = (
+            list(self.remotes or {}) if partial_download is None else partial_download
+        )
+        selected = []
+        for key in keys:
+            entries = self._remote_files.get(key)
+            if entries is None:
+                # the remote's files are unknown, or the key is invalid and
+                # rejected by the downloader
+                provided = paths
+            else:
+                provided = validate.index_paths(
+                    validate.subset_index(self._index, remote_entries=[entries])
+                )
+            if paths & provided:
+                selected.append(key)
+        return selected, paths
+
+    @cached_property
+    def _remote_files(self):
+        """dict: the index entries provided by each remote, see validate.remote_file_map"""
+        return validate.remote_file_map(self._index, self.remotes)
 
     @cached_property
     def track_ids(self):
@@ -253,23 +602,272 @@ class Dataset(object):
         """
         return list(self._index["tracks"].keys())
 
-    def validate(self, verbose=True):
+    def validate(
+        self,
+        verbose=True,
+        workers=1,
+        chunk_size=validate.DEFAULT_CHUNK_SIZE,
+        executor="thread",
+        full=False,
+        level="md5",
+        track_ids=None,
+        remote_keys=None,
+        cache=True,
+    ):
         """Validate if the stored dataset is a valid version
 
+        Files which passed validation are recorded in a database in data_home,
+        and are not hashed again by later validations unless their size,
+        modification time or inode change. Use ``cache=False`` to leave
+        data_home untouched (e.g. when it is read-only or shared).
+
+        Validation can be limited to some tracks and/or to the files of some
+        remotes, e.g. those of a partial download.
+
+        Example:
+            .. code-block:: python
+
+                # hash 8 files at a time, reading 4 MB at a time
+                missing, invalid = dataset.validate(workers=8, chunk_size=4 * 1024**2)
+
+                # only check that files exist and have the right size
+                missing, invalid = dataset.validate(level="quick")
+
+                # only validate what was downloaded
+                dataset.download(partial_download=["annotations"])
+                missing, invalid = dataset.validate(remote_keys=["annotations"])
+
         Args:
             verbose (bool): If False, don't print output
+            workers (int): number of files hashed at the same time
+            chunk_size (int): number of bytes read at a time when hashing
+            executor (str): "thread" or "process", the kind of pool used when
+                workers > 1
+            full (bool): if True, hash every file, even the unchanged ones
+            level (str): "md5" to compare checksums, or "quick" to only compare
+                the file sizes stored in the index, without reading the files.
+                Files without a size in the index are checked with their md5
+                checksum instead.
+            track_ids (list or None): if given, only validate the files of
+                these tracks
+            remote_keys (list or None): if given, only validate the files
+                which come from these remotes (see `download`)
+            cache (bool): if False, do not read or write the database of
+                validated files in data_home
 
         Returns:
             * list - files in the index but are missing locally
-            * list - files which have an invalid checksum
+            * list - files which have an invalid checksum (or size)
+
+        Raises:
+            ValueError: if track_ids or remote_keys contain invalid keys, or
+                if the files of a remote cannot be determined from the index
 
         """
+        index = self._index
+        if remote_keys is not None:
+            remote_entries = []
+            for key in remote_keys:
+                if key not in self._remote_files:
+                    raise ValueError(
+                        "remote_keys must be a subset of {}, but got {}".format(
+                            list(self._remote_files.keys()), remote_keys
+                        )
+                    )
+                if self._remote_files[key] is None:
+                    raise ValueError(
+                        "The files of remote {} cannot be determined from the "
+                        "index of {}, which has no 'remotes' section".format(
+                            key, self.name
+                        )
+                    )
+                remote_entries.append(self._remote_files[key])
+            index = validate.subset_index(index, track_ids, remote_entries)
+        elif track_ids is not None:
+            index = validate.subset_index(index, track_ids)
+
         missing_files, invalid_checksums = validate.validator(
-            self._index, self.data_home, verbose=verbose
+            index,
+            self.data_home,
+            verbose=verbose,
+            workers=workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            full=full,
+            level=level,
+            cache=cache,
         )
         return missing_files, invalid_checksums
 
 
+class TrackMapping(Mapping):
+    """Read-only mapping of track_id to Track, where tracks are created on access
+
+    By default every created track is kept, like the values of a dict. With a
+    cache_size, only the most recently used tracks are kept, so iterating over
+    a large dataset does not hold every track in memory at once. Evicted
+    tracks, and the properties they loaded, are created again when accessed.
+
+    Attributes:
+        cache_size (int or None): maximum number of tracks kept in the cache.
+            If None, the cache is unbounded.
+        errors (dict): {`track_id`: {property: exception}} of the properties
+            which failed to load during `prefetch`
+
+    """
+
+    def __init__(self, track_factory, track_ids, cache_size=DEFAULT_TRACK_CACHE_SIZE):
+        """TrackMapping init method
+
+        Args:
+            track_factory (function): a function mapping a track_id to a Track
+            track_ids (collection): the valid track ids, typically index["tracks"]
+            cache_size (int or None): maximum number of tracks kept in the
+                cache. If None (default), every created track is kept
+
+        """
+        self._track_factory = track_factory
+        self._track_ids = track_ids
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.errors = {}
+
+    def __getitem__(self, track_id):
+        with self._lock:
+            if track_id in self._cache:
+                self._cache.move_to_end(track_id)
+                return self._cache[track_id]
+
+        if track_id not in self._track_ids:
+            raise KeyError(track_id)
+        track = self._track_factory(track_id)
+
+        if self.cache_size is None or self.cache_size > 0:
+            with self._lock:
+                self._cache[track_id] = track
+                if self.cache_size is not None:
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return track
+
+    def __contains__(self, track_id):
+        return track_id in self._track_ids
+
+    def __iter__(self):
+        return iter(self._track_ids)
+
+    def __len__(self):
+        return len(self._track_ids)
+
+    def __repr__(self):
+        return "TrackMapping({} tracks)".format(len(self))
+
+    def prefetch(self, properties, workers=None, executor="thread"):
+        """Load cached properties of every track in parallel
+
+        Loader errors do not stop the prefetch, they are collected per track
+        in `errors`. The cache must be unbounded (cache_size=None), otherwise
+        prefetched tracks could be evicted.
+
+        Args:
+            properties (list): names of cached properties, e.g. ["beats", "sections"]
+            workers (int or None): number of workers. If None, uses the executor's default.
+            executor (str): "thread" or "process". Processes avoid the GIL for
+                CPU-bound parsers, but tracks and loaded values are pickled.
+
+        Raises:
+            ValueError: if a property is not a cached property, or if
+                executor or cache_size are invalid
+
+        """
+        if self.cache_size is not None:
+            raise ValueError("prefetch requires a TrackMapping with cache_size=None")
+        if executor == "thread":
+            pool_class = futures.ThreadPoolExecutor
+        elif executor == "process":
+            pool_class = futures.ProcessPoolExecutor
+        else:
+            raise ValueError(
+                "executor must be 'thread' or 'process', got {}".format(executor)
+            )
+
+        tracks = list(self.values())
+        for prop in properties:
+            if tracks and not isinstance(
+                getattr(type(tracks[0]), prop, None), cached_property
+            ):
+                raise ValueError("{} is not a cached property".format(prop))
+
+        load = functools.partial(_load_track_properties, properties=properties)
+        chunksize = max(1, len(tracks) // (4 * (workers or os.cpu_count() or 1)))
+        with pool_class(max_workers=workers) as pool:
+            results = pool.map(load, tracks, chunksize=chunksize)
+            for track, (values, errors) in zip(tracks, results):
+                # process workers load into a copy of the track
+                track.__dict__.update(values)
+                if errors:
+                    self.errors[track.track_id] = errors
+
+        if self.errors:
+            logging.warning(
+                "{} of {} tracks failed to load some of {}, see .errors".format(
+                    len(self.errors), len(tracks), properties
+                )
+            )
+
+
+def load_audio_with_options(loader, audio_options, *args, **kwargs):
+    """Call an audio loader with audio options
+
+    The options are set with io.audio_options while the loader runs, and the
+    loader's output is then made to follow the sample rate and channel layout
+    given in the options (see io.conform_audio).
+
+    Args:
+        loader (function): an audio loader returning (audio signal, sample rate)
+        audio_options (dict): options, see io.audio_options
+        *args: positional arguments passed to the loader
+        **kwargs: keyword arguments passed to the loader
+
+    Returns:
+        tuple or None: the loader's output
+
+    """
+    with io.audio_options(**audio_options):
+        audio = loader(*args, **kwargs)
+    if "sample_rate" in audio_options or "mono" in audio_options:
+        audio = io.conform_audio(
+            audio,
+            sample_rate=audio_options.get("sample_rate"),
+            mono=audio_options.get("mono"),
+            resample_quality=audio_options.get("resample_quality"),
+        )
+    return audio
+
+
+def _load_track_properties(track, properties):
+    """Load properties of a track, collecting errors instead of raising them
+
+    Args:
+        track (Track): a track object
+        properties (list): names of the properties to load
+
+    Returns:
+        * dict - {property: value} of the loaded properties
+        * dict - {property: exception} of the properties which failed to load
+
+    """
+    values = {}
+    errors = {}
+    for prop in properties:
+        try:
+            values[prop] = getattr(track, prop)
+        except Exception as exc:
+            errors[prop] = exc
+    return values, errors
+
+
 class Track(object):
     """Track base class
 
@@ -297,7 +895,7 @@ class Track(object):
             track_id (str): track id
             data_home (str): path where mirdata will look for the dataset
             dataset_name (str): the identifier of the dataset
-            index (dict): the dataset's file index
+            index (dict or index_utils.CompiledIndex): the dataset's file index
                 Typically accessed via the .index attribute of a LargeData object
             metadata (dict or None): a dictionary of metadata or None
 
@@ -352,10 +950,151 @@ class Track(object):
         repr_str += ")"
         return repr_str
 
+    def _load_audio(self, loader, *args, **kwargs):
+        """Call an audio loader with the dataset's audio options (see io.audio_options)
+
+        Args:
+            loader (function): an audio loader, e.g. the dataset's ``load_audio``
+            *args: positional arguments passed to the loader
+            **kwargs: keyword arguments passed to the loader
+
+        Returns:
+            Any: the loader's output
+
+        """
+        audio_options = self.__dict__.get("_audio_options", {})
+        if audio_options.get("audio_cache") is not None:
+            # the audio cache is keyed by the checksums in the index
+            audio_options = dict(audio_options, file_checksums=self._file_checksums)
+        return load_audio_with_options(loader, audio_options, *args, **kwargs)
+
+    @property
+    def _file_checksums(self):
+        """dict: {absolute path: checksum} of the track's files in the index"""
+        track_paths = getattr(self, "_track_paths", None) or {}
+        return {
+            os.path.abspath(os.path.join(self._data_home, value[0])): value[1]
+            for value in track_paths.values()
+            if value[0] is not None
+        }
+
+    def _stream_audio(self, streamer, *args, **kwargs):
+        """Call an audio streamer with the dataset's audio options (see io.audio_options)
+
+        Args:
+            streamer (function): an audio streamer, e.g. the dataset's ``stream_audio``
+            *args: positional arguments passed to the streamer
+            **kwargs: keyword arguments passed to the streamer
+
+        Returns:
+            io.AudioStream or None: the streamer's output
+
+        """
+        with io.audio_options(**self.__dict__.get("_audio_options", {})):
+            return streamer(*args, **kwargs)
+
+    def get_audio(self, offset=0.0, duration=None, audio_property="audio"):
+        """Load a segment of the track's audio
+
+        For formats that allow it (e.g. wav, flac), only the segment is read
+        from disk, so loading a short crop of a long track is cheap.
+
+        Args:
+            offset (float): start time of the segment (in seconds)
+            duration (float or None): duration of the segment (in seconds).
+                If None, the segment lasts until the end of the track
+            audio_property (str): the track's audio property to read from,
+                e.g. "audio", or "audio_mono" for orchset
+
+        Returns:
+            * np.ndarray - the audio signal
+            * float - the sample rate
+
+        """
+        with io.audio_options(offset=offset, duration=duration):
+            return getattr(self, audio_property)
+
     def to_jams(self):
         raise NotImplementedError
 
 
+def _allocate_target(out, n_channels, n_samples, dtype):
+    """Allocate a zero-filled mixing target
+
+    Args:
+        out (np.ndarray, str or None): see MultiTrack.get_target
+        n_channels (int): number of channels
+        n_samples (int): number of samples, ignored if `out` is an array
+        dtype (np.dtype): data type of a new target
+
+    Returns:
+        np.ndarray: the target
+
+    """
+    if out is None:
+        return np.zeros((n_channels, n_samples), dtype=dtype)
+    if isinstance(out, str):
+        return np.lib.format.open_memmap(
+            out, mode="w+", dtype=dtype, shape=(n_channels, n_samples)
+        )
+    if out.ndim != 2 or out.shape[0] != n_channels:
+        raise ValueError(
+            "out must have shape ({}, n_samples), got {}".format(n_channels, out.shape)
+        )
+    out[...] = 0
+    return out
+
+
+def _grow_target(target, n_samples):
+    """Zero-pad a mixing target to a longer length
+
+    Args:
+        target (np.ndarray): the target, possibly memory-mapped to a .npy file
+        n_samples (int): the new number of samples
+
+    Returns:
+        np.ndarray: the padded target
+
+    """
+    shape = (target.shape[0], n_samples)
+    if not isinstance(target, np.memmap):
+        grown = np.zeros(shape, dtype=target.dtype)
+        grown[:, : target.shape[1]] = target
+        return grown
+
+    path = target.filename
+    tmp_path = "{}.tmp.npy".format(path)
+    grown = np.lib.format.open_memmap(
+        tmp_path, mode="w+", dtype=target.dtype, shape=shape
+    )
+    for start in range(0, target.shape[1], MIX_CHUNK_SIZE):
+        end = min(start + MIX_CHUNK_SIZE, target.shape[1])
+        grown[:, start:end] = target[:, start:end]
+    grown.flush()
+    del grown, target
+    os.replace(tmp_path, path)
+    return np.lib.format.open_memmap(path, mode="r+")
+
+
+def _accumulate(target, audio, weight, buffer):
+    """Add a weighted signal to a mixing target, one chunk at a time
+
+    Args:
+        target (np.ndarray): the target, shape (n_channels, n_samples)
+        audio (np.ndarray): the signal, shape (n_channels, n_samples), at most
+            as long as the target
+        weight (float): the signal's weight
+        buffer (np.ndarray): scratch array of shape (n_channels, chunk_size)
+
+    """
+    chunk_size = buffer.shape[1]
+    for start in range(0, audio.shape[1], chunk_size):
+        end = min(start + chunk_size, audio.shape[1])
+        chunk = buffer[:, : end - start]
+        np.multiply(audio[:, start:end], weight, out=chunk, casting="unsafe")
+        target[:, start:end] += chunk
+
+
 class MultiTrack(Track):
     """MultiTrack class.
 
@@ -372,9 +1111,237 @@ class MultiTrack(Track):
                 "This MultiTrack has no tracks/track_audio_property. Cannot perform mixing"
             )
 
-    def get_target(self, track_keys, weights=None, average=True, enforce_length=True):
+    def _iter_stems(self, track_keys, workers=1, cache=False):
+        """Load the audio of tracks, in order, decoding up to `workers` at a time
+
+        At most `workers` decoded tracks are held besides the cached ones.
+
+        Args:
+            track_keys (list): list of track keys
+            workers (int): number of threads decoding tracks concurrently
+            cache (bool): if True, decoded tracks are kept in the stem cache
+
+        Yields:
+            tuple: (audio signal, sample rate) of each track
+
+        """
+        stem_cache = self.__dict__.setdefault("_stem_cache", {})
+
+        def load(key):
+            if key in stem_cache:
+                return stem_cache[key]
+            stem = getattr(self.tracks[key], self.track_audio_property)
+            if cache:
+                stem_cache[key] = stem
+            return stem
+
+        if workers <= 1 or len(track_keys) <= 1:
+            for key in track_keys:
+                yield load(key)
+            return
+
+        keys = iter(track_keys)
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = collections.deque(
+                pool.submit(load, key) for _, key in zip(range(workers), keys)
+            )
+            try:
+                while pending:
+                    stem = pending.popleft().result()
+                    for key in keys:
+                        pending.append(pool.submit(load, key))
+                        break
+                    yield stem
+                    del stem
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def clear_stem_cache(self):
+        """Delete the decoded tracks kept by get_target(cache=True) and get_random_target"""
+        self.__dict__.pop("_stem_cache", None)
+        self.__dict__.pop("_stem_block", None)
+
+    def _get_stem_block(self, enforce_length=True, workers=1):
+        """Get the audio of all tracks as one contiguous array, decoding them if needed
+
+        The block is kept with the stem cache, and the cached tracks are
+        replaced by views of the block, so the audio is only held once. The
+        lengths of the tracks are kept with it, so a cached block zero-padded
+        for enforce_length=False is still checked when enforce_length=True.
+
+        Args:
+            enforce_length (bool): If True, raises ValueError if the tracks are
+                not the same length. If False, pads audio with zeros.
+            workers (int): number of threads decoding tracks concurrently
+
+        Returns:
+            * list - track keys, in the order of the block
+            * np.ndarray - audio with shape (n_keys, n_channels, n_samples)
+            * float - sample rate
+
+        Raises:
+            ValueError: if the tracks do not have the same sample rate or number
+                of channels, or if enforce_length=True and lengths are not equal
+
+        """
+        keys = list(self.tracks.keys())
+        stem_block = self.__dict__.get("_stem_block")
+        if stem_block is not None and stem_block[0] == keys:
+            _, block, sample_rate, lengths = stem_block
+            self._check_stem_lengths(keys, lengths, enforce_length)
+            return keys, block, sample_rate
+
+        stems = []
+        for audio, sample_rate in self._iter_stems(keys, workers=workers, cache=True):
+            if len(audio.shape) == 1:
+                audio = audio[np.newaxis, :]
+            stems.append((audio, sample_rate))
+
+        sample_rates = [sample_rate for _, sample_rate in stems]
+        lengths = [audio.shape[1] for audio, _ in stems]
+        if len(set(sample_rates)) > 1:
+            raise ValueError(
+                "Sample rates for tracks {} are not equal: {}".format(
+                    keys, sample_rates
+                )
+            )
+        if len(set(audio.shape[0] for audio, _ in stems)) > 1:
+            raise ValueError(
+                "Tracks {} do not have the same number of channels".format(keys)
+            )
+        self._check_stem_lengths(keys, lengths, enforce_length)
+
+        dtype = np.result_type(*[audio.dtype for audio, _ in stems], np.float32)
+        block = np.zeros((len(stems), stems[0][0].shape[0], max(lengths)), dtype=dtype)
+        for i, (audio, _) in enumerate(stems):
+            block[i, :, : audio.shape[1]] = audio
+        del stems
+        self._stem_cache.update(
+            (key, (block[i, :, : lengths[i]], sample_rates[0]))
+            for i, key in enumerate(keys)
+        )
+
+        self._stem_block = (keys, block, sample_rates[0], lengths)
+        return keys, block, sample_rates[0]
+
+    @staticmethod
+    def _check_stem_lengths(keys, lengths, enforce_length):
+        """Raise ValueError if enforce_length is True and lengths are not equal"""
+        if enforce_length and len(set(lengths)) > 1:
+            raise ValueError(
+                "Track's {} audio are not the same length {}. Use enforce_length=False to pad with zeros.".format(
+                    keys, lengths
+                )
+            )
+
+    def get_random_targets(
+        self,
+        batch_size,
+        duration=None,
+        n_tracks=None,
+        min_weight=0.3,
+        max_weight=1.0,
+        average=True,
+        enforce_length=True,
+        workers=1,
+    ):
+        """Get a batch of random targets, each mixing a random selection of tracks
+        with random weights over a random crop
+
+        Tracks are decoded once and cached (see clear_stem_cache), and every
+        mixture of the batch is computed by a single matrix multiplication over
+        the crops of all tracks.
+
+        Args:
+            batch_size (int): number of mixtures
+            duration (float or None): duration of each crop (in seconds).
+                If None, mixtures span the full tracks.
+            n_tracks (int or None): number of tracks to randomly mix in each
+                mixture. If None, uses all tracks
+            min_weight (float): minimum possible weight when mixing
+            max_weight (float): maximum possible weight when mixing
+            average (bool): if True, mixtures are weighted averages of the tracks
+                if False, mixtures are weighted sums of the tracks
+            enforce_length (bool): If True, raises ValueError if the tracks are
+                not the same length. If False, pads audio with zeros to match the
+                length of the longest track
+            workers (int): number of threads decoding tracks concurrently
+
+        Returns:
+            * np.ndarray - mixtures with shape (batch_size, n_channels, n_samples)
+            * np.ndarray - weighted tracks, which sum to the mixtures, with shape
+              (batch_size, n_keys, n_channels, n_samples)
+            * np.ndarray - keys of all the tracks, with shape (n_keys,)
+            * np.ndarray - weights used to mix tracks, with shape
+              (batch_size, n_keys). Tracks left out of a mixture have weight 0.
+            * np.ndarray - start time of each crop (in seconds), with shape (batch_size,)
+
+        Raises:
+            ValueError:
+                if the tracks are shorter than `duration`
+                if sample rates or numbers of channels of the tracks are not equal
+                if enforce_length=True and lengths are not equal
+
+        """
+        self._check_mixable()
+        keys, block, sample_rate = self._get_stem_block(
+            enforce_length=enforce_length, workers=workers
+        )
+        n_stems, n_channels, length = block.shape
+        n_samples = length if duration is None else int(round(duration * sample_rate))
+        if n_samples > length:
+            raise ValueError(
+                "Tracks are shorter than the duration {}: {} samples".format(
+                    duration, length
+                )
+            )
+
+        # random subsets of tracks, as a mask of shape (batch_size, n_stems)
+        included = np.ones((batch_size, n_stems), dtype=bool)
+        if n_tracks is not None and n_tracks < n_stems:
+            ranks = np.argsort(np.random.random((batch_size, n_stems)), axis=1)
+            included = ranks < n_tracks
+        weights = np.random.uniform(
+            low=min_weight, high=max_weight, size=(batch_size, n_stems)
+        )
+        weights *= included
+        mix_weights = weights
+        if average:
+            mix_weights = weights / np.sum(weights, axis=1, keepdims=True)
+        mix_weights = mix_weights.astype(block.dtype)
+
+        starts = np.random.randint(0, length - n_samples + 1, size=batch_size)
+        targets = np.empty((batch_size, n_stems, n_channels, n_samples), block.dtype)
+        for i, start in enumerate(starts):
+            targets[i] = block[:, :, start : start + n_samples]
+
+        # (batch, 1, stems) @ (batch, stems, channels * samples)
+        crops = targets.reshape(batch_size, n_stems, n_channels * n_samples)
+        mixes = np.matmul(mix_weights[:, np.newaxis, :], crops)
+        mixes = mixes.reshape(batch_size, n_channels, n_samples)
+        targets *= mix_weights[:, :, np.newaxis, np.newaxis]
+
+        return mixes, targets, np.array(keys), weights, starts / float(sample_rate)
+
+    def get_target(
+        self,
+        track_keys,
+        weights=None,
+        average=True,
+        enforce_length=True,
+        out=None,
+        chunk_size=MIX_CHUNK_SIZE,
+        workers=1,
+        cache=False,
+    ):
         """Get target which is a linear mixture of tracks
 
+        Tracks are loaded one at a time and accumulated chunk by chunk into a
+        single output array, so peak memory is about one track plus the output.
+        With several workers, tracks are decoded concurrently and peak memory
+        is about `workers` tracks plus the output.
+
         Args:
             track_keys (list): list of track keys to mix together
             weights (list or None): list of positive scalars to be used in the average
@@ -383,6 +1350,18 @@ class MultiTrack(Track):
             enforce_length (bool): If True, raises ValueError if the tracks are
                 not the same length. If False, pads audio with zeros to match the length
                 of the longest track
+            out (np.ndarray, str or None): where to write the target.
+                If None, a new array is allocated. If a path, the target is written
+                to a .npy file and returned memory-mapped, and the file is deleted
+                if mixing fails. If an array of shape (n_channels, n_samples), the
+                target is written into it, and tracks shorter than n_samples are
+                padded with zeros (the tracks' lengths are still compared with each
+                other if enforce_length=True).
+            chunk_size (int): number of samples mixed at a time
+            workers (int): number of threads decoding tracks concurrently
+            cache (bool): if True, decoded tracks are kept in memory and reused
+                by later calls, until clear_stem_cache is called. Tracks which
+                are already cached are never decoded again.
 
         Returns:
             np.ndarray: target audio with shape (n_channels, n_samples)
@@ -391,59 +1370,102 @@ class MultiTrack(Track):
             ValueError:
                 if sample rates of the tracks are not equal
                 if enforce_length=True and lengths are not equal
+                if the number of channels of the tracks or of `out` are not equal
 
         """
         self._check_mixable()
-        signals = []
-        lengths = []
-        sample_rates = []
-        for k in track_keys:
-            audio, sample_rate = getattr(self.tracks[k], self.track_audio_property)
-            # ensure all signals are shape (n_channels, n_samples)
-            if len(audio.shape) == 1:
-                audio = audio[np.newaxis, :]
-            signals.append(audio)
-            lengths.append(audio.shape[1])
-            sample_rates.append(sample_rate)
-
-        if len(set(sample_rates)) > 1:
+        if len(track_keys) == 0:
+            raise ValueError("No tracks to mix")
+        if weights is None:
+            weights = np.ones((len(track_keys),))
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (len(track_keys),):
             raise ValueError(
-                "Sample rates for tracks {} are not equal: {}".format(
-                    track_keys, sample_rates
-                )
+                "Expected {} weights, got {}".format(len(track_keys), weights.shape)
             )
+        if average:
+            weights = weights / np.sum(weights)
 
-        max_length = np.max(lengths)
-        if any([l != max_length for l in lengths]):
-            if enforce_length:
-                raise ValueError(
-                    "Track's {} audio are not the same length {}. Use enforce_length=False to pad with zeros.".format(
-                        track_keys, lengths
+        target = None
+        lengths = []
+        sample_rates = []
+        stems = self._iter_stems(track_keys, workers=workers, cache=cache)
+        try:
+            for key, weight, (audio, sample_rate) in zip(track_keys, weights, stems):
+                # ensure all signals are shape (n_channels, n_samples)
+                if len(audio.shape) == 1:
+                    audio = audio[np.newaxis, :]
+                lengths.append(audio.shape[1])
+                sample_rates.append(sample_rate)
+
+                if len(set(sample_rates)) > 1:
+                    raise ValueError(
+                        "Sample rates for tracks {} are not equal: {}".format(
+                            track_keys, sample_rates
+                        )
+                    )
+                if target is None:
+                    dtype = np.result_type(audio.dtype, np.float32)
+                    target = _allocate_target(
+                        out, audio.shape[0], audio.shape[1], dtype
+                    )
+                    buffer = np.empty(
+                        (audio.shape[0], max(1, min(chunk_size, audio.shape[1]))),
+                        dtype=target.dtype,
+                    )
+                elif audio.shape[0] != target.shape[0]:
+                    raise ValueError(
+                        "Tracks {} do not have the same number of channels".format(
+                            track_keys
+                        )
                     )
-                )
-            else:
-                # pad signals to the max length
-                signals = [
-                    np.pad(signal, ((0, 0), (0, max_length - signal.shape[1])))
-                    for signal in signals
-                ]
-
-        if weights is None:
-            weights = np.ones((len(track_keys),))
-
-        target = np.average(signals, axis=0, weights=weights)
-        if not average:
-            target *= np.sum(weights)
 
+                if enforce_length and len(set(lengths)) > 1:
+                    raise ValueError(
+                        "Track's {} audio are not the same length {}. Use enforce_length=False to pad with zeros.".format(
+                            track_keys, lengths
+                        )
+                    )
+                if audio.shape[1] > target.shape[1]:
+                    if isinstance(out, np.ndarray):
+                        raise ValueError(
+                            "Track {} is longer than out: {} > {}".format(
+                                key, audio.shape[1], target.shape[1]
+                            )
+                        )
+                    target = _grow_target(target, audio.shape[1])
+
+                _accumulate(target, audio, weight, buffer)
+                # free this track before loading the next one
+                del audio
+        except BaseException:
+            if isinstance(out, str) and target is not None:
+                # do not leave a partial target on disk
+                del target
+                if os.path.exists(out):
+                    os.remove(out)
+            raise
+        finally:
+            stems.close()
+
+        if isinstance(target, np.memmap):
+            target.flush()
         return target
 
-    def get_random_target(self, n_tracks=None, min_weight=0.3, max_weight=1.0):
+    def get_random_target(
+        self, n_tracks=None, min_weight=0.3, max_weight=1.0, workers=1, cache=True
+    ):
         """Get a random target by combining a random selection of tracks with random weights
 
+        By default decoded tracks are cached, so that repeated calls only draw
+        new weights (see clear_stem_cache).
+
         Args:
             n_tracks (int or None): number of tracks to randomly mix. If None, uses all tracks
             min_weight (float): minimum possible weight when mixing
             max_weight (float): maximum possible weight when mixing
+            workers (int): number of threads decoding tracks concurrently
+            cache (bool): if True, decoded tracks are kept in memory and reused
 
         Returns:
             * np.ndarray - mixture audio with shape (n_samples, n_channels)
@@ -457,21 +1479,21 @@ class MultiTrack(Track):
             tracks = np.random.choice(tracks, n_tracks, replace=False)
 
         weights = np.random.uniform(low=min_weight, high=max_weight, size=len(tracks))
-        target = self.get_target(tracks, weights=weights)
+        target = self.get_target(tracks, weights=weights, workers=workers, cache=cache)
         return target, tracks, weights
 
-    def get_mix(self):
+    def get_mix(self, workers=1):
         """Create a linear mixture given a subset of tracks.
 
         Args:
-            track_keys (list): list of track keys to mix together
+            workers (int): number of threads decoding tracks concurrently
 
         Returns:
             np.ndarray: mixture audio with shape (n_samples, n_channels)
 
         """
         self._check_mixable()
-        return self.get_target(list(self.tracks.keys()))
+        return self.get_target(list(self.tracks.keys()), workers=workers)
 
 
 def load_json_index(filename):
@@ -503,10 +1525,11 @@ class LargeData(object):
 
         Args:
             index_file: str
-                File name of checksum index file to be passed to `load_json_index`
+                File name of the json checksum index file in `datasets/indexes`
 
         Cached Properties:
-            index (dict): dataset index
+            index (index_utils.CompiledIndex): dataset index, memory-mapped
+                from its compiled version (see `mirdata.index_utils`)
 
         """
         self._metadata = None
@@ -515,12 +1538,25 @@ class LargeData(object):
 
     @cached_property
     def index(self):
+        working_dir = os.path.dirname(os.path.realpath(__file__))
+        path_index_file = os.path.join(working_dir, "datasets/indexes", self.index_file)
         if self.remote_index is not None:
-            working_dir = os.path.dirname(os.path.realpath(__file__))
-            path_index_file = os.path.join(
-                working_dir, "datasets/indexes", self.index_file
-            )
             if not os.path.isfile(path_index_file):
                 path_indexes = os.path.join(working_dir, "datasets/indexes")
-                download_utils.downloader(path_indexes, remotes=self.remote_index)
-        return load_json_index(self.index_file)
+                path_macosx = os.path.join(path_indexes, "__MACOSX")
+                had_macosx = os.path.exists(path_macosx)
+                download_utils.downloader(
+                    path_indexes, remotes=self.remote_index, cleanup=True
+                )
+                # resource forks of archives made on macOS are not indexes
+                if not had_macosx and os.path.exists(path_macosx):
+                    shutil.rmtree(path_macosx)
+                # the index is only downloaded when it is missing, so the
+                # stamps of verified downloads are not needed
+                for remote in self.remote_index.values():
+                    download_utils.remove_stamp(
+                        os.path.join(
+                            path_indexes, remote.destination_dir or "", remote.filename
+                        )
+                    )
+        return index_utils.load_index(path_index_file)
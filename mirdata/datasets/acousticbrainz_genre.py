@@ -396,7 +396,16 @@ class Dataset(core.Dataset):
     def load_extractor(self, *args, **kwargs):
         return load_extractor(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+    ):
         """Download the dataset
 
         Args:
@@ -408,6 +417,16 @@ class Dataset(core.Dataset):
                 By default False.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -426,9 +445,9 @@ class Dataset(core.Dataset):
         if not os.path.isdir(validate_dir):
             os.mkdir(validate_dir)
 
-        # start to download
+        # check overwrite
+        remotes = {}
         for key, remote in self.remotes.items():
-            # check overwrite
             file_downloaded = False
             if not force_overwrite:
                 fold, first_dir = key.split("-")
@@ -443,15 +462,25 @@ class Dataset(core.Dataset):
                         + " downloaded. Skip download (force_overwrite=False)."
                     )
             if not file_downloaded:
-                #  if this typical error happend it repeat download
-                download_utils.downloader(
-                    self.data_home,
-                    remotes={key: remote},
-                    partial_download=None,
-                    info_message=None,
-                    force_overwrite=True,
-                    cleanup=cleanup,
-                )
+                remotes[key] = remote
+
+        # start to download
+        if remotes:
+            #  if this typical error happend it repeat download
+            download_utils.downloader(
+                self.data_home,
+                remotes=remotes,
+                partial_download=None,
+                info_message=None,
+                force_overwrite=True,
+                cleanup=cleanup,
+                max_workers=max_workers,
+                connections=connections,
+                stream=stream,
+                extract_workers=extract_workers,
+            )
+
+        for key in self.remotes:
             # move from a temporary directory to final one
             source_dir = os.path.join(
                 self.data_home, "temp", train if "train" in key else validate
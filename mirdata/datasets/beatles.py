@@ -13,7 +13,6 @@ import csv
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -136,7 +135,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """the track's data in jams format
@@ -156,18 +185,50 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Beatles audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a Beatles audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): path or file-like object pointing to an audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -302,7 +363,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_beats)
     def load_beats(self, *args, **kwargs):
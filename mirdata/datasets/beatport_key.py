@@ -27,11 +27,11 @@ import csv
 import os
 import fnmatch
 import json
-import librosa
 
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
+from mirdata import io
 
 BIBTEX = """@phdthesis {3897,
     title = {Tonality Estimation in Electronic Dance Music: A Computational and Musically Informed Examination},
@@ -143,7 +143,31 @@ class Track(core.Track):
            * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(self, block_size, hop=None, offset=0.0, duration=None):
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -164,11 +188,14 @@ class Track(core.Track):
         )
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a beatport_key audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -177,7 +204,36 @@ def load_audio(audio_path):
     """
     if not os.path.exists(audio_path):
         raise IOError("audio_path {} does not exist".format(audio_path))
-    return librosa.load(audio_path, sr=None, mono=True)
+    return io.load_audio(
+        audio_path, sr=None, mono=True, offset=offset, duration=duration
+    )
+
+
+def stream_audio(audio_path, block_size, hop=None, offset=0.0, duration=None):
+    """Stream a beatport_key audio file in fixed-size blocks
+
+    Args:
+        audio_path (str): path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        audio_path,
+        block_size,
+        hop,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+    )
 
 
 def load_key(keys_path):
@@ -293,7 +349,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_key)
     def load_key(self, *args, **kwargs):
@@ -311,7 +367,16 @@ class Dataset(core.Dataset):
     def load_artist(self, *args, **kwargs):
         return load_artist(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+    ):
         """Download the dataset
 
         Args:
@@ -322,6 +387,16 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -334,6 +409,10 @@ class Dataset(core.Dataset):
             partial_download=partial_download,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            connections=connections,
+            stream=stream,
+            extract_workers=extract_workers,
         )
 
         self._find_replace(
@@ -50,7 +50,6 @@ import logging
 import xml.etree.ElementTree as ET
 from typing import BinaryIO, cast, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -208,7 +207,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def spectrogram(self) -> Optional[np.ndarray]:
@@ -260,18 +289,52 @@ def load_spectrogram(fhandle: TextIO) -> np.ndarray:
     return spectrogram
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a cante100 audio file.
 
     Args:
         fhandle (str): path to an audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=22050, mono=False)
+    return io.load_audio(
+        fhandle, sr=22050, mono=False, offset=offset, duration=duration
+    )
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a cante100 audio file in fixed-size blocks
+
+    Args:
+        fhandle (str): path to an audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=22050, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -400,7 +463,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_spectrogram)
     def load_spectrogram(self, *args, **kwargs):
@@ -19,9 +19,8 @@ import gzip
 import logging
 import os
 import pickle
-from typing import BinaryIO, Optional, TextIO, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -29,18 +28,23 @@ from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata import lazy
+
 
 # this is the package, needed to load the annotations.
 # DALI-dataset is only installed if the user explicitly declares
 # they want dali when pip installing.
-try:
-    import DALI
-except ImportError as E:
+if not lazy.is_installed("DALI"):
     logging.error(
         "In order to use dali you must have dali-dataset installed. "
         "Please reinstall mirdata using `pip install 'mirdata[dali]'"
     )
-    raise
+    raise ImportError("No module named 'DALI'")
+
+if TYPE_CHECKING:
+    import DALI
+else:
+    DALI = lazy.import_module("DALI")
 
 BIBTEX = """@inproceedings{Meseguer-Brocal_2018,
     Title = {DALI: a large Dataset of synchronized Audio, LyrIcs and notes, automatically created using teacher-student
@@ -164,7 +168,7 @@ class Track(core.Track):
         return load_annotations_granularity(self.annotation_path, "paragraphs")
 
     @core.cached_property
-    def annotation_object(self) -> DALI.Annotations:
+    def annotation_object(self) -> "DALI.Annotations":
         return load_annotations_class(self.annotation_path)
 
     @property
@@ -176,7 +180,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -198,18 +232,50 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Optional[Tuple[np.ndarray, float]]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Optional[Tuple[np.ndarray, float]]:
     """Load a DALI audio file.
 
     Args:
         fhandle (str or file-like): path or file-like object pointing to an audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a DALI audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): path or file-like object pointing to an audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 def load_annotations_granularity(annotations_path, granularity):
@@ -301,7 +367,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_annotations_granularity)
     def load_annotations_granularity(self, *args, **kwargs):
@@ -68,14 +68,15 @@
 import os
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import jams
-import librosa
 import numpy as np
 
 from mirdata import download_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata import lazy
+
+jams = lazy.import_module("jams")
 
 
 BIBTEX = """@inproceedings{knees2015two,
@@ -183,7 +184,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -204,18 +235,50 @@ class Track(core.Track):
         return jams.load(self.annotation_v2_path)
 
 
-def load_audio(fhandle: str) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a giantsteps_tempo audio file.
 
     Args:
         fhandle (str or file-like): path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a giantsteps_tempo audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -274,7 +337,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_genre)
     def load_genre(self, *args, **kwargs):
@@ -50,17 +50,21 @@ import glob
 import logging
 import os
 import shutil
-from typing import BinaryIO, Optional, TextIO, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
-import pretty_midi
 
 from mirdata import annotations
 from mirdata import core
 from mirdata import download_utils
 from mirdata import io
 from mirdata import jams_utils
+from mirdata import lazy
+
+if TYPE_CHECKING:
+    import pretty_midi
+else:
+    pretty_midi = lazy.import_module("pretty_midi")
 
 
 BIBTEX = """@inproceedings{groove2019,
@@ -263,7 +267,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @core.cached_property
     def beats(self):
@@ -292,11 +326,16 @@ class Track(core.Track):
         )
 
 
-def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
+def load_audio(
+    path: str, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """Load a Groove MIDI audio file.
 
     Args:
         path: path to an audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -305,11 +344,38 @@ def load_audio(path: str) -> Tuple[Optional[np.ndarray], Optional[float]]:
     """
     if not path:
         return None, None
-    return librosa.load(path, sr=22050, mono=True)
+    return io.load_audio(path, sr=22050, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    path: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a Groove MIDI audio file in fixed-size blocks
+
+    Args:
+        path: path to an audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        path, block_size, hop, sr=22050, mono=True, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> Optional[pretty_midi.PrettyMIDI]:
+def load_midi(fhandle: BinaryIO) -> Optional["pretty_midi.PrettyMIDI"]:
     """Load a Groove MIDI midi file.
 
     Args:
@@ -388,7 +454,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_midi)
     def load_midi(self, *args, **kwargs):
@@ -443,7 +509,16 @@ class Dataset(core.Dataset):
 
         return metadata_index
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+    ):
         """Download the dataset
 
         Args:
@@ -454,6 +529,16 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -467,6 +552,10 @@ class Dataset(core.Dataset):
             info_message=None,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            connections=connections,
+            stream=stream,
+            extract_workers=extract_workers,
         )
 
         # files get downloaded to a folder called groove - move everything up a level
@@ -53,8 +53,6 @@
 """
 import logging
 import os
-import jams
-import librosa
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
 
@@ -62,6 +60,9 @@ from mirdata import download_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata import lazy
+
+jams = lazy.import_module("jams")
 
 
 BIBTEX = """@inproceedings{xi2018guitarset,
@@ -247,7 +248,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_mic_path)
+        return self._load_audio(load_audio, self.audio_mic_path)
+
+    def audio_mic_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_mic`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_mic_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def audio_mix(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -258,7 +289,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_mix_path)
+        return self._load_audio(load_audio, self.audio_mix_path)
+
+    def audio_mix_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_mix`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_mix_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def audio_hex(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -269,7 +330,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_multitrack_audio(self.audio_hex_path)
+        return self._load_audio(load_multitrack_audio, self.audio_hex_path)
+
+    def audio_hex_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_hex`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_multitrack_audio,
+            self.audio_hex_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def audio_hex_cln(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -281,7 +372,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_multitrack_audio(self.audio_hex_cln_path)
+        return self._load_audio(load_multitrack_audio, self.audio_hex_cln_path)
+
+    def audio_hex_cln_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_hex_cln`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_multitrack_audio,
+            self.audio_hex_cln_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -294,33 +415,98 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a Guitarset audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_bytes_io
-def load_multitrack_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_multitrack_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a Guitarset multitrack audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
+
+
+def stream_multitrack_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a Guitarset multitrack audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the hexaphonic audio signal,
+            of shape (6, block_size)
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -447,11 +633,11 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_multitrack_audio)
     def load_multitrack_audio(self, *args, **kwargs):
-        return load_multitrack_audio(*args, **kwargs)
+        return self._load_audio(load_multitrack_audio, *args, **kwargs)
 
     @core.copy_docs(load_beats)
     def load_beats(self, *args, **kwargs):
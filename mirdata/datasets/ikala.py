@@ -16,7 +16,6 @@
 
 import csv
 import os
-import librosa
 import logging
 import numpy as np
 from typing import BinaryIO, Optional, TextIO, Tuple
@@ -26,6 +25,9 @@ from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata import lazy
+
+librosa = lazy.import_module("librosa")
 
 
 BIBTEX = """@inproceedings{chan2015vocal,
@@ -128,7 +130,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_vocal_audio(self.audio_path)
+        return self._load_audio(load_vocal_audio, self.audio_path)
+
+    def vocal_audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``vocal_audio`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_vocal_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def instrumental_audio(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -139,7 +171,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_instrumental_audio(self.audio_path)
+        return self._load_audio(load_instrumental_audio, self.audio_path)
+
+    def instrumental_audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``instrumental_audio`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_instrumental_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def mix_audio(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -150,7 +212,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_mix_audio(self.audio_path)
+        return self._load_audio(load_mix_audio, self.audio_path)
+
+    def mix_audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``mix_audio`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_mix_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -173,56 +265,179 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_vocal_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_vocal_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala vocal audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(
+        fhandle, sr=None, mono=False, offset=offset, duration=duration
+    )
     vocal_channel = audio[1, :]
     return vocal_channel, sr
 
 
+def stream_vocal_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream ikala vocal audio in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of audio signal
+
+    """
+    return io.stream_audio(
+        fhandle,
+        block_size,
+        hop,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        transform=lambda block: block[1],
+    )
+
+
 @io.coerce_to_bytes_io
-def load_instrumental_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_instrumental_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load ikala instrumental audio
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    audio, sr = librosa.load(fhandle, sr=None, mono=False)
+    audio, sr = io.load_audio(
+        fhandle, sr=None, mono=False, offset=offset, duration=duration
+    )
     instrumental_channel = audio[0, :]
     return instrumental_channel, sr
 
 
+def stream_instrumental_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream ikala instrumental audio in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of audio signal
+
+    """
+    return io.stream_audio(
+        fhandle,
+        block_size,
+        hop,
+        sr=None,
+        mono=False,
+        offset=offset,
+        duration=duration,
+        transform=lambda block: block[0],
+    )
+
+
 @io.coerce_to_bytes_io
-def load_mix_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_mix_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an ikala mix.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - audio signal
         * float - sample rate
 
     """
-    mixed_audio, sr = librosa.load(fhandle, sr=None, mono=True)
+    mixed_audio, sr = io.load_audio(
+        fhandle, sr=None, mono=True, offset=offset, duration=duration
+    )
     # multipy by 2 because librosa averages the left and right channel.
     return 2.0 * mixed_audio, sr
 
 
+def stream_mix_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream an ikala mix in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of audio signal
+
+    """
+    return io.stream_audio(
+        fhandle,
+        block_size,
+        hop,
+        sr=None,
+        mono=True,
+        offset=offset,
+        duration=duration,
+        transform=lambda block: 2.0 * block,
+    )
+
+
 @io.coerce_to_string_io
 def load_f0(fhandle: TextIO) -> annotations.F0Data:
     """Load an ikala f0 annotation
@@ -320,15 +535,15 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_vocal_audio)
     def load_vocal_audio(self, *args, **kwargs):
-        return load_vocal_audio(*args, **kwargs)
+        return self._load_audio(load_vocal_audio, *args, **kwargs)
 
     @core.copy_docs(load_instrumental_audio)
     def load_instrumental_audio(self, *args, **kwargs):
-        return load_instrumental_audio(*args, **kwargs)
+        return self._load_audio(load_instrumental_audio, *args, **kwargs)
 
     @core.copy_docs(load_mix_audio)
     def load_mix_audio(self, *args, **kwargs):
-        return load_mix_audio(*args, **kwargs)
+        return self._load_audio(load_mix_audio, *args, **kwargs)
 
     @core.copy_docs(load_f0)
     def load_f0(self, *args, **kwargs):
@@ -35,17 +35,22 @@ import glob
 import logging
 import os
 import shutil
-from typing import BinaryIO, Optional, TextIO, Tuple
+from typing import TYPE_CHECKING, BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
-import pretty_midi
 
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
 from mirdata import annotations
 from mirdata import io
+from mirdata import lazy
+
+librosa = lazy.import_module("librosa")
+if TYPE_CHECKING:
+    import pretty_midi
+else:
+    pretty_midi = lazy.import_module("pretty_midi")
 
 
 BIBTEX = """@inproceedings{
@@ -137,7 +142,7 @@ class Track(core.Track):
         self.duration = self._track_metadata.get("duration")
 
     @core.cached_property
-    def midi(self) -> Optional[pretty_midi.PrettyMIDI]:
+    def midi(self) -> Optional["pretty_midi.PrettyMIDI"]:
         return load_midi(self.midi_path)
 
     @core.cached_property
@@ -153,7 +158,37 @@ class Track(core.Track):
             * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -170,7 +205,7 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_midi(fhandle: BinaryIO) -> pretty_midi.PrettyMIDI:
+def load_midi(fhandle: BinaryIO) -> "pretty_midi.PrettyMIDI":
     """Load a MAESTRO midi file.
 
     Args:
@@ -211,18 +246,50 @@ def load_notes(midi_path, midi=None):
 
 
 @io.coerce_to_bytes_io
-def load_audio(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load a MAESTRO audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream a MAESTRO audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 @core.docstring_inherit(core.Dataset)
@@ -261,7 +328,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_midi)
     def load_midi(self, *args, **kwargs):
@@ -271,7 +338,16 @@ class Dataset(core.Dataset):
     def load_notes(self, *args, **kwargs):
         return load_notes(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+    ):
         """Download the dataset
 
         Args:
@@ -282,6 +358,16 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -300,6 +386,10 @@ class Dataset(core.Dataset):
             partial_download=partial_download,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            connections=connections,
+            stream=stream,
+            extract_workers=extract_workers,
         )
 
         # files get downloaded to a folder called maestro-v2.0.0
@@ -19,7 +19,6 @@ import os
 import shutil
 from typing import BinaryIO, Optional, TextIO, Tuple
 
-import librosa
 import numpy as np
 
 from mirdata import download_utils
@@ -133,7 +132,37 @@ class Track(core.Track):
             * float - The sample rate of the audio file
 
         """
-        return load_audio_mono(self.audio_path_mono)
+        return self._load_audio(load_audio_mono, self.audio_path_mono)
+
+    def audio_mono_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_mono`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio_mono,
+            self.audio_path_mono,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     @property
     def audio_stereo(self) -> Optional[Tuple[np.ndarray, float]]:
@@ -144,7 +173,37 @@ class Track(core.Track):
             * float - The sample rate of the audio file
 
         """
-        return load_audio_stereo(self.audio_path_stereo)
+        return self._load_audio(load_audio_stereo, self.audio_path_stereo)
+
+    def audio_stereo_stream(
+        self,
+        block_size: int,
+        hop: Optional[int] = None,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+    ) -> Optional[io.AudioStream]:
+        """Stream ``audio_stereo`` in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio_stereo,
+            self.audio_path_stereo,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -161,33 +220,97 @@ class Track(core.Track):
 
 
 @io.coerce_to_bytes_io
-def load_audio_mono(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_mono(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=True)
+    return io.load_audio(fhandle, sr=None, mono=True, offset=offset, duration=duration)
+
+
+def stream_audio_mono(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream an Orchset audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=True, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_bytes_io
-def load_audio_stereo(fhandle: BinaryIO) -> Tuple[np.ndarray, float]:
+def load_audio_stereo(
+    fhandle: BinaryIO, offset: float = 0.0, duration: Optional[float] = None
+) -> Tuple[np.ndarray, float]:
     """Load an Orchset audio file.
 
     Args:
         fhandle (str or file-like): File-like object or path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the stereo audio signal
         * float - The sample rate of the audio file
 
     """
-    return librosa.load(fhandle, sr=None, mono=False)
+    return io.load_audio(fhandle, sr=None, mono=False, offset=offset, duration=duration)
+
+
+def stream_audio_stereo(
+    fhandle: BinaryIO,
+    block_size: int,
+    hop: Optional[int] = None,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Optional[io.AudioStream]:
+    """Stream an Orchset audio file in fixed-size blocks
+
+    Args:
+        fhandle (str or file-like): File-like object or path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the stereo audio signal
+
+    """
+    return io.stream_audio(
+        fhandle, block_size, hop, sr=None, mono=False, offset=offset, duration=duration
+    )
 
 
 @io.coerce_to_string_io
@@ -295,17 +418,26 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio_mono)
     def load_audio_mono(self, *args, **kwargs):
-        return load_audio_mono(*args, **kwargs)
+        return self._load_audio(load_audio_mono, *args, **kwargs)
 
     @core.copy_docs(load_audio_stereo)
     def load_audio_stereo(self, *args, **kwargs):
-        return load_audio_stereo(*args, **kwargs)
+        return self._load_audio(load_audio_stereo, *args, **kwargs)
 
     @core.copy_docs(load_melody)
     def load_melody(self, *args, **kwargs):
         return load_melody(*args, **kwargs)
 
-    def download(self, partial_download=None, force_overwrite=False, cleanup=False):
+    def download(
+        self,
+        partial_download=None,
+        force_overwrite=False,
+        cleanup=False,
+        max_workers=1,
+        connections=1,
+        stream=False,
+        extract_workers=1,
+    ):
         """Download the dataset
 
         Args:
@@ -316,6 +448,16 @@ class Dataset(core.Dataset):
                 If True, existing files are overwritten by the downloaded files.
             cleanup (bool):
                 Whether to delete any zip/tar files after extracting.
+            max_workers (int):
+                Number of remotes downloaded at the same time.
+            connections (int):
+                Number of parallel range requests used to download each
+                large file, if the server supports them.
+            stream (bool):
+                If True, zip and tar files are extracted while they download.
+            extract_workers (int):
+                Number of workers extracting each zip file, or decompressing
+                each tar.bz2/tar.gz file.
 
         Raises:
             ValueError: if invalid keys are passed to partial_download
@@ -328,6 +470,10 @@ class Dataset(core.Dataset):
             info_message=None,
             force_overwrite=force_overwrite,
             cleanup=cleanup,
+            max_workers=max_workers,
+            connections=connections,
+            stream=stream,
+            extract_workers=extract_workers,
         )
         # files get downloaded to a folder called Orchset - move everything up a level
         duplicated_orchset_dir = os.path.join(self.data_home, "Orchset")
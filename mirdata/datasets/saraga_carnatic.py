@@ -33,12 +33,12 @@
 import csv
 import json
 import os
-import librosa
 import numpy as np
 
 from mirdata import download_utils
 from mirdata import jams_utils
 from mirdata import core
+from mirdata import io
 from mirdata import annotations
 
 BIBTEX = """
@@ -230,7 +230,31 @@ class Track(core.Track):
            * float - sample rate
 
         """
-        return load_audio(self.audio_path)
+        return self._load_audio(load_audio, self.audio_path)
+
+    def audio_stream(self, block_size, hop=None, offset=0.0, duration=None):
+        """Stream the track's audio in fixed-size blocks
+
+        Args:
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, blocks do not overlap
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+
+        Returns:
+            io.AudioStream: iterable over blocks of the audio signal
+
+        """
+        return self._stream_audio(
+            stream_audio,
+            self.audio_path,
+            block_size,
+            hop,
+            offset=offset,
+            duration=duration,
+        )
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -279,11 +303,14 @@ def load_metadata(metadata_path):
         return metadata
 
 
-def load_audio(audio_path):
+def load_audio(audio_path, offset=0.0, duration=None):
     """Load a Saraga Carnatic audio file.
 
     Args:
         audio_path (str): path to audio file
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
 
     Returns:
         * np.ndarray - the mono audio signal
@@ -295,7 +322,36 @@ def load_audio(audio_path):
 
     if not os.path.exists(audio_path):
         raise IOError("audio_path {} does not exist".format(audio_path))
-    return librosa.load(audio_path, sr=44100, mono=False)
+    return io.load_audio(
+        audio_path, sr=44100, mono=False, offset=offset, duration=duration
+    )
+
+
+def stream_audio(audio_path, block_size, hop=None, offset=0.0, duration=None):
+    """Stream a Saraga Carnatic audio file in fixed-size blocks
+
+    Args:
+        audio_path (str): path to audio file
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, blocks do not overlap
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+
+    Returns:
+        io.AudioStream: iterable over blocks of the mono audio signal
+
+    """
+    return io.stream_audio(
+        audio_path,
+        block_size,
+        hop,
+        sr=44100,
+        mono=False,
+        offset=offset,
+        duration=duration,
+    )
 
 
 def load_tonic(tonic_path):
@@ -536,7 +592,7 @@ class Dataset(core.Dataset):
 
     @core.copy_docs(load_audio)
     def load_audio(self, *args, **kwargs):
-        return load_audio(*args, **kwargs)
+        return self._load_audio(load_audio, *args, **kwargs)
 
     @core.copy_docs(load_tonic)
     def load_tonic(self, *args, **kwargs):
@@ -0,0 +1,480 @@
+"""Parallel decompression of bzip2 and multi-member gzip files
+
+bzip2 compresses data in independent blocks of at most 900 kB, and gzip
+files made by concatenation (or by tools such as bgzip) are made of
+independent members. The blocks (or members) of a file are located in the
+compressed data, decompressed in a pool of workers, and returned in order,
+so that e.g. a tar file can be read from the result as a stream.
+
+Only multi-member gzip files are decompressed in parallel: a gzip file made
+of a single member (e.g. by ``gzip`` or ``tar czf``) cannot be split, and is
+decompressed in order by the reader, as fast as with the gzip module.
+
+Example:
+    .. code-block:: python
+
+        with decompress.open_decompressed("archive.tar.bz2", workers=8) as fileobj:
+            with tarfile.open(fileobj=fileobj, mode="r|") as tfile:
+                tfile.extractall("out")
+
+"""
+
+import bz2
+import collections
+from concurrent import futures
+import mmap
+import os
+import time
+import zlib
+
+BZ2_BLOCK_MAGIC = 0x314159265359
+BZ2_EOS_MAGIC = 0x177245385090
+BZ2_HEADER = 0x425A6839  # "BZh9", valid for blocks of any level
+GZIP_MAGIC = b"\x1f\x8b\x08"
+GZIP_HEADER_SIZE = 10  # bytes
+GZIP_XFL = (0, 2, 4)
+GZIP_MAX_OS = 13  # and 255, "unknown"
+GZIP_MTIME_SLACK = 24 * 60 * 60  # seconds
+
+SEARCH_WINDOW = 16 * 1024 * 1024  # bytes
+MAX_GZIP_SEGMENT = 64 * 1024 * 1024  # bytes
+READ_SIZE = 1024 * 1024  # bytes
+
+
+def compression(file_path):
+    """Get the compression of a file from its first bytes
+
+    Args:
+        file_path (str): path to the file
+
+    Returns:
+        str or None: "bz2", "gz", or None if the file is neither
+
+    """
+    with open(file_path, "rb") as fhandle:
+        magic = fhandle.read(3)
+    if magic == b"BZh":
+        return "bz2"
+    if magic == GZIP_MAGIC:
+        return "gz"
+    return None
+
+
+def open_decompressed(file_path, workers=None, executor="process"):
+    """Open a bzip2 or gzip file, decompressed in parallel
+
+    gzip files are only decompressed in parallel if they are made of several
+    members (e.g. by bgzip or pigz --independent, or by concatenation).
+
+    Args:
+        file_path (str): path to a .bz2 or .gz file
+        workers (int or None): number of blocks decompressed at the same
+            time. If None, the number of CPUs.
+        executor (str): "process" or "thread", the kind of pool used
+
+    Returns:
+        DecompressedFile: a read-only, non seekable file object
+
+    Raises:
+        IOError: if the file is neither bzip2 nor gzip compressed
+
+    """
+    kind = compression(file_path)
+    if kind is None:
+        raise IOError("{} is not a bzip2 or gzip file".format(file_path))
+    return DecompressedFile(file_path, kind, workers, executor)
+
+
+class DecompressedFile(object):
+    """Read-only stream of the decompressed content of a bzip2 or gzip file
+
+    Use open_decompressed to create it.
+
+    Attributes:
+        file_path (str): path to the compressed file
+        kind (str): "bz2" or "gz"
+
+    """
+
+    def __init__(self, file_path, kind, workers=None, executor="process"):
+        """DecompressedFile init method
+
+        Args:
+            file_path (str): path to the compressed file
+            kind (str): "bz2" or "gz"
+            workers (int or None): number of blocks decompressed at the same
+                time. If None, the number of CPUs.
+            executor (str): "process" or "thread"
+
+        """
+        if executor not in ["process", "thread"]:
+            raise ValueError(
+                "executor must be 'process' or 'thread', got {}".format(executor)
+            )
+        self.file_path = file_path
+        self.kind = kind
+        workers = workers or os.cpu_count() or 1
+        pool_class = (
+            futures.ProcessPoolExecutor
+            if executor == "process"
+            else futures.ThreadPoolExecutor
+        )
+        self._fhandle = open(file_path, "rb")
+        self._data = mmap.mmap(self._fhandle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._pool = pool_class(max_workers=workers)
+        # decompressed blocks are kept at most 2 per worker ahead of the reader
+        self._max_pending = 2 * workers
+        if kind == "bz2":
+            self._chunks = _bz2_chunks(self._data, self._pool, self._max_pending)
+        else:
+            self._chunks = _gzip_chunks(self._data, self._pool, self._max_pending)
+        self._buffer = b""
+        self._offset = 0
+
+    def __repr__(self):
+        return "DecompressedFile({}, {})".format(self.file_path, self.kind)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, size=-1):
+        """Read up to size bytes, or everything left if size is negative"""
+        parts = []
+        available = len(self._buffer) - self._offset
+        while size < 0 or available < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            parts.append(chunk)
+            available += len(chunk)
+        if parts:
+            self._buffer = self._buffer[self._offset :] + b"".join(parts)
+            self._offset = 0
+        end = len(self._buffer) if size < 0 else self._offset + size
+        data = self._buffer[self._offset : end]
+        self._offset += len(data)
+        return data
+
+    def close(self):
+        """Stop the workers and close the compressed file"""
+        if self._pool is None:
+            return
+        self._chunks.close()
+        self._pool.shutdown(wait=True)
+        self._pool = None
+        self._data.close()
+        self._fhandle.close()
+
+
+def _ordered(tasks, pool, max_pending):
+    """Run (function, args, info) tasks in a pool, yielding (future, info) in order
+
+    At most max_pending tasks are submitted ahead of the consumer. Pending
+    tasks are cancelled if the generator is closed.
+
+    """
+    pending = collections.deque()
+    try:
+        for function, args, info in tasks:
+            pending.append((pool.submit(function, *args), info))
+            if len(pending) >= max_pending:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+    finally:
+        for future, _ in pending:
+            future.cancel()
+
+
+def _bit_patterns(magic):
+    """Get the (window, mask) 7-byte patterns of a 48-bit magic at each bit shift"""
+    patterns = []
+    for shift in range(8):
+        window = (magic << (8 - shift)).to_bytes(7, "big")
+        mask = (((1 << 48) - 1) << (8 - shift)).to_bytes(7, "big")
+        patterns.append((shift, window, mask))
+    return patterns
+
+
+BZ2_PATTERNS = {
+    "block": _bit_patterns(BZ2_BLOCK_MAGIC),
+    "eos": _bit_patterns(BZ2_EOS_MAGIC),
+}
+
+
+def _find_bits(data, start, end):
+    """Find the bzip2 block and end of stream magics starting in data[start:end]
+
+    Only magics whose first byte is in [start, end) are returned, so that
+    consecutive windows do not find the same magic. The search reads up to 5
+    bytes past end, to find the magics which start just before it.
+
+    Returns:
+        list: sorted (bit offset, kind) tuples, kind being "block" or "eos"
+
+    """
+    found = []
+    size = len(data)
+    for kind, patterns in BZ2_PATTERNS.items():
+        for shift, window, mask in patterns:
+            # bytes 1 to 5 of the window are entirely covered by the magic
+            middle = window[1:6]
+            position = data.find(middle, start + 1, min(end + 5, size))
+            while position != -1:
+                i = position - 1
+                if i >= end:
+                    break
+                if (data[i] & mask[0]) == window[0]:
+                    if mask[6] == 0 or (
+                        i + 6 < size and (data[i + 6] & mask[6]) == window[6]
+                    ):
+                        found.append((i * 8 + shift, kind))
+                position = data.find(middle, position + 1, min(end + 5, size))
+    return sorted(found)
+
+
+def _read_bits(data, offset, n_bits):
+    """Read n_bits (at most 64) of data starting at a bit offset"""
+    first = offset // 8
+    last = (offset + n_bits + 7) // 8
+    value = int.from_bytes(data[first:last], "big")
+    return (value >> (last * 8 - offset - n_bits)) & ((1 << n_bits) - 1)
+
+
+def decompress_bz2_block(data, start, end):
+    """Decompress a bzip2 block
+
+    The block (its magic, CRC and compressed data) is copied bit by bit into
+    a stream of its own, with a header and an end of stream marker, which is
+    decompressed with the bz2 module.
+
+    Args:
+        data (bytes): compressed data containing the block
+        start (int): bit offset of the block's magic in data
+        end (int): bit offset of the end of the block in data
+
+    Returns:
+        bytes: the decompressed block
+
+    """
+    n_bits = end - start
+    value = int.from_bytes(data, "big")
+    block = (value >> (len(data) * 8 - end)) & ((1 << n_bits) - 1)
+    crc = (block >> (n_bits - 80)) & 0xFFFFFFFF
+    stream = (((BZ2_HEADER << n_bits) | block) << 48 | BZ2_EOS_MAGIC) << 32 | crc
+    length = 32 + n_bits + 80
+    padding = -length % 8
+    return bz2.decompress((stream << padding).to_bytes((length + padding) // 8, "big"))
+
+
+def _bz2_task(data, start, end):
+    """Get a (function, args, info) task decompressing the block data[start:end] (in bits)"""
+    first = start // 8
+    last = (end + 7) // 8
+    args = (data[first:last], start - first * 8, end - first * 8)
+    return decompress_bz2_block, args, (start, end)
+
+
+def _bz2_boundaries(data):
+    """Iterate over the (bit offset, kind) block and end of stream magics of data"""
+    previous = -1
+    for start in range(0, len(data), SEARCH_WINDOW):
+        for boundary in _find_bits(data, start, min(start + SEARCH_WINDOW, len(data))):
+            # each offset once, even if found by two windows
+            if boundary[0] > previous:
+                previous = boundary[0]
+                yield boundary
+
+
+def _bz2_blocks(data):
+    """Iterate over the (start, end) bit offsets of the blocks of a bzip2 file"""
+    previous = None
+    for offset, kind in _bz2_boundaries(data):
+        if previous is not None:
+            yield previous, offset
+        previous = offset if kind == "block" else None
+    if previous is not None:
+        raise IOError("bzip2 data ends in the middle of a block")
+
+
+def _bz2_chunks(data, pool, max_pending):
+    """Decompress the blocks of a bzip2 file in a pool, yielding them in order"""
+    tasks = (_bz2_task(data, start, end) for start, end in _bz2_blocks(data))
+    results = _ordered(tasks, pool, max_pending)
+    combined_crc = 0
+    try:
+        for future, (start, end) in results:
+            try:
+                chunk = future.result()
+            except (OSError, ValueError, EOFError):
+                # a magic was found by chance inside compressed data: merge
+                # the block with the next ones until it decompresses
+                chunk = None
+                for future, (_, end) in results:
+                    future.cancel()
+                    try:
+                        chunk = decompress_bz2_block(*_bz2_task(data, start, end)[1])
+                        break
+                    except (OSError, ValueError, EOFError):
+                        continue
+                if chunk is None:
+                    raise IOError("Invalid bzip2 data at bit {}".format(start))
+            block_crc = _read_bits(data, start + 48, 32)
+            combined_crc = ((combined_crc << 1) | (combined_crc >> 31)) & 0xFFFFFFFF
+            combined_crc ^= block_crc
+            yield chunk
+
+            if _read_bits(data, end, 48) == BZ2_EOS_MAGIC:
+                if _read_bits(data, end + 48, 32) != combined_crc:
+                    raise IOError("bzip2 stream CRC mismatch")
+                combined_crc = 0
+    finally:
+        results.close()
+
+
+def decompress_gzip_member(data):
+    """Decompress a gzip member
+
+    Args:
+        data (bytes): the compressed member
+
+    Returns:
+        bytes or None: the decompressed member, or None if data is not
+            exactly one gzip member
+
+    """
+    decompressor = zlib.decompressobj(31)
+    try:
+        chunk = decompressor.decompress(data)
+    except zlib.error:
+        return None
+    if not decompressor.eof or decompressor.unused_data:
+        return None
+    return chunk
+
+
+def _is_gzip_header(data, position):
+    """Check if the bytes at position look like a gzip member header
+
+    Besides the magic, the reserved FLG bits must be unset, XFL and OS must
+    be values written by deflate compressors, and MTIME must be 0 or not in
+    the future (see RFC 1952). This rejects most of the magics found by
+    chance inside compressed data.
+
+    """
+    header = data[position : position + GZIP_HEADER_SIZE]
+    if len(header) < GZIP_HEADER_SIZE or header[:3] != GZIP_MAGIC:
+        return False
+    flags, xfl, system = header[3], header[8], header[9]
+    mtime = int.from_bytes(header[4:8], "little")
+    return (
+        flags & 0xE0 == 0
+        and xfl in GZIP_XFL
+        and (system <= GZIP_MAX_OS or system == 255)
+        and mtime <= time.time() + GZIP_MTIME_SLACK
+    )
+
+
+def _gzip_candidates(data):
+    """Iterate over the offsets of the gzip member headers in data
+
+    Some are found by chance inside compressed data, and are not members.
+    Real members may also be missed (e.g. with an mtime in the future): they
+    are decompressed in order by the reader.
+
+    """
+    position = data.find(GZIP_MAGIC)
+    while position != -1:
+        if _is_gzip_header(data, position):
+            yield position
+        position = data.find(GZIP_MAGIC, position + 1)
+
+
+def _gzip_segments(data):
+    """Iterate over (start, end) segments of a gzip file between member headers"""
+    previous = None
+    for position in _gzip_candidates(data):
+        if previous is not None:
+            yield previous, position
+        previous = position
+    if previous is not None:
+        yield previous, len(data)
+
+
+def _gzip_stream(data, start):
+    """Decompress the gzip member starting at start, in chunks
+
+    Yields:
+        bytes: decompressed chunks, and finally the offset where the member ends
+
+    """
+    decompressor = zlib.decompressobj(31)
+    position = start
+    while not decompressor.eof:
+        if position >= len(data):
+            raise IOError("gzip data ends in the middle of a member")
+        chunk = data[position : position + READ_SIZE]
+        position += len(chunk)
+        try:
+            yield decompressor.decompress(chunk)
+        except zlib.error as exc:
+            raise IOError("Invalid gzip data at byte {}: {}".format(start, exc))
+    yield position - len(decompressor.unused_data)
+
+
+def _gzip_chunks(data, pool, max_pending):
+    """Decompress the members of a gzip file in a pool, yielding them in order"""
+
+    def tasks():
+        for start, end in _gzip_segments(data):
+            if end - start > MAX_GZIP_SEGMENT:
+                # decompressed in order by the reader, without a worker
+                yield _none, (), (start, end)
+            else:
+                yield decompress_gzip_member, (data[start:end],), (start, end)
+
+    def read_member(start):
+        """Decompress the member at start in order, moving position to its end"""
+        nonlocal position
+        for chunk in _gzip_stream(data, start):
+            if isinstance(chunk, int):
+                position = chunk
+            else:
+                yield chunk
+        if position < len(data) and data[position : position + 3] != GZIP_MAGIC:
+            if data[position:].strip(b"\x00"):
+                raise IOError("Trailing garbage after gzip data")
+            position = len(data)
+
+    if data[: len(GZIP_MAGIC)] != GZIP_MAGIC:
+        raise IOError("Not a gzip file")
+    results = _ordered(tasks(), pool, max_pending)
+    position = 0
+    try:
+        for future, (start, end) in results:
+            while position < start:
+                # a member whose header was not taken as a candidate
+                yield from read_member(position)
+            if start < position:
+                # a header found by chance inside a member which was read
+                future.cancel()
+                continue
+            chunk = future.result()
+            if chunk is not None:
+                yield chunk
+                position = end
+                continue
+
+            # the segment is not exactly one member: read the member in order
+            yield from read_member(start)
+        while position < len(data):
+            yield from read_member(position)
+    finally:
+        results.close()
+
+
+def _none():
+    return None
@@ -1,18 +1,34 @@
-"""Utilities for downloading from the web.
-"""
+"""Utilities for downloading from the web."""
 
+from concurrent import futures
 import logging
 import os
+import hashlib
+import json
+import re
+import shutil
 import tarfile
-import urllib
+import tempfile
+import threading
+import urllib.error
+import urllib.request
 import zipfile
 
 from tqdm import tqdm
 
-from mirdata.validate import md5
+from mirdata import decompress
+from mirdata.validate import md5, stat_signature
 
 logging.basicConfig(format="%(levelname)s: %(message)s", level=logging.INFO)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes
+MIN_SEGMENT_SIZE = 16 * 1024 * 1024  # bytes
+PART_EXT = ".part"
+STATE_SAVE_INTERVAL = 8 * 1024 * 1024  # bytes
+STAMP_EXT = ".stamp"
+SPOOL_MAX_SIZE = 64 * 1024 * 1024  # bytes
+EXTRACT_CHUNK_SIZE = 1024 * 1024  # bytes
+
 
 class RemoteFileMetadata(object):
     """The metadata for a remote file
@@ -39,6 +55,12 @@ def downloader(
     info_message=None,
     force_overwrite=False,
     cleanup=False,
+    max_workers=1,
+    connections=1,
+    stream=False,
+    members=None,
+    extract_workers=1,
+    checksums=None,
 ):
     """Download data to `save_dir` and optionally log a message.
 
@@ -58,6 +80,25 @@ def downloader(
             If True, existing files are overwritten by the downloaded files.
         cleanup (bool):
             Whether to delete the zip/tar file after extracting.
+        max_workers (int):
+            Number of remotes downloaded at the same time. If more than 1, a
+            single progress bar shows the total progress, and if a download
+            fails, the other downloads are cancelled and the error is raised.
+        connections (int):
+            Number of parallel range requests used to download each large
+            file, if the server supports them.
+        stream (bool):
+            If True, zip and tar files are extracted while they download,
+            see download_tar_file and download_zip_file.
+        members (set or None):
+            If given, only the archive members with these paths (relative to
+            save_dir) are extracted. Other remotes are downloaded as usual.
+        extract_workers (int):
+            Number of workers extracting each zip file, or decompressing
+            each tar.bz2/tar.gz file, see unzip and untar.
+        checksums (dict or None):
+            If given, filled with {local path: md5 checksum} of the files
+            which were downloaded or extracted, hashed as they were written.
 
     """
     if not os.path.exists(save_dir):
@@ -86,20 +127,183 @@ def downloader(
 
         logging.info("Downloading {} to {}".format(objs_to_download, save_dir))
 
-        for k in objs_to_download:
-            logging.info("[{}] downloading {}".format(k, remotes[k].filename))
-            extension = os.path.splitext(remotes[k].filename)[-1]
-            if ".zip" in extension:
-                download_zip_file(remotes[k], save_dir, force_overwrite, cleanup)
-            elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
-                download_tar_file(remotes[k], save_dir, force_overwrite, cleanup)
-            else:
-                download_from_remote(remotes[k], save_dir, force_overwrite)
+        if max_workers > 1 and len(objs_to_download) > 1:
+            download_concurrently(
+                {k: remotes[k] for k in objs_to_download},
+                save_dir,
+                force_overwrite,
+                cleanup,
+                max_workers,
+                connections,
+                stream,
+                members,
+                extract_workers,
+                checksums,
+            )
+        else:
+            kwargs = {} if connections == 1 else {"connections": connections}
+            if stream:
+                kwargs["stream"] = stream
+            if members is not None:
+                kwargs["members"] = members
+            if extract_workers != 1:
+                kwargs["extract_workers"] = extract_workers
+            if checksums is not None:
+                kwargs["checksums"] = checksums
+            for k in objs_to_download:
+                logging.info("[{}] downloading {}".format(k, remotes[k].filename))
+                download_remote(
+                    remotes[k], save_dir, force_overwrite, cleanup, **kwargs
+                )
 
     if info_message is not None:
         logging.info(info_message.format(save_dir))
 
 
+def download_remote(
+    remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    progress=None,
+    connections=1,
+    stream=False,
+    members=None,
+    extract_workers=1,
+    checksums=None,
+):
+    """Download a remote, and extract it if it is a zip or tar file
+
+    Args:
+        remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save downloaded file
+        force_overwrite (bool): If True, overwrites existing files
+        cleanup (bool): If True, remove zip/tar files after extracting
+        progress (AggregateProgressBar or None): shared progress bar of
+            concurrent downloads. If None, the download has its own.
+        connections (int): number of parallel range requests used to
+            download large files, see `fetch`
+        stream (bool): If True, zip and tar files are extracted while they
+            download, see download_tar_file and download_zip_file
+        members (set or None): if given, only the archive members with these
+            paths (relative to save_dir) are extracted
+        extract_workers (int): number of workers extracting each archive,
+            see unzip and untar
+        checksums (dict or None): if given, filled with {local path: md5
+            checksum} of the files which were downloaded or extracted
+
+    """
+    kwargs = {} if progress is None else {"progress": progress}
+    if connections != 1:
+        kwargs["connections"] = connections
+    extension = os.path.splitext(remote.filename)[-1]
+    archive_kwargs = dict(kwargs, stream=True) if stream else dict(kwargs)
+    if members is not None:
+        # archives are extracted in the remote's destination_dir
+        destination = os.path.normpath(remote.destination_dir or "")
+        archive_kwargs["members"] = {
+            os.path.normpath(os.path.relpath(path, destination)) for path in members
+        }
+    if extract_workers != 1:
+        archive_kwargs["extract_workers"] = extract_workers
+    if checksums is not None:
+        archive_kwargs["checksums"] = checksums
+    if ".zip" in extension:
+        download_zip_file(remote, save_dir, force_overwrite, cleanup, **archive_kwargs)
+    elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
+        download_tar_file(remote, save_dir, force_overwrite, cleanup, **archive_kwargs)
+    else:
+        download_path = download_from_remote(
+            remote, save_dir, force_overwrite, **kwargs
+        )
+        if checksums is not None:
+            # download_from_remote already checked it against remote.checksum
+            checksums[os.path.abspath(download_path)] = remote.checksum
+
+
+def download_concurrently(
+    remotes,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    max_workers,
+    connections=1,
+    stream=False,
+    members=None,
+    extract_workers=1,
+    checksums=None,
+):
+    """Download several remotes at the same time, with one progress bar
+
+    If a download fails (e.g. because of a checksum mismatch), the downloads
+    which have not started are cancelled, the running ones are stopped, and
+    the first error is raised. The ``.part`` files of the stopped downloads
+    are not removed, so that a later download resumes them (see `fetch`).
+
+    Args:
+        remotes (dict): {key: RemoteFileMetadata} of the remotes to download
+        save_dir (str): Path to save downloaded files
+        force_overwrite (bool): If True, overwrites existing files
+        cleanup (bool): If True, remove zip/tar files after extracting
+        max_workers (int): Number of remotes downloaded at the same time
+        connections (int): number of parallel range requests used to
+            download each large file, see `fetch`
+        stream (bool): If True, zip and tar files are extracted while they
+            download, see download_tar_file and download_zip_file
+        members (set or None): if given, only the archive members with these
+            paths (relative to save_dir) are extracted
+        extract_workers (int): number of workers extracting each archive,
+            see unzip and untar
+        checksums (dict or None): if given, filled with {local path: md5
+            checksum} of the files which were downloaded or extracted
+
+    """
+    progress = AggregateProgressBar(
+        unit="B", unit_scale=True, unit_divisor=1024, miniters=1, total=0
+    )
+    error = None
+    pool = futures.ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        jobs = {}
+        for key, remote in remotes.items():
+            logging.info("[{}] downloading {}".format(key, remote.filename))
+            job = pool.submit(
+                download_remote,
+                remote,
+                save_dir,
+                force_overwrite,
+                cleanup,
+                progress,
+                connections,
+                stream,
+                members,
+                extract_workers,
+                checksums,
+            )
+            jobs[job] = key
+
+        for job in futures.as_completed(jobs):
+            if job.cancelled() or job.exception() is None:
+                continue
+            if error is None and not isinstance(job.exception(), DownloadCancelled):
+                error = job.exception()
+                logging.error(
+                    "[{}] download failed, cancelling the other downloads".format(
+                        jobs[job]
+                    )
+                )
+                progress.cancel()
+                for other in jobs:
+                    other.cancel()
+    finally:
+        progress.cancel()
+        pool.shutdown(wait=True)
+        progress.close()
+
+    if error is not None:
+        raise error
+
+
 class DownloadProgressBar(tqdm):
     """
     Wrap `tqdm` to show download progress
@@ -111,11 +315,378 @@ class DownloadProgressBar(tqdm):
         self.update(b * bsize - self.n)
 
 
-def download_from_remote(remote, save_dir, force_overwrite):
+class DownloadCancelled(Exception):
+    """Raised in a download which was stopped because another download failed"""
+
+
+class AggregateProgressBar(tqdm):
+    """
+    Wrap `tqdm` to show the total progress of concurrent downloads, and to
+    cancel them
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._progress_lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        """bool: True if the downloads were cancelled"""
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stop the downloads sharing this progress bar"""
+        self._cancelled.set()
+
+    def hook(self):
+        """Get a `reporthook` for one download, see urllib.request.urlretrieve
+
+        Returns:
+            function: a function raising DownloadCancelled once the downloads
+                are cancelled
+
+        """
+        state = {"done": 0, "total": None}
+
+        def update_to(b=1, bsize=1, tsize=None):
+            if self.cancelled:
+                raise DownloadCancelled()
+            with self._progress_lock:
+                if state["total"] is None and tsize is not None and tsize > 0:
+                    state["total"] = tsize
+                    self.total += tsize
+                    self.refresh()
+                done = b * bsize
+                if state["total"] is not None:
+                    done = min(done, state["total"])
+                self.update(done - state["done"])
+                state["done"] = done
+
+        return update_to
+
+
+class _RangesIgnored(IOError):
+    """A server answered a range request without the requested byte range"""
+
+
+def _open_url(url, start=None, end=None, method=None):
+    """Open a url, optionally requesting the bytes [start, end)"""
+    request = urllib.request.Request(url, method=method)
+    if start is not None:
+        request.add_header(
+            "Range", "bytes={}-{}".format(start, "" if end is None else end - 1)
+        )
+    return urllib.request.urlopen(request)
+
+
+def _content_range(response):
+    """Get (start, end, total) from a 206 response's Content-Range, or None"""
+    match = re.match(
+        r"bytes (\d+)-(\d+)/(\d+|\*)", response.headers.get("Content-Range", "")
+    )
+    if match is None:
+        return None
+    total = None if match.group(3) == "*" else int(match.group(3))
+    return int(match.group(1)), int(match.group(2)) + 1, total
+
+
+def remote_size(url):
+    """Get the size of a remote file, if the server supports range requests
+
+    Args:
+        url (str): url of the file
+
+    Returns:
+        int or None: size in bytes, or None if the size is unknown or the
+            server does not accept range requests
+
+    """
+    try:
+        with _open_url(url, method="HEAD") as response:
+            if response.headers.get("Accept-Ranges", "").lower() != "bytes":
+                return None
+            length = response.headers.get("Content-Length")
+            return int(length) if length is not None else None
+    except (IOError, ValueError):
+        return None
+
+
+def fetch(url, download_path, reporthook=None, connections=1):
+    """Download a url to a file, resuming interrupted downloads
+
+    Data is written to ``download_path + ".part"``, which is renamed to
+    download_path once complete. If a part file exists, the download resumes
+    where it stopped with an HTTP range request (or starts over if the server
+    ignores it). If ``connections > 1`` and the server accepts range requests,
+    files of at least 2 * MIN_SEGMENT_SIZE bytes are fetched as parallel byte
+    ranges written in place in the part file. Their progress is saved in
+    ``download_path + ".part.json"`` every STATE_SAVE_INTERVAL bytes and when
+    a segment finishes, so they can be resumed too. If the
+    server no longer answers range requests with the requested bytes (e.g.
+    it replies 200 to a resumed segment), the state and part files are
+    dropped and the file is downloaded from scratch over one connection.
+
+    The md5 checksum of single connection downloads is computed as the data
+    arrives (after reading the part file back, when resuming), so the
+    downloaded file does not need to be read again.
+
+    Args:
+        url (str): url of the file
+        download_path (str): path of the downloaded file
+        reporthook (function or None): called as ``reporthook(1, done, total)``
+            after each chunk, where done is the number of bytes downloaded
+            so far, see urllib.request.urlretrieve
+        connections (int): maximum number of parallel range requests
+
+    Returns:
+        str or None: md5 checksum of the downloaded file, or None if it was
+            downloaded in segments and has to be hashed
+
+    Raises:
+        IOError: if the download fails or is incomplete
+
+    """
+    part_path = download_path + PART_EXT
+    state_path = part_path + ".json"
+
+    segments = None
+    if os.path.exists(state_path):
+        with open(state_path) as fhandle:
+            state = json.load(fhandle)
+        if state.get("url") == url and os.path.exists(part_path):
+            segments = state["segments"]
+        else:
+            # the part file is not a resumable segmented download
+            for path in [part_path, state_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+    if segments is None and connections > 1:
+        size = remote_size(url)
+        if size is not None and size >= 2 * MIN_SEGMENT_SIZE:
+            n_segments = min(connections, size // MIN_SEGMENT_SIZE)
+            bounds = [size * i // n_segments for i in range(n_segments + 1)]
+            segments = [[bounds[i], bounds[i + 1], 0] for i in range(n_segments)]
+            with open(part_path, "wb") as fhandle:
+                fhandle.truncate(size)
+
+    checksum = None
+    if segments is not None:
+        try:
+            _fetch_segments(url, part_path, state_path, segments, reporthook)
+        except _RangesIgnored:
+            # the segments written so far cannot be trusted, start over
+            logging.warning(
+                "{} ignored a range request, restarting the download".format(url)
+            )
+            for path in [part_path, state_path]:
+                if os.path.exists(path):
+                    os.remove(path)
+            segments = None
+        else:
+            os.remove(state_path)
+    if segments is None:
+        checksum = _fetch_stream(url, part_path, reporthook)
+    os.replace(part_path, download_path)
+    return checksum
+
+
+def _fetch_stream(url, part_path, reporthook):
+    """Download a url to part_path over one connection, resuming if it exists
+
+    Returns:
+        str: md5 checksum of the downloaded file
+
+    """
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    try:
+        response = _open_url(url, start=offset if offset > 0 else None)
+    except urllib.error.HTTPError as exc:
+        # the part file is already complete
+        if exc.code == 416 and offset > 0:
+            return md5(part_path)
+        raise
+
+    with response:
+        content_range = _content_range(response) if response.status == 206 else None
+        if content_range is not None and content_range[0] == offset:
+            total = content_range[2]
+        else:
+            # the server ignored the range request, start over
+            offset = 0
+            length = response.headers.get("Content-Length")
+            total = int(length) if length is not None else None
+
+        hash_md5 = hashlib.md5()
+        if offset > 0:
+            with open(part_path, "rb") as fhandle:
+                for chunk in iter(lambda: fhandle.read(DOWNLOAD_CHUNK_SIZE), b""):
+                    hash_md5.update(chunk)
+
+        done = offset
+        with open(part_path, "ab" if offset > 0 else "wb") as fhandle:
+            if reporthook is not None:
+                reporthook(1, done, total)
+            for chunk in iter(lambda: response.read(DOWNLOAD_CHUNK_SIZE), b""):
+                fhandle.write(chunk)
+                hash_md5.update(chunk)
+                done += len(chunk)
+                if reporthook is not None:
+                    reporthook(1, done, total)
+
+    if total is not None and done < total:
+        raise urllib.error.ContentTooShortError(
+            "retrieval incomplete: got only {} out of {} bytes".format(done, total),
+            None,
+        )
+    return hash_md5.hexdigest()
+
+
+def _fetch_segments(url, part_path, state_path, segments, reporthook):
+    """Download [start, end, done] segments of a url in parallel into part_path"""
+    size = segments[-1][1]
+    lock = threading.Lock()
+    stop = threading.Event()
+    progress = {"done": sum(segment[2] for segment in segments), "unsaved": 0}
+
+    def save_state():
+        # the state lags behind the part file, so at worst a resumed
+        # download fetches some bytes again
+        with open(state_path, "w") as fhandle:
+            json.dump({"url": url, "segments": segments}, fhandle)
+        progress["unsaved"] = 0
+
+    def fetch_segment(segment):
+        start, end, done = segment
+        if start + done >= end:
+            return
+        with _open_url(url, start + done, end) as response:
+            content_range = _content_range(response) if response.status == 206 else None
+            if content_range is None or content_range[:2] != (start + done, end):
+                raise _RangesIgnored("{} does not support range requests".format(url))
+            with open(part_path, "r+b") as fhandle:
+                fhandle.seek(start + done)
+                while segment[0] + segment[2] < end:
+                    if stop.is_set():
+                        return
+                    remaining = end - segment[0] - segment[2]
+                    chunk = response.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        raise urllib.error.ContentTooShortError(
+                            "retrieval incomplete: segment {}-{} of {}".format(
+                                start, end, url
+                            ),
+                            None,
+                        )
+                    fhandle.write(chunk)
+                    fhandle.flush()
+                    with lock:
+                        segment[2] += len(chunk)
+                        progress["done"] += len(chunk)
+                        progress["unsaved"] += len(chunk)
+                        finished = segment[0] + segment[2] >= end
+                        if finished or progress["unsaved"] >= STATE_SAVE_INTERVAL:
+                            save_state()
+                        if reporthook is not None:
+                            reporthook(1, progress["done"], size)
+
+    with lock:
+        save_state()
+        if reporthook is not None:
+            reporthook(1, progress["done"], size)
+    pool = futures.ThreadPoolExecutor(max_workers=len(segments))
+    try:
+        jobs = [pool.submit(fetch_segment, segment) for segment in segments]
+        for job in futures.as_completed(jobs):
+            if job.exception() is not None:
+                stop.set()
+                raise job.exception()
+    finally:
+        stop.set()
+        pool.shutdown(wait=True)
+        with lock:
+            save_state()
+
+
+def read_stamp(file_path):
+    """Get the verified checksum of a file from its stamp
+
+    Args:
+        file_path (str): path of a downloaded file
+
+    Returns:
+        str or None: md5 checksum recorded when the file was verified, or None
+            if there is no stamp or the file changed since it was written
+
+    """
+    try:
+        with open(file_path + STAMP_EXT) as fhandle:
+            stamp = json.load(fhandle)
+        signature = stat_signature(file_path)
+    except (OSError, ValueError):
+        return None
+    if [stamp.get("size"), stamp.get("mtime_ns"), stamp.get("inode")] != list(
+        signature
+    ):
+        return None
+    return stamp.get("md5")
+
+
+def write_stamp(file_path, checksum):
+    """Record the verified checksum of a file in a stamp next to it
+
+    The stamp (``file_path + ".stamp"``) stores the file's size, mtime and
+    inode with its checksum, so later downloads skip hashing the file while
+    it is unchanged. Failing to write it (e.g. read-only directory) is not
+    an error.
+
+    Args:
+        file_path (str): path of a downloaded file
+        checksum (str): its verified md5 checksum
+
+    """
+    size, mtime_ns, inode = stat_signature(file_path)
+    stamp = {"size": size, "mtime_ns": mtime_ns, "inode": inode, "md5": checksum}
+    try:
+        with open(file_path + STAMP_EXT, "w") as fhandle:
+            json.dump(stamp, fhandle)
+    except OSError as exc:
+        logging.warning("Could not write {}: {}".format(file_path + STAMP_EXT, exc))
+
+
+def remove_stamp(file_path):
+    """Remove the stamp of a file, if any
+
+    Args:
+        file_path (str): path of a downloaded file
+
+    """
+    if os.path.exists(file_path + STAMP_EXT):
+        os.remove(file_path + STAMP_EXT)
+
+
+def _download_path(remote, save_dir):
+    """Get the path where a remote is saved, creating its directory if needed"""
+    if remote.destination_dir is None:
+        download_dir = save_dir
+    else:
+        download_dir = os.path.join(save_dir, remote.destination_dir)
+
+    if not os.path.exists(download_dir):
+        os.makedirs(download_dir)
+
+    return os.path.join(download_dir, remote.filename)
+
+
+def download_from_remote(
+    remote, save_dir, force_overwrite, progress=None, connections=1
+):
     """Download a remote dataset into path
     Fetch a dataset pointed by remote's url, save into path using remote's
     filename and ensure its integrity based on the MD5 Checksum of the
-    downloaded file.
+    downloaded file. Interrupted downloads are resumed, see `fetch`.
+    The checksum is computed while downloading, and recorded in a stamp
+    file, so existing files are not hashed again on later runs.
 
     Adapted from scikit-learn's sklearn.datasets.base._fetch_remote.
 
@@ -126,37 +697,49 @@ def download_from_remote(remote, save_dir, force_overwrite):
         force_overwrite  (bool):
             If True, overwrite existing file with the downloaded file.
             If False, does not overwrite, but checks that checksum is consistent.
+        progress (AggregateProgressBar or None): shared progress bar of
+            concurrent downloads. If None, the download has its own.
+        connections (int): number of parallel range requests used to
+            download large files, see `fetch`
 
     Returns:
         str: Full path of the created file.
 
-    """
-    if remote.destination_dir is None:
-        download_dir = save_dir
-    else:
-        download_dir = os.path.join(save_dir, remote.destination_dir)
-
-    if not os.path.exists(download_dir):
-        os.makedirs(download_dir)
+    Raises:
+        DownloadCancelled: if `progress` was cancelled during the download
 
-    download_path = os.path.join(download_dir, remote.filename)
+    """
+    download_path = _download_path(remote, save_dir)
 
+    checksum = None
     if not os.path.exists(download_path) or force_overwrite:
         # if we got here, we want to overwrite any existing file
         if os.path.exists(download_path):
             os.remove(download_path)
+        remove_stamp(download_path)
+        if force_overwrite:
+            for path in [download_path + PART_EXT, download_path + PART_EXT + ".json"]:
+                if os.path.exists(path):
+                    os.remove(path)
 
         # If file doesn't exist or we want to overwrite, download it
         with DownloadProgressBar(
-            unit="B", unit_scale=True, unit_divisor=1024, miniters=1
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            disable=progress is not None,
         ) as t:
             try:
-                urllib.request.urlretrieve(
+                checksum = fetch(
                     remote.url,
-                    filename=download_path,
-                    reporthook=t.update_to,
-                    data=None,
+                    download_path,
+                    reporthook=t.update_to if progress is None else progress.hook(),
+                    connections=connections,
                 )
+            except DownloadCancelled:
+                # the part file is kept, to resume the download later
+                raise
             except Exception as exc:
                 error_msg = """
                             mirdata failed to download the dataset from {}!
@@ -164,9 +747,7 @@ def download_from_remote(remote, save_dir, force_overwrite):
                             If this error persists, please raise an issue at
                             https://github.com/mir-dataset-loaders/mirdata,
                             and tag it with 'broken-link'.
-                            """.format(
-                    remote.url
-                )
+                            """.format(remote.url)
                 logging.error(error_msg)
                 raise exc
     else:
@@ -174,19 +755,34 @@ def download_from_remote(remote, save_dir, force_overwrite):
             "{} already exists and will not be downloaded. ".format(download_path)
             + "Rerun with force_overwrite=True to delete this file and force the download."
         )
+        checksum = read_stamp(download_path)
 
-    checksum = md5(download_path)
+    if checksum is None:
+        checksum = md5(download_path)
     if remote.checksum != checksum:
-
+        remove_stamp(download_path)
         raise IOError(
             "{} has an MD5 checksum ({}) "
             "differing from expected ({}), "
             "file may be corrupted.".format(download_path, checksum, remote.checksum)
         )
+    if read_stamp(download_path) != checksum:
+        write_stamp(download_path, checksum)
     return download_path
 
 
-def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup):
+def download_zip_file(
+    zip_remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    progress=None,
+    connections=1,
+    stream=False,
+    members=None,
+    extract_workers=1,
+    checksums=None,
+):
     """Download and unzip a zip file.
 
     Args:
@@ -198,55 +794,150 @@ def download_zip_file(zip_remote, save_dir, force_overwrite, cleanup):
             If True, overwrites existing files
         cleanup (bool):
             If True, remove zipfile after unziping
+        progress (AggregateProgressBar or None):
+            shared progress bar of concurrent downloads, see download_from_remote
+        connections (int):
+            number of parallel range requests, see download_from_remote
+        stream (bool):
+            If True and cleanup is True, the zip file is never saved in
+            save_dir: it is spooled in memory (or in a temporary file if it
+            is larger than SPOOL_MAX_SIZE) while it downloads, then checked
+            and extracted. Zip files cannot be extracted before they are
+            complete, since their member list is at the end.
+        members (set or None):
+            If given, only the members with these paths are extracted
+        extract_workers (int):
+            Number of members extracted at the same time
+        checksums (dict or None):
+            If given, filled with the md5 checksums of the extracted files,
+            see extractall_unicode
 
     """
-    zip_download_path = download_from_remote(zip_remote, save_dir, force_overwrite)
-    unzip(zip_download_path, cleanup=cleanup)
+    kwargs = {} if progress is None else {"progress": progress}
+    extract_kwargs = {} if members is None else {"members": members}
+    if extract_workers != 1:
+        extract_kwargs["workers"] = extract_workers
+    if checksums is not None:
+        extract_kwargs["checksums"] = checksums
+    if stream and cleanup and _can_stream(zip_remote, save_dir, force_overwrite):
+        stream_zip_file(zip_remote, save_dir, **kwargs, **extract_kwargs)
+        return
+    if connections != 1:
+        kwargs["connections"] = connections
+    zip_download_path = download_from_remote(
+        zip_remote, save_dir, force_overwrite, **kwargs
+    )
+    unzip(zip_download_path, cleanup=cleanup, **extract_kwargs)
 
 
-def extractall_unicode(zfile, out_dir):
+def extractall_unicode(zfile, out_dir, workers=1, members=None, checksums=None):
     """Extract all files inside a zip archive to a output directory.
 
-    In comparison to the zipfile, it checks for correct file name encoding
+    In comparison to the zipfile, it checks for correct file name encoding.
+    Members are streamed to disk in chunks of EXTRACT_CHUNK_SIZE bytes, so
+    memory use does not depend on their size.
 
     Args:
         zfile (obj): Zip file object created with zipfile.ZipFile
         out_dir (str): Output folder
+        workers (int): Number of members extracted at the same time
+        members (set or None): If given, only the members with these paths
+            are extracted
+        checksums (dict or None): If given, the md5 checksum of each
+            extracted file is computed while it is written, and stored in
+            checksums with the file's absolute path as key
 
     """
-    for m in zfile.infolist():
-        data = zfile.read(m)  # extract zipped data into memory
 
+    def file_name(m):
         if m.filename.encode("cp437").decode() != m.filename.encode("utf8").decode():
-            disk_file_name = os.path.join(out_dir, m.filename.encode("cp437").decode())
-        else:
-            disk_file_name = os.path.join(out_dir, m.filename)
+            return m.filename.encode("cp437").decode()
+        return m.filename
+
+    def extract(m):
+        disk_file_name = os.path.join(out_dir, file_name(m))
 
         dir_name = os.path.dirname(disk_file_name)
-        if not os.path.exists(dir_name):
-            os.makedirs(dir_name)
+        os.makedirs(dir_name, exist_ok=True)
 
         if not os.path.isdir(disk_file_name):
-            with open(disk_file_name, "wb") as fd:
-                fd.write(data)
+            with zfile.open(m) as source:
+                _write_member(source, disk_file_name, checksums)
+
+    infos = [m for m in zfile.infolist() if _selected(file_name(m), members)]
+    if workers > 1 and len(infos) > 1:
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            # consume the results to raise the first error
+            list(pool.map(extract, infos))
+    else:
+        for m in infos:
+            extract(m)
+
+
+def _write_member(source, disk_file_name, checksums=None):
+    """Write an archive member to disk in chunks of EXTRACT_CHUNK_SIZE bytes
+
+    Args:
+        source (file-like): the member's content
+        disk_file_name (str): path to write it to
+        checksums (dict or None): if given, the md5 checksum of what is
+            written is stored in it, with the absolute path as key
+
+    """
+    hash_md5 = hashlib.md5() if checksums is not None else None
+    with open(disk_file_name, "wb") as fd:
+        for chunk in iter(lambda: source.read(EXTRACT_CHUNK_SIZE), b""):
+            fd.write(chunk)
+            if hash_md5 is not None:
+                hash_md5.update(chunk)
+    if checksums is not None:
+        checksums[os.path.abspath(disk_file_name)] = hash_md5.hexdigest()
+
 
+def _selected(member_name, members):
+    """Check if an archive member is in a set of paths (or if there is no set)"""
+    return members is None or os.path.normpath(member_name) in members
 
-def unzip(zip_path, cleanup):
+
+def unzip(zip_path, cleanup, workers=1, members=None, checksums=None):
     """Unzip a zip file inside it's current directory.
 
     Args:
         zip_path (str): Path to zip file
         cleanup (bool): If True, remove zipfile after unzipping
+        workers (int): Number of members extracted at the same time
+        members (set or None): If given, only the members with these paths
+            are extracted
+        checksums (dict or None): If given, filled with the md5 checksums of
+            the extracted files, see extractall_unicode
 
     """
     zfile = zipfile.ZipFile(zip_path, "r")
-    extractall_unicode(zfile, os.path.dirname(zip_path))
+    extractall_unicode(
+        zfile,
+        os.path.dirname(zip_path),
+        workers=workers,
+        members=members,
+        checksums=checksums,
+    )
     zfile.close()
     if cleanup:
         os.remove(zip_path)
+        remove_stamp(zip_path)
 
 
-def download_tar_file(tar_remote, save_dir, force_overwrite, cleanup):
+def download_tar_file(
+    tar_remote,
+    save_dir,
+    force_overwrite,
+    cleanup,
+    progress=None,
+    connections=1,
+    stream=False,
+    members=None,
+    extract_workers=1,
+    checksums=None,
+):
     """Download and untar a tar file.
 
     Args:
@@ -254,22 +945,338 @@ def download_tar_file(tar_remote, save_dir, force_overwrite, cleanup):
         save_dir (str): Path to save downloaded file
         force_overwrite (bool): If True, overwrites existing files
         cleanup (bool): If True, remove tarfile after untarring
+        progress (AggregateProgressBar or None): shared progress bar of
+            concurrent downloads, see download_from_remote
+        connections (int): number of parallel range requests, see
+            download_from_remote
+        stream (bool): If True, the tar file is extracted while it downloads,
+            see stream_tar_file. Ignored if the tar file (or part of it) was
+            already downloaded.
+        members (set or None): if given, only the members with these paths
+            are extracted
+        extract_workers (int): number of processes decompressing a tar.bz2
+            or tar.gz file, see untar. Not used when streaming.
+        checksums (dict or None): if given, filled with the md5 checksums of
+            the extracted files, see untar
+
+    """
+    kwargs = {} if progress is None else {"progress": progress}
+    extract_kwargs = {} if members is None else {"members": members}
+    if checksums is not None:
+        extract_kwargs["checksums"] = checksums
+    if stream and _can_stream(tar_remote, save_dir, force_overwrite):
+        stream_tar_file(tar_remote, save_dir, cleanup, **kwargs, **extract_kwargs)
+        return
+    if extract_workers != 1:
+        extract_kwargs["workers"] = extract_workers
+    if connections != 1:
+        kwargs["connections"] = connections
+    tar_download_path = download_from_remote(
+        tar_remote, save_dir, force_overwrite, **kwargs
+    )
+    untar(tar_download_path, cleanup=cleanup, **extract_kwargs)
+
+
+class _HashingReader(object):
+    """File-like wrapper of a response which hashes what is read from it
+
+    Args:
+        response (file-like): object to read from
+        total (int or None): expected number of bytes
+        reporthook (function or None): called as ``reporthook(1, done, total)``
+        copy (file-like or None): if given, what is read is also written to it
+
+    """
+
+    def __init__(self, response, total=None, reporthook=None, copy=None):
+        self.response = response
+        self.total = total
+        self.reporthook = reporthook
+        self.copy = copy
+        self.done = 0
+        self.hash_md5 = hashlib.md5()
+        if reporthook is not None:
+            reporthook(1, 0, total)
+
+    def read(self, size=-1):
+        chunk = self.response.read(size)
+        self.hash_md5.update(chunk)
+        if self.copy is not None:
+            self.copy.write(chunk)
+        self.done += len(chunk)
+        if self.reporthook is not None:
+            self.reporthook(1, self.done, self.total)
+        return chunk
+
+    def drain(self):
+        """Read what is left in the response, e.g. padding after the end of an archive"""
+        while self.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        if self.total is not None and self.done < self.total:
+            raise urllib.error.ContentTooShortError(
+                "retrieval incomplete: got only {} out of {} bytes".format(
+                    self.done, self.total
+                ),
+                None,
+            )
+
+    def hexdigest(self):
+        return self.hash_md5.hexdigest()
+
+
+def _can_stream(remote, save_dir, force_overwrite):
+    """Check if a remote can be extracted while it downloads
+
+    It cannot if it is already downloaded (unless force_overwrite, in which
+    case the existing download is removed) or if a partial download exists,
+    which is resumed instead.
+
+    """
+    download_path = _download_path(remote, save_dir)
+    if force_overwrite:
+        for path in [
+            download_path,
+            download_path + PART_EXT,
+            download_path + PART_EXT + ".json",
+        ]:
+            if os.path.exists(path):
+                os.remove(path)
+        remove_stamp(download_path)
+    return not os.path.exists(download_path) and not os.path.exists(
+        download_path + PART_EXT
+    )
+
+
+def _check_stream(reader, remote, download_path):
+    """Raise an IOError if a streamed remote does not match its checksum"""
+    checksum = reader.hexdigest()
+    if remote.checksum != checksum:
+        raise IOError(
+            "{} has an MD5 checksum ({}) "
+            "differing from expected ({}), "
+            "file may be corrupted.".format(download_path, checksum, remote.checksum)
+        )
+    return checksum
+
+
+def _move_tree(source_dir, target_dir):
+    """Move the content of source_dir into target_dir, replacing existing files"""
+    for name in os.listdir(source_dir):
+        source = os.path.join(source_dir, name)
+        target = os.path.join(target_dir, name)
+        if os.path.isdir(source) and os.path.isdir(target):
+            _move_tree(source, target)
+        else:
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.replace(source, target)
+
+
+def stream_tar_file(
+    tar_remote, save_dir, cleanup, progress=None, members=None, checksums=None
+):
+    """Download a tar file and extract it on the fly
+
+    Members are extracted from the HTTP stream as it arrives, while its md5
+    checksum is computed, into a temporary directory next to the tar file.
+    They are moved in place only once the whole stream matches the checksum,
+    so nothing is left behind if it does not.
+
+    Args:
+        tar_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save downloaded file
+        cleanup (bool): If True, the tar file is never written to disk.
+            Otherwise it is saved (and stamped) as with download_from_remote.
+        progress (AggregateProgressBar or None): shared progress bar of
+            concurrent downloads, see download_from_remote
+        members (set or None): if given, only the members with these paths
+            are extracted
+        checksums (dict or None): if given, filled with the md5 checksums of
+            the extracted files (at their final paths), see untar
+
+    Raises:
+        IOError: if the download fails or does not match the checksum
+        DownloadCancelled: if `progress` was cancelled during the download
+
+    """
+    download_path = _download_path(tar_remote, save_dir)
+    download_dir = os.path.dirname(download_path)
+    part_path = None if cleanup else download_path + PART_EXT
+    staging_dir = tempfile.mkdtemp(prefix=".extracting-", dir=download_dir)
+    staged = None if checksums is None else {}
+    try:
+        with DownloadProgressBar(
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            disable=progress is not None,
+        ) as t, _open_url(tar_remote.url) as response:
+            length = response.headers.get("Content-Length")
+            copy = open(part_path, "wb") if part_path is not None else None
+            try:
+                reader = _HashingReader(
+                    response,
+                    total=int(length) if length is not None else None,
+                    reporthook=t.update_to if progress is None else progress.hook(),
+                    copy=copy,
+                )
+                try:
+                    with tarfile.open(fileobj=reader, mode="r|*") as tfile:
+                        _extract_tar(tfile, staging_dir, members, staged)
+                except (tarfile.TarError, EOFError, OSError):
+                    # report a corrupted download as a checksum mismatch
+                    reader.drain()
+                    _check_stream(reader, tar_remote, download_path)
+                    raise
+                reader.drain()
+            finally:
+                if copy is not None:
+                    copy.close()
+        checksum = _check_stream(reader, tar_remote, download_path)
+        _move_tree(staging_dir, download_dir)
+        if checksums is not None:
+            staging_root = os.path.abspath(staging_dir)
+            for path, member_checksum in staged.items():
+                target = os.path.join(
+                    os.path.abspath(download_dir), os.path.relpath(path, staging_root)
+                )
+                checksums[target] = member_checksum
+    except Exception:
+        if part_path is not None and os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    if part_path is not None:
+        os.replace(part_path, download_path)
+        write_stamp(download_path, checksum)
+
+
+def stream_zip_file(
+    zip_remote, save_dir, progress=None, members=None, workers=1, checksums=None
+):
+    """Download a zip file without saving it, and extract it
+
+    The zip file is spooled in memory, or in a temporary file in save_dir if
+    it is larger than SPOOL_MAX_SIZE, while its md5 checksum is computed. It
+    is extracted only if it matches the checksum.
+
+    Args:
+        zip_remote (RemoteFileMetadata): Object containing download information
+        save_dir (str): Path to save downloaded file
+        progress (AggregateProgressBar or None): shared progress bar of
+            concurrent downloads, see download_from_remote
+        members (set or None): if given, only the members with these paths
+            are extracted
+        workers (int): number of members extracted at the same time
+        checksums (dict or None): if given, filled with the md5 checksums of
+            the extracted files, see extractall_unicode
+
+    Raises:
+        IOError: if the download fails or does not match the checksum
+        DownloadCancelled: if `progress` was cancelled during the download
 
     """
-    tar_download_path = download_from_remote(tar_remote, save_dir, force_overwrite)
-    untar(tar_download_path, cleanup=cleanup)
+    download_path = _download_path(zip_remote, save_dir)
+    download_dir = os.path.dirname(download_path)
+    with tempfile.SpooledTemporaryFile(
+        max_size=SPOOL_MAX_SIZE, dir=download_dir
+    ) as spool:
+        with DownloadProgressBar(
+            unit="B",
+            unit_scale=True,
+            unit_divisor=1024,
+            miniters=1,
+            disable=progress is not None,
+        ) as t, _open_url(zip_remote.url) as response:
+            length = response.headers.get("Content-Length")
+            reader = _HashingReader(
+                response,
+                total=int(length) if length is not None else None,
+                reporthook=t.update_to if progress is None else progress.hook(),
+                copy=spool,
+            )
+            reader.drain()
+        _check_stream(reader, zip_remote, download_path)
+        spool.seek(0)
+        with zipfile.ZipFile(spool, "r") as zfile:
+            extractall_unicode(
+                zfile,
+                download_dir,
+                workers=workers,
+                members=members,
+                checksums=checksums,
+            )
+
 
+def _extract_tar(tfile, out_dir, members=None, checksums=None):
+    """Extract a tar file member by member, optionally only some members
 
-def untar(tar_path, cleanup):
+    Works with tar files opened in stream mode. If checksums is given, regular
+    files are written (and hashed) by _write_member rather than by tarfile.
+
+    """
+    if members is None and checksums is None:
+        tfile.extractall(out_dir)
+        return
+    for member in tfile:
+        if not _selected(member.name, members):
+            continue
+        if checksums is None or not member.isreg():
+            tfile.extract(member, out_dir)
+            continue
+        disk_file_name = os.path.join(out_dir, member.name)
+        os.makedirs(os.path.dirname(disk_file_name), exist_ok=True)
+        with tfile.extractfile(member) as source:
+            _write_member(source, disk_file_name, checksums)
+        tfile.chmod(member, disk_file_name)
+        tfile.utime(member, disk_file_name)
+
+
+def untar(tar_path, cleanup, members=None, workers=1, checksums=None):
     """Untar a tar file inside it's current directory.
 
     Args:
         tar_path (str): Path to tar file
         cleanup (bool): If True, remove tarfile after untarring
+        members (set or None): If given, only the members with these paths
+            are extracted
+        workers (int): If more than 1, bzip2 and gzip compressed tar files
+            are decompressed block by block in a pool of this many processes
+            (see decompress.open_decompressed). If that fails, the tar file
+            is extracted again with tarfile alone.
+        checksums (dict or None): If given, the md5 checksum of each
+            extracted file is computed while it is written, and stored in
+            checksums with the file's absolute path as key
 
     """
-    tfile = tarfile.open(tar_path, "r")
-    tfile.extractall(os.path.dirname(tar_path))
-    tfile.close()
+    out_dir = os.path.dirname(tar_path)
+    extracted = False
+    if workers > 1 and decompress.compression(tar_path) is not None:
+        try:
+            with decompress.open_decompressed(tar_path, workers) as fileobj:
+                with tarfile.open(fileobj=fileobj, mode="r|") as tfile:
+                    _extract_tar(tfile, out_dir, members, checksums)
+            extracted = True
+        except (IOError, tarfile.TarError) as exc:
+            logging.warning(
+                "Parallel decompression of {} failed ({}), "
+                "extracting it with tarfile".format(tar_path, exc)
+            )
+
+    if not extracted:
+        tfile = tarfile.open(tar_path, "r")
+        if checksums is not None:
+            _extract_tar(tfile, out_dir, members, checksums)
+        elif members is None:
+            tfile.extractall(out_dir)
+        else:
+            tfile.extractall(
+                out_dir, members=[m for m in tfile if _selected(m.name, members)]
+            )
+        tfile.close()
     if cleanup:
         os.remove(tar_path)
+        remove_stamp(tar_path)
@@ -0,0 +1,403 @@
+"""Utilities for compiled, memory-mapped dataset indexes.
+
+The JSON indexes in ``mirdata/datasets/indexes`` are compiled once into a
+binary file (``<name>-<hash of the json path>.mdx``) in a per-user cache
+folder, `INDEX_CACHE_DIR`, so nothing is written in the installed package.
+The compiled file is memory-mapped, and track/metadata lookups decode only the entry that is asked
+for, so opening an index costs the same regardless of how many tracks it has.
+
+Compiled file layout (all integers little-endian)::
+
+    magic (8 bytes) | header size (u64) | header (json, padded to 8 bytes)
+    for each section:
+        key offsets (u64 * (n + 1)) | keys (utf-8, sorted)
+        record offsets (u64 * (n + 1)) | records
+        order (u32 * n)
+
+Keys of a section are sorted to allow binary search, and ``order`` stores the
+original (JSON) order used when iterating.
+
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+MAGIC = b"MIRIDX02"
+COMPILED_INDEX_EXT = ".mdx"
+INDEX_CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.getenv("HOME", "/tmp"), ".cache")),
+    "mirdata",
+    "indexes",
+)
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_NONE = 0xFFFFFFFF
+
+# section kinds. File entries may have a third element, the size in bytes.
+_FILES = "files"  # {file_key: [path, checksum]}, e.g. index["tracks"]
+_FILE = "file"  # [path, checksum], e.g. index["metadata"]
+_JSON = "json"  # anything else, stored as json
+
+
+def compiled_index_path(json_path):
+    """Get the path of the compiled index corresponding to a json index
+
+    Compiled indexes live in `INDEX_CACHE_DIR`. Their name includes a hash of
+    the json index's absolute path, so indexes with the same file name in
+    different folders (e.g. two installations) do not collide.
+
+    Args:
+        json_path (str): path to a json index
+
+    Returns:
+        str: path to the compiled index
+
+    """
+    name = os.path.splitext(os.path.basename(json_path))[0]
+    path_hash = hashlib.sha1(os.path.abspath(json_path).encode("utf-8")).hexdigest()
+    return os.path.join(
+        INDEX_CACHE_DIR, "{}-{}{}".format(name, path_hash[:16], COMPILED_INDEX_EXT)
+    )
+
+
+def _is_file_entry(value):
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) in (2, 3)
+        and all(v is None or isinstance(v, str) for v in value[:2])
+        and (
+            len(value) == 2
+            or value[2] is None
+            or (isinstance(value[2], int) and value[2] >= 0)
+        )
+    )
+
+
+def _section_kind(section):
+    values = section.values()
+    if all(_is_file_entry(v) for v in values):
+        return _FILE
+    if all(
+        isinstance(v, dict) and all(_is_file_entry(f) for f in v.values())
+        for v in values
+    ):
+        return _FILES
+    return _JSON
+
+
+def _pack_str(value):
+    if value is None:
+        return _U32.pack(_NONE)
+    encoded = value.encode("utf-8")
+    return _U32.pack(len(encoded)) + encoded
+
+
+def _pack_entry(entry):
+    # -2: the entry has no size, -1: the size is None
+    if len(entry) == 2:
+        size = -2
+    else:
+        size = -1 if entry[2] is None else entry[2]
+    return _pack_str(entry[0]) + _pack_str(entry[1]) + _I64.pack(size)
+
+
+def _pack_record(kind, value, field_ids):
+    if kind == _FILE:
+        return _pack_entry(value)
+    if kind == _FILES:
+        parts = [_U16.pack(len(value))]
+        for field, entry in value.items():
+            parts.append(_U16.pack(field_ids[field]))
+            parts.append(_pack_entry(entry))
+        return b"".join(parts)
+    return json.dumps(value).encode("utf-8")
+
+
+def _pad(size):
+    return b"\x00" * (-size % 8)
+
+
+def _pack_offsets(chunks, fmt=_U64):
+    offsets = [0]
+    for chunk in chunks:
+        offsets.append(offsets[-1] + len(chunk))
+    return b"".join(fmt.pack(o) for o in offsets)
+
+
+def compile_index(json_path, compiled_path=None):
+    """Compile a json index into a memory-mappable binary index
+
+    Args:
+        json_path (str): path to a json index
+        compiled_path (str or None): where to write the compiled index.
+            If None, it is written in `INDEX_CACHE_DIR` (see
+            compiled_index_path).
+
+    Returns:
+        str: path to the compiled index
+
+    """
+    if compiled_path is None:
+        compiled_path = compiled_index_path(json_path)
+
+    with open(json_path) as fhandle:
+        index = json.load(fhandle)
+    stat = os.stat(json_path)
+
+    values = {}
+    sections = {}
+    fields = []
+    field_ids = {}
+    body = []
+    position = 0
+
+    for name, section in index.items():
+        if not isinstance(section, dict):
+            values[name] = section
+            continue
+
+        kind = _section_kind(section)
+        if kind == _FILES:
+            for entry in section.values():
+                for field in entry:
+                    if field not in field_ids:
+                        field_ids[field] = len(fields)
+                        fields.append(field)
+
+        encoded_keys = [k.encode("utf-8") for k in section]
+        sorted_pos = sorted(range(len(encoded_keys)), key=encoded_keys.__getitem__)
+        records = list(section.values())
+        keys = [encoded_keys[i] for i in sorted_pos]
+        packed = [_pack_record(kind, records[i], field_ids) for i in sorted_pos]
+        rank = [0] * len(sorted_pos)
+        for sorted_i, original_i in enumerate(sorted_pos):
+            rank[original_i] = sorted_i
+
+        info = {"kind": kind, "length": len(keys)}
+        blocks = [
+            ("key_offsets", _pack_offsets(keys)),
+            ("keys", b"".join(keys)),
+            ("record_offsets", _pack_offsets(packed)),
+            ("records", b"".join(packed)),
+            ("order", b"".join(_U32.pack(r) for r in rank)),
+        ]
+        for block_name, block in blocks:
+            info[block_name] = position
+            body.append(block + _pad(len(block)))
+            position += len(body[-1])
+        sections[name] = info
+
+    header = {
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns},
+        "order": list(index.keys()),
+        "values": values,
+        "fields": fields,
+        "sections": sections,
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += _pad(len(header_bytes))
+
+    # write atomically so concurrent readers never see a partial file
+    os.makedirs(os.path.dirname(os.path.abspath(compiled_path)), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(compiled_path, os.getpid())
+    try:
+        with open(tmp_path, "wb") as fhandle:
+            fhandle.write(MAGIC)
+            fhandle.write(_U64.pack(len(header_bytes)))
+            fhandle.write(header_bytes)
+            for block in body:
+                fhandle.write(block)
+        os.replace(tmp_path, compiled_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return compiled_path
+
+
+class IndexSection(Mapping):
+    """A read-only mapping over one section (e.g. ``tracks``) of a compiled index
+
+    Entries are decoded from the memory-mapped buffer on access.
+
+    """
+
+    def __init__(self, buffer, base, info, fields):
+        self._buffer = buffer
+        self._kind = info["kind"]
+        self._length = info["length"]
+        self._fields = fields
+        self._key_offsets = base + info["key_offsets"]
+        self._keys = base + info["keys"]
+        self._record_offsets = base + info["record_offsets"]
+        self._records = base + info["records"]
+        self._order = base + info["order"]
+
+    def _span(self, offsets, i):
+        start = _U64.unpack_from(self._buffer, offsets + 8 * i)[0]
+        end = _U64.unpack_from(self._buffer, offsets + 8 * (i + 1))[0]
+        return start, end
+
+    def _key(self, i):
+        start, end = self._span(self._key_offsets, i)
+        return self._buffer[self._keys + start : self._keys + end]
+
+    def _find(self, key):
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        low, high = 0, self._length
+        while low < high:
+            mid = (low + high) // 2
+            if self._key(mid) < target:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._length and self._key(low) == target:
+            return low
+        return -1
+
+    def _read_str(self, pos):
+        size = _U32.unpack_from(self._buffer, pos)[0]
+        pos += 4
+        if size == _NONE:
+            return None, pos
+        return self._buffer[pos : pos + size].decode("utf-8"), pos + size
+
+    def _read_entry(self, pos):
+        path, pos = self._read_str(pos)
+        checksum, pos = self._read_str(pos)
+        size = _I64.unpack_from(self._buffer, pos)[0]
+        pos += 8
+        if size == -2:
+            return [path, checksum], pos
+        return [path, checksum, None if size == -1 else size], pos
+
+    def _record(self, i):
+        start, end = self._span(self._record_offsets, i)
+        pos = self._records + start
+        if self._kind == _FILE:
+            return self._read_entry(pos)[0]
+        if self._kind == _FILES:
+            n_fields = _U16.unpack_from(self._buffer, pos)[0]
+            pos += 2
+            record = {}
+            for _ in range(n_fields):
+                field = self._fields[_U16.unpack_from(self._buffer, pos)[0]]
+                record[field], pos = self._read_entry(pos + 2)
+            return record
+        return json.loads(self._buffer[pos : self._records + end].decode("utf-8"))
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._record(i)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for n in range(self._length):
+            i = _U32.unpack_from(self._buffer, self._order + 4 * n)[0]
+            yield self._key(i).decode("utf-8")
+
+    def __len__(self):
+        return self._length
+
+
+class CompiledIndex(Mapping):
+    """A read-only, memory-mapped dataset index
+
+    Behaves like the dictionary obtained by loading the json index, e.g.
+    ``index["tracks"][track_id]`` returns ``{file_key: [path, checksum]}``,
+    or ``{file_key: [path, checksum, size]}`` if the index has file sizes.
+
+    Attributes:
+        path (str): path to the compiled index file
+
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fhandle:
+            self._buffer = mmap.mmap(fhandle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._buffer[: len(MAGIC)] != MAGIC:
+            raise IOError("{} is not a compiled mirdata index".format(path))
+        header_size = _U64.unpack_from(self._buffer, len(MAGIC))[0]
+        start = len(MAGIC) + 8
+        self._header = json.loads(
+            self._buffer[start : start + header_size].rstrip(b"\x00").decode("utf-8")
+        )
+        base = start + header_size
+        self._sections = {
+            name: IndexSection(self._buffer, base, info, self._header["fields"])
+            for name, info in self._header["sections"].items()
+        }
+
+    @property
+    def source(self):
+        """dict: size and mtime_ns of the json index this was compiled from"""
+        return self._header["source"]
+
+    def __getitem__(self, key):
+        if key in self._sections:
+            return self._sections[key]
+        return self._header["values"][key]
+
+    def __iter__(self):
+        return iter(self._header["order"])
+
+    def __len__(self):
+        return len(self._header["order"])
+
+    def __reduce__(self):
+        return (CompiledIndex, (self.path,))
+
+
+def load_index(json_path):
+    """Load a dataset index, compiling it first if needed
+
+    If the compiled index is missing or out of date with respect to the json
+    index, it is (re)compiled into `INDEX_CACHE_DIR`. If it cannot be written
+    there, the json index is loaded instead.
+
+    Args:
+        json_path (str): path to a json index
+
+    Returns:
+        CompiledIndex or dict: the dataset index
+
+    """
+    compiled_path = compiled_index_path(json_path)
+    json_exists = os.path.isfile(json_path)
+
+    if os.path.isfile(compiled_path):
+        try:
+            index = CompiledIndex(compiled_path)
+        except (IOError, ValueError):
+            index = None
+        if index is not None:
+            if not json_exists:
+                return index
+            stat = os.stat(json_path)
+            if index.source == {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}:
+                return index
+
+    try:
+        return CompiledIndex(compile_index(json_path, compiled_path))
+    except OSError:
+        logging.info(
+            "Could not write compiled index {}, loading {}".format(
+                compiled_path, json_path
+            )
+        )
+        with open(json_path) as fhandle:
+            return json.load(fhandle)
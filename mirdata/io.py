@@ -1,22 +1,79 @@
+import contextlib
 import functools
 import io
-from typing import BinaryIO, Callable, Optional, TextIO, TypeVar, Union
+import os
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Iterator,
+    Optional,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import numpy as np
+
+from mirdata import lazy
+
+librosa = lazy.import_module("librosa")
+sf = lazy.import_module("soundfile")
+soxr = lazy.import_module("soxr")
 
 T = TypeVar("T")  # Can be anything
 
 
+class _AudioOptions(threading.local):
+    """The options set by `audio_options`, separately in each thread"""
+
+    def __init__(self):
+        self.options: dict = {}
+
+    def get(self) -> dict:
+        return self.options
+
+
+# options used by load_audio, set per track by the dataset (see audio_options)
+_AUDIO_OPTIONS = _AudioOptions()
+
+# resampler quality tiers, from slowest to fastest, and the librosa res_type
+# they correspond to. Any other res_type supported by librosa can also be used.
+RESAMPLE_QUALITY = {
+    "best": "soxr_vhq",
+    "high": "soxr_hq",
+    "medium": "soxr_mq",
+    "fast": "soxr_lq",
+}
+
+# the res_type of each tier with librosa < 0.10, which has no soxr resamplers
+RESAMPY_QUALITY = {
+    "best": "kaiser_best",
+    "high": "kaiser_best",
+    "medium": "kaiser_fast",
+    "fast": "kaiser_fast",
+}
+
+# number of frames read from the audio file at a time when streaming
+STREAM_READ_SIZE = 65536
+
+
 def coerce_to_string_io(
-    func: Callable[[TextIO], T]
+    func: Callable[[TextIO], T],
 ) -> Callable[[Optional[Union[str, TextIO]]], Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, TextIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, TextIO]], *args: Any, **kwargs: Any
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
             with open(file_path_or_obj) as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.StringIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -28,17 +85,19 @@ def coerce_to_string_io(
 
 
 def coerce_to_bytes_io(
-    func: Callable[[BinaryIO], T]
+    func: Callable[[BinaryIO], T],
 ) -> Callable[[Optional[Union[str, BinaryIO]]], Optional[T]]:
     @functools.wraps(func)
-    def wrapper(file_path_or_obj: Optional[Union[str, BinaryIO]]) -> Optional[T]:
+    def wrapper(
+        file_path_or_obj: Optional[Union[str, BinaryIO]], *args: Any, **kwargs: Any
+    ) -> Optional[T]:
         if not file_path_or_obj:
             return None
         if isinstance(file_path_or_obj, str):
             with open(file_path_or_obj, "rb") as f:
-                return func(f)
+                return func(f, *args, **kwargs)
         elif isinstance(file_path_or_obj, io.BytesIO):
-            return func(file_path_or_obj)
+            return func(file_path_or_obj, *args, **kwargs)
         else:
             raise ValueError(
                 "Invalid argument passed to {}, argument has the type {}",
@@ -47,3 +106,444 @@ def coerce_to_bytes_io(
             )
 
     return wrapper
+
+
+@contextlib.contextmanager
+def audio_options(**options: Any):
+    """Set the options used by `load_audio` within a block of code
+
+    Tracks enter this context with their dataset's options when loading audio,
+    but it can also be used directly around any ``load_audio`` function.
+
+    Example:
+        .. code-block:: python
+
+            from mirdata import cache, io
+            from mirdata.datasets import beatles
+
+            with io.audio_options(audio_cache=cache.AudioCache()):
+                audio, sr = beatles.load_audio(audio_path)
+
+    Args:
+        audio_cache (cache.AudioCache or None): cache of decoded audio
+        file_checksums (dict or None): {absolute path: checksum} of the audio
+            files in the dataset's index, used as audio cache keys. Files
+            which are not in it are hashed by the cache
+        sample_rate (float or None): if not None, audio is decoded at this
+            sample rate instead of the loader's
+        mono (bool or None): if True, audio is downmixed to mono. If False, audio
+            always has shape (n_channels, n_samples). Applied by `conform_audio`
+        resample_quality (str or None): resampler used when audio is resampled,
+            one of the keys of `RESAMPLE_QUALITY` or a librosa ``res_type``
+        offset (float): if set, audio is read starting at this time (in seconds),
+            instead of the loader's offset
+        duration (float or None): if set, only this much audio is read (in
+            seconds), instead of the loader's duration. None reads until the end
+
+    """
+    previous = _AUDIO_OPTIONS.options
+    _AUDIO_OPTIONS.options = dict(previous, **options)
+    try:
+        yield
+    finally:
+        _AUDIO_OPTIONS.options = previous
+
+
+def load_audio(
+    file_path_or_obj: Union[str, BinaryIO],
+    sr: Optional[float] = 22050,
+    mono: bool = True,
+    dtype: Any = np.float32,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+) -> Tuple[np.ndarray, float]:
+    """Decode an audio file with librosa, using the current `audio_options`
+
+    This is the function used by the datasets' ``load_audio`` functions.
+    The ``sample_rate``, ``offset`` and ``duration`` options, if set, replace
+    the corresponding arguments.
+
+    When reading part of a file, formats supported by soundfile (e.g. wav,
+    flac, ogg) are seeked to `offset` instead of being decoded from the start.
+
+    If an audio cache is set and the audio is a file on disk, the whole file
+    is decoded (and resampled) once and stored in the cache, and segments are
+    read from the memory-mapped (copy-on-write) cache entry.
+
+    Args:
+        file_path_or_obj (str or file-like): path to an audio file or file-like object
+        sr (float or None): target sample rate. If None, uses the native sample rate
+        mono (bool): if True, downmix to mono
+        dtype (numpy.dtype): data type of the audio samples
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only load up to this much audio (in seconds).
+            If None, load until the end of the file
+
+    Returns:
+        * np.ndarray - the audio signal
+        * float - the sample rate of the audio signal
+
+    """
+    options = _AUDIO_OPTIONS.get()
+    if options.get("sample_rate") is not None:
+        sr = options["sample_rate"]
+    offset = options.get("offset", offset)
+    duration = options.get("duration", duration)
+    res_type = resample_type(options.get("resample_quality"))
+    kwargs = {} if res_type is None else {"res_type": res_type}
+
+    def decode(offset=0.0, duration=None):
+        return librosa.load(
+            file_path_or_obj,
+            sr=sr,
+            mono=mono,
+            dtype=dtype,
+            offset=offset,
+            duration=duration,
+            **kwargs
+        )
+
+    audio_cache = options.get("audio_cache")
+    if audio_cache is not None:
+        path = (
+            file_path_or_obj
+            if isinstance(file_path_or_obj, str)
+            else getattr(file_path_or_obj, "name", None)
+        )
+        if isinstance(path, str):
+            file_checksums = options.get("file_checksums") or {}
+            audio, sample_rate = audio_cache.load(
+                path,
+                sr,
+                mono,
+                dtype,
+                decode,
+                res_type=res_type,
+                checksum=file_checksums.get(os.path.abspath(path)),
+            )
+            return crop_audio(audio, sample_rate, offset, duration), sample_rate
+    return decode(offset, duration)
+
+
+def crop_audio(
+    audio: np.ndarray, sr: float, offset: float = 0.0, duration: Optional[float] = None
+) -> np.ndarray:
+    """Get a segment of an audio signal
+
+    Args:
+        audio (np.ndarray): audio signal, with time as the last dimension
+        sr (float): sample rate of the audio signal
+        offset (float): start time of the segment (in seconds)
+        duration (float or None): duration of the segment (in seconds).
+            If None, the segment lasts until the end of the signal
+
+    Returns:
+        np.ndarray: the segment (a view of `audio`)
+
+    """
+    start = int(np.round(offset * sr))
+    stop = None if duration is None else start + int(np.round(duration * sr))
+    return audio[..., start:stop]
+
+
+def resample_type(resample_quality: Optional[str]) -> Optional[str]:
+    """Get the librosa ``res_type`` corresponding to a resampler quality tier
+
+    The tiers use soxr resamplers, or resampy ones (see `RESAMPY_QUALITY`) if
+    the installed librosa is older than 0.10.
+
+    Args:
+        resample_quality (str or None): one of the keys of `RESAMPLE_QUALITY`,
+            a librosa ``res_type``, or None for librosa's default
+
+    Returns:
+        str or None: the librosa ``res_type``
+
+    """
+    tiers = RESAMPLE_QUALITY if _librosa_has_soxr() else RESAMPY_QUALITY
+    return tiers.get(resample_quality, resample_quality)
+
+
+@functools.lru_cache(maxsize=None)
+def _librosa_has_soxr() -> bool:
+    """Check if librosa supports the soxr resamplers (librosa >= 0.10)"""
+    version = tuple(int(v) for v in librosa.__version__.split(".")[:2])
+    return version >= (0, 10)
+
+
+def conform_audio(
+    audio: Optional[Tuple[np.ndarray, float]],
+    sample_rate: Optional[float] = None,
+    mono: Optional[bool] = None,
+    resample_quality: Optional[str] = None,
+) -> Optional[Tuple[np.ndarray, float]]:
+    """Make the output of an audio loader follow a sample rate and channel layout
+
+    Args:
+        audio (tuple or None): (audio signal, sample rate), as returned by a loader
+        sample_rate (float or None): target sample rate. If None, keep the sample rate
+        mono (bool or None): if True, downmix to shape (n_samples,). If False,
+            reshape mono audio to (1, n_samples). If None, keep the channels
+        resample_quality (str or None): resampler quality, see `resample_type`
+
+    Returns:
+        tuple or None: (audio signal, sample rate)
+
+    """
+    if audio is None:
+        return None
+    signal, sr = audio
+    if mono and signal.ndim > 1:
+        signal = librosa.to_mono(signal)
+    elif mono is False and signal.ndim == 1:
+        signal = signal[np.newaxis, :]
+    if sample_rate is not None and sr != sample_rate:
+        res_type = resample_type(resample_quality)
+        kwargs = {} if res_type is None else {"res_type": res_type}
+        signal = librosa.resample(
+            np.asarray(signal), orig_sr=sr, target_sr=sample_rate, **kwargs
+        )
+        sr = sample_rate
+    return signal, sr
+
+
+class AudioStream(object):
+    """An iterable over fixed-size blocks of an audio file
+
+    The file is only opened when iterating, and it is read, decoded (and
+    resampled) a chunk at a time, so memory use depends on the block size but
+    not on the length of the file. Each iteration reads the file again.
+
+    Streaming is supported for the formats soundfile can read (e.g. wav,
+    flac, ogg and, with recent versions of libsndfile, mp3).
+
+    Attributes:
+        block_size (int): number of samples in each block
+        hop (int): number of samples between the starts of consecutive blocks
+
+    """
+
+    def __init__(
+        self,
+        file_path_or_obj: Union[str, BinaryIO],
+        block_size: int,
+        hop: Optional[int] = None,
+        sr: Optional[float] = None,
+        mono: bool = True,
+        dtype: Any = np.float32,
+        offset: float = 0.0,
+        duration: Optional[float] = None,
+        transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        channel_layout: Optional[bool] = None,
+        res_type: Optional[str] = None,
+        fill_value: Optional[float] = None,
+    ):
+        """AudioStream init method
+
+        Args:
+            file_path_or_obj (str or file-like): path to an audio file or file-like object
+            block_size (int): number of samples in each block
+            hop (int or None): number of samples between the starts of consecutive
+                blocks. If None, uses `block_size` (blocks do not overlap)
+            sr (float or None): target sample rate. If None, uses the native sample rate
+            mono (bool): if True, downmix to mono before resampling
+            dtype (numpy.dtype): data type of the audio samples
+            offset (float): start reading after this time (in seconds)
+            duration (float or None): only read up to this much audio (in seconds).
+                If None, read until the end of the file
+            transform (function or None): function applied to each block
+            channel_layout (bool or None): applied to each block after `transform`.
+                If True, downmix to mono. If False, blocks always have shape
+                (n_channels, block_size). If None, keep the channels
+            res_type (str or None): soxr resampler, e.g. "soxr_hq" (the default)
+            fill_value (float or None): if not None, the last block is padded
+                with this value to `block_size` samples. Otherwise it is shorter
+
+        """
+        if block_size <= 0:
+            raise ValueError("block_size must be positive, got {}".format(block_size))
+        self.block_size = int(block_size)
+        self.hop = self.block_size if hop is None else int(hop)
+        if self.hop <= 0:
+            raise ValueError("hop must be positive, got {}".format(hop))
+        if res_type is not None and not res_type.startswith("soxr_"):
+            raise ValueError(
+                "Only soxr resamplers can be used when streaming, got {}".format(
+                    res_type
+                )
+            )
+        self._file = file_path_or_obj
+        self._sr = sr
+        self._mono = mono
+        self._dtype = dtype
+        self._offset = offset
+        self._duration = duration
+        self._transform = transform
+        self._channel_layout = channel_layout
+        self._quality = "HQ" if res_type is None else res_type[len("soxr_") :].upper()
+        self._fill_value = fill_value
+
+    def __repr__(self):
+        return "AudioStream({}, block_size={}, hop={})".format(
+            getattr(self._file, "name", self._file), self.block_size, self.hop
+        )
+
+    @property
+    def sample_rate(self) -> float:
+        """float: the sample rate of the blocks"""
+        if self._sr is not None:
+            return self._sr
+        position = None if isinstance(self._file, str) else self._file.tell()
+        try:
+            return sf.info(self._file).samplerate
+        finally:
+            if position is not None:
+                self._file.seek(position)
+
+    def _chunks(self) -> Iterator[np.ndarray]:
+        """Read, downmix and resample the file a chunk at a time"""
+        if not isinstance(self._file, str):
+            self._file.seek(0)
+        with sf.SoundFile(self._file) as sound_file:
+            native_sr = sound_file.samplerate
+            start = int(np.round(self._offset * native_sr))
+            if start > 0:
+                sound_file.seek(min(start, sound_file.frames))
+            frames = -1
+            if self._duration is not None:
+                frames = int(np.round(self._duration * native_sr))
+
+            n_channels = 1 if self._mono else sound_file.channels
+            resampler = None
+            if self._sr is not None and self._sr != native_sr:
+                resampler = soxr.ResampleStream(
+                    native_sr,
+                    self._sr,
+                    n_channels,
+                    dtype=np.dtype(self._dtype).name,
+                    quality=self._quality,
+                )
+
+            for chunk in sound_file.blocks(
+                blocksize=STREAM_READ_SIZE,
+                frames=frames,
+                dtype=np.dtype(self._dtype).name,
+                always_2d=True,
+            ):
+                chunk = chunk.T
+                if self._mono:
+                    chunk = np.mean(chunk, axis=0, dtype=self._dtype)
+                if resampler is not None:
+                    chunk = resampler.resample_chunk(chunk.T).T
+                yield chunk
+
+            if resampler is not None:
+                shape = (0,) if self._mono else (0, n_channels)
+                last = np.zeros(shape, dtype=self._dtype)
+                yield resampler.resample_chunk(last, last=True).T
+
+    def _finish(self, block: np.ndarray) -> np.ndarray:
+        if self._transform is not None:
+            block = self._transform(block)
+        if self._channel_layout and block.ndim > 1:
+            block = np.mean(block, axis=0, dtype=block.dtype)
+        elif self._channel_layout is False and block.ndim == 1:
+            block = block[np.newaxis, :]
+        return block
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        buffer = None
+        skip = 0  # samples to drop before the next block, when hop > block_size
+        seen = 0  # samples at the start of the buffer which were already yielded
+        overlap = max(self.block_size - self.hop, 0)
+        for chunk in self._chunks():
+            if skip:
+                dropped = min(skip, chunk.shape[-1])
+                chunk = chunk[..., dropped:]
+                skip -= dropped
+            buffer = chunk if buffer is None else np.concatenate([buffer, chunk], -1)
+            while buffer.shape[-1] >= self.block_size:
+                yield self._finish(buffer[..., : self.block_size].copy())
+                skip = max(self.hop - buffer.shape[-1], 0)
+                buffer = buffer[..., self.hop :]
+                seen = overlap
+
+        if buffer is not None and buffer.shape[-1] > seen and not skip:
+            block = buffer
+            if self._fill_value is not None:
+                padding = [(0, 0)] * (block.ndim - 1)
+                padding.append((0, self.block_size - block.shape[-1]))
+                block = np.pad(block, padding, constant_values=self._fill_value)
+            yield self._finish(block.copy())
+
+
+def stream_audio(
+    file_path_or_obj: Optional[Union[str, BinaryIO]],
+    block_size: int,
+    hop: Optional[int] = None,
+    sr: Optional[float] = 22050,
+    mono: bool = True,
+    dtype: Any = np.float32,
+    offset: float = 0.0,
+    duration: Optional[float] = None,
+    transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    fill_value: Optional[float] = None,
+) -> Optional[AudioStream]:
+    """Stream an audio file in fixed-size blocks, using the current `audio_options`
+
+    This is the function used by the datasets' ``stream_audio`` functions. It
+    follows the same options as `load_audio`, except for the audio cache.
+
+    Example:
+        .. code-block:: python
+
+            stream = io.stream_audio(audio_path, block_size=2048, hop=512)
+            for block in stream:
+                features.append(compute_features(block, stream.sample_rate))
+
+    Args:
+        file_path_or_obj (str or file-like): path to an audio file or file-like object
+        block_size (int): number of samples in each block
+        hop (int or None): number of samples between the starts of consecutive
+            blocks. If None, uses `block_size` (blocks do not overlap)
+        sr (float or None): target sample rate. If None, uses the native sample rate
+        mono (bool): if True, downmix to mono
+        dtype (numpy.dtype): data type of the audio samples
+        offset (float): start reading after this time (in seconds)
+        duration (float or None): only read up to this much audio (in seconds).
+            If None, read until the end of the file
+        transform (function or None): function applied to each block
+        fill_value (float or None): if not None, the last block is padded
+            with this value to `block_size` samples. Otherwise it is shorter
+
+    Returns:
+        AudioStream or None: iterable over blocks of the audio signal
+
+    Raises:
+        IOError: if the file does not exist
+
+    """
+    if not file_path_or_obj:
+        return None
+    if isinstance(file_path_or_obj, str) and not os.path.exists(file_path_or_obj):
+        raise IOError("{} does not exist".format(file_path_or_obj))
+
+    options = _AUDIO_OPTIONS.get()
+    if options.get("sample_rate") is not None:
+        sr = options["sample_rate"]
+    # streams always resample with soxr, whatever the librosa version
+    quality = options.get("resample_quality")
+    return AudioStream(
+        file_path_or_obj,
+        block_size,
+        hop,
+        sr=sr,
+        mono=mono,
+        dtype=dtype,
+        offset=options.get("offset", offset),
+        duration=options.get("duration", duration),
+        transform=transform,
+        channel_layout=options.get("mono"),
+        res_type=RESAMPLE_QUALITY.get(quality, quality),
+        fill_value=fill_value,
+    )
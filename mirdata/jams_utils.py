@@ -2,10 +2,11 @@
 """
 import os
 
-import jams
-import librosa
-
 from mirdata import annotations
+from mirdata import lazy
+
+jams = lazy.import_module("jams")
+librosa = lazy.import_module("librosa")
 
 
 def jams_converter(
@@ -0,0 +1,69 @@
+"""Lazy imports for heavy optional dependencies
+
+Dataset modules use ``librosa``, ``jams``, ``pretty_midi`` etc. only inside
+loaders, so they are imported on first attribute access instead of when the
+dataset module is imported.
+
+Example:
+    .. code-block:: python
+
+        from mirdata import lazy
+
+        librosa = lazy.import_module("librosa")  # nothing is imported yet
+        librosa.load(path)  # librosa is imported here
+
+"""
+import importlib
+import importlib.util
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """A module placeholder which imports the real module on first attribute access
+
+    Attributes:
+        __name__ (str): the name of the module to import
+
+    """
+
+    def _load(self):
+        module = importlib.import_module(self.__name__)
+        # copy the module's namespace so later lookups skip __getattr__
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        return "<lazy module '{}'>".format(self.__name__)
+
+
+def import_module(name: str) -> Any:
+    """Get a module which is imported the first time one of its attributes is accessed
+
+    Args:
+        name (str): the module's name, e.g. "librosa" or "jams"
+
+    Returns:
+        LazyModule: placeholder for the module
+
+    """
+    return LazyModule(name)
+
+
+def is_installed(name: str) -> bool:
+    """Check if a module can be imported, without importing it
+
+    Args:
+        name (str): the module's name
+
+    Returns:
+        bool: True if the module is installed
+
+    """
+    return importlib.util.find_spec(name) is not None
@@ -1,15 +1,24 @@
 """Utility functions for mirdata"""
 
+from concurrent import futures
+import functools
 import hashlib
+import logging
 import os
+import sqlite3
 import tqdm
 
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # bytes
+VALIDATION_DB_NAME = ".mirdata_validation.db"
+VALIDATION_LEVELS = ["quick", "md5"]
 
-def md5(file_path):
+
+def md5(file_path, chunk_size=DEFAULT_CHUNK_SIZE):
     """Get md5 hash of a file.
 
     Args:
         file_path (str): File path
+        chunk_size (int): number of bytes read at a time
 
     Returns:
         str: md5 hash of data in file_path
@@ -17,7 +26,7 @@ def md5(file_path):
     """
     hash_md5 = hashlib.md5()
     with open(file_path, "rb") as fhandle:
-        for chunk in iter(lambda: fhandle.read(4096), b""):
+        for chunk in iter(lambda: fhandle.read(chunk_size), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
@@ -34,12 +43,13 @@ def log_message(message, verbose=True):
         print(message)
 
 
-def validate(local_path, checksum):
+def validate(local_path, checksum, chunk_size=DEFAULT_CHUNK_SIZE):
     """Validate that a file exists and has the correct checksum
 
     Args:
         local_path (str): file path
         checksum (str): md5 checksum
+        chunk_size (int): number of bytes read at a time when hashing
 
     Returns:
         * bool - True if file exists
@@ -51,7 +61,7 @@ def validate(local_path, checksum):
         return False, False
 
     # validate that the checksum matches
-    if md5(local_path) != checksum:
+    if md5(local_path, chunk_size) != checksum:
         valid = False
     else:
         valid = True
@@ -59,24 +69,420 @@ def validate(local_path, checksum):
     return True, valid
 
 
-def validate_files(file_dict, data_home, verbose):
-    """Validate files
+def stat_signature(file_path):
+    """Get the stat signature of a file, which changes when the file is modified
 
     Args:
-        file_dict (dict): dictionary of file information
+        file_path (str): File path
+
+    Returns:
+        tuple: (size, mtime_ns, inode)
+
+    """
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+class ValidationStore(object):
+    """Sidecar database of the files which passed validation
+
+    Stores (path, size, mtime_ns, inode, md5) in ``data_home/.mirdata_validation.db``
+    for each file whose checksum matched the index, or which was hashed while
+    it was downloaded or extracted (see `record`), so later validations can
+    skip hashing files whose stat signature has not changed. If the database
+    cannot be read or written (e.g. read-only data_home), validation simply
+    hashes every file.
+
+    Attributes:
         data_home (str): path where the data lives
+        path (str): path to the database
+
+    """
+
+    def __init__(self, data_home):
+        """ValidationStore init method
+
+        Args:
+            data_home (str): path where the data lives
+
+        """
+        self.data_home = data_home
+        self.path = os.path.join(data_home, VALIDATION_DB_NAME)
+        self._entries = None
+
+    def __repr__(self):
+        return "ValidationStore({})".format(self.path)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=60)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, "
+            "size INTEGER, mtime_ns INTEGER, inode INTEGER, md5 TEXT)"
+        )
+        return connection
+
+    def _key(self, local_path):
+        return os.path.relpath(local_path, self.data_home)
+
+    def lookup(self, local_path):
+        """Get the stored checksum of a file, if it has not changed since it was stored
+
+        Args:
+            local_path (str): file path
+
+        Returns:
+            str or None: md5 checksum of the file, or None if the file is not
+                in the store, is missing or has changed
+
+        """
+        if self._entries is None:
+            self._entries = {}
+            if os.path.exists(self.path):
+                try:
+                    connection = self._connect()
+                    try:
+                        rows = connection.execute("SELECT * FROM files").fetchall()
+                    finally:
+                        connection.close()
+                except sqlite3.Error as exc:
+                    logging.warning(
+                        "Could not read validation database {}: {}".format(
+                            self.path, exc
+                        )
+                    )
+                    rows = []
+                self._entries = {row[0]: (tuple(row[1:4]), row[4]) for row in rows}
+
+        entry = self._entries.get(self._key(local_path))
+        if entry is None:
+            return None
+        try:
+            signature = stat_signature(local_path)
+        except OSError:
+            return None
+        return entry[1] if entry[0] == signature else None
+
+    def update(self, passed, failed):
+        """Record files which passed validation, and forget files which failed
+
+        Args:
+            passed (list): list of (local_path, stat signature, md5 checksum)
+            failed (list): list of local paths
+
+        """
+        if not passed and not failed:
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                        [
+                            (self._key(path),) + tuple(signature) + (checksum,)
+                            for path, signature, checksum in passed
+                        ],
+                    )
+                    connection.executemany(
+                        "DELETE FROM files WHERE path = ?",
+                        [(self._key(path),) for path in failed],
+                    )
+            finally:
+                connection.close()
+        except sqlite3.Error as exc:
+            logging.warning(
+                "Could not write validation database {}: {}".format(self.path, exc)
+            )
+            return
+        if self._entries is not None:
+            for path, signature, checksum in passed:
+                self._entries[self._key(path)] = (tuple(signature), checksum)
+            for path in failed:
+                self._entries.pop(self._key(path), None)
+
+    def record(self, checksums):
+        """Record the checksums of files which were hashed as they were written
+
+        Files which no longer exist are ignored.
+
+        Args:
+            checksums (dict): {local path: md5 checksum}, e.g. as filled by
+                download_utils.downloader
+
+        """
+        entries = []
+        for path, checksum in checksums.items():
+            try:
+                entries.append((path, stat_signature(path), checksum))
+            except OSError:
+                continue
+        self.update(entries, [])
+
+    def clear(self):
+        """Delete the database"""
+        self._entries = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _validate_file(task, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Validate one file of a list built by validate_files/validate_metadata
+
+    Args:
+        task (tuple): (file_id, local_path, checksum)
+        chunk_size (int): number of bytes read at a time when hashing
+
+    Returns:
+        * bool - True if file exists
+        * bool - True if checksum matches
+        * tuple or None - stat signature of the file before it was hashed
+
+    """
+    _, local_path, checksum = task
+    try:
+        signature = stat_signature(local_path)
+    except OSError:
+        signature = None
+    exists, valid = validate(local_path, checksum, chunk_size)
+    return exists, valid, signature
+
+
+def check_files(
+    tasks,
+    verbose,
+    workers=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor="thread",
+    store=None,
+    full=False,
+):
+    """Validate a list of files, possibly in parallel
+
+    Args:
+        tasks (list): list of (file_id, local_path, checksum)
         verbose (bool): if True, show progress
+        workers (int): number of files hashed at the same time
+        chunk_size (int): number of bytes read at a time when hashing
+        executor (str): "thread" or "process", the kind of pool used when
+            workers > 1. Hashing releases the GIL, so threads are usually enough.
+        store (ValidationStore or None): if given, files which are unchanged
+            since they last passed validation are not hashed again, and the
+            files which pass are recorded
+        full (bool): if True, every file is hashed, even if it is in `store`
 
     Returns:
         * dict - missing files
-        * dict - files with invalid checksums
+        * dict - files with invalid checksums (or sizes)
+
+    Raises:
+        ValueError: if executor is not "thread" or "process"
 
     """
+    if executor == "thread":
+        pool_class = futures.ThreadPoolExecutor
+    elif executor == "process":
+        pool_class = futures.ProcessPoolExecutor
+    else:
+        raise ValueError(
+            "executor must be 'thread' or 'process', got {}".format(executor)
+        )
+
+    # files which are unchanged since they passed validation are not hashed
+    results = [None] * len(tasks)
+    to_hash = []
+    for i, (_, local_path, checksum) in enumerate(tasks):
+        stored = None if store is None or full else store.lookup(local_path)
+        if stored is None:
+            to_hash.append(tasks[i])
+        else:
+            results[i] = (True, stored == checksum, None)
+
+    check = functools.partial(_validate_file, chunk_size=chunk_size)
+    progress = tqdm.tqdm(total=len(tasks), disable=not verbose)
+    progress.update(len(tasks) - len(to_hash))
+    if workers <= 1 or len(to_hash) <= 1:
+        hashed = map(check, to_hash)
+        pool = None
+    else:
+        pool = pool_class(max_workers=workers)
+        # small files are batched to reduce the overhead of process pools
+        chunksize = 1
+        if executor == "process":
+            chunksize = max(1, len(to_hash) // (4 * workers))
+        hashed = pool.map(check, to_hash, chunksize=chunksize)
+
+    missing = {}
+    invalid = {}
+    passed = []
+    failed = []
+    try:
+        for i, result in enumerate(results):
+            if result is None:
+                result = next(hashed)
+                progress.update()
+            exists, valid, signature = result
+            file_id, local_path, checksum = tasks[i]
+            if signature is not None:
+                if valid:
+                    passed.append((local_path, signature, checksum))
+                else:
+                    failed.append(local_path)
+            if not exists:
+                if file_id not in missing.keys():
+                    missing[file_id] = []
+                missing[file_id].append(local_path)
+            elif not valid:
+                if file_id not in invalid.keys():
+                    invalid[file_id] = []
+                invalid[file_id].append(local_path)
+            # save progress regularly, so interrupted runs are not lost
+            if store is not None and len(passed) + len(failed) >= 1000:
+                store.update(passed, failed)
+                passed, failed = [], []
+    finally:
+        progress.close()
+        if pool is not None:
+            pool.shutdown()
+        if store is not None:
+            store.update(passed, failed)
+
+    return missing, invalid
+
+
+def check_sizes(tasks, verbose):
+    """Check that files exist and have the size stored in the index
+
+    Files are grouped by directory, and each directory is listed once with
+    os.scandir instead of looking up every file separately.
+
+    Args:
+        tasks (list): list of (file_id, local_path, checksum, size). Files
+            whose size is None are only checked for existence.
+        verbose (bool): if True, show progress
+
+    Returns:
+        * dict - missing files
+        * dict - files with a different size
+
+    """
+    directories = {}
+    for i, task in enumerate(tasks):
+        directories.setdefault(os.path.dirname(task[1]), []).append(i)
+
+    results = [None] * len(tasks)
+    progress = tqdm.tqdm(total=len(tasks), disable=not verbose)
+    try:
+        for directory, indices in directories.items():
+            try:
+                with os.scandir(directory or os.curdir) as entries:
+                    listing = {entry.name: entry for entry in entries}
+            except OSError:
+                listing = {}
+            for i in indices:
+                _, local_path, _, size = tasks[i]
+                entry = listing.get(os.path.basename(local_path))
+                if entry is None:
+                    results[i] = (False, False)
+                elif size is None:
+                    results[i] = (True, True)
+                else:
+                    try:
+                        results[i] = (True, entry.stat().st_size == size)
+                    except OSError:
+                        results[i] = (False, False)
+            progress.update(len(indices))
+    finally:
+        progress.close()
+
     missing = {}
     invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
+    for (file_id, local_path, _, _), (exists, valid) in zip(tasks, results):
+        if not exists:
+            missing.setdefault(file_id, []).append(local_path)
+        elif not valid:
+            invalid.setdefault(file_id, []).append(local_path)
+    return missing, invalid
+
+
+def _check_tasks(tasks, verbose, level, workers, chunk_size, executor, store, full):
+    """Validate a list of (file_id, local_path, checksum, size) at a given level
+
+    At the "quick" level, files without a size in the index are checked with
+    their md5 checksum instead.
+
+    """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            "level must be one of {}, got {}".format(VALIDATION_LEVELS, level)
+        )
+    if level == "quick":
+        sized = [task for task in tasks if task[3] is not None]
+        tasks = [task for task in tasks if task[3] is None]
+        missing, invalid = check_sizes(sized, verbose)
+        if not tasks:
+            return missing, invalid
+        logging.warning(
+            "{} files have no size in the index, checking their md5 checksum "
+            "instead (see scripts/add_index_sizes.py)".format(len(tasks))
+        )
+    else:
+        missing, invalid = {}, {}
+
+    hashed_missing, hashed_invalid = check_files(
+        [task[:3] for task in tasks],
+        verbose,
+        workers,
+        chunk_size,
+        executor,
+        store,
+        full,
+    )
+    for report, hashed in [(missing, hashed_missing), (invalid, hashed_invalid)]:
+        for file_id, paths in hashed.items():
+            report.setdefault(file_id, []).extend(paths)
+    return missing, invalid
+
+
+def _file_size(entry):
+    """Get the size of a [path, checksum(, size)] index entry, or None"""
+    return entry[2] if len(entry) > 2 else None
+
+
+def validate_files(
+    file_dict,
+    data_home,
+    verbose,
+    workers=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor="thread",
+    store=None,
+    full=False,
+    level="md5",
+):
+    """Validate files
+
+    Args:
+        file_dict (dict): dictionary of file information
+        data_home (str): path where the data lives
+        verbose (bool): if True, show progress
+        workers (int): number of files hashed at the same time
+        chunk_size (int): number of bytes read at a time when hashing
+        executor (str): "thread" or "process", see check_files
+        store (ValidationStore or None): files which passed validation before,
+            see check_files
+        full (bool): if True, every file is hashed, even if it is in `store`
+        level (str): "md5" to compare checksums, or "quick" to only compare
+            file sizes, see check_sizes
+
+    Returns:
+        * dict - missing files
+        * dict - files with invalid checksums (or sizes)
+
+    """
+    tasks = []
+    for file_id, file in file_dict.items():
         # multitrack case
-        if file_id is "tracks":
+        if file_id == "tracks":
             continue
         # tracks
         else:
@@ -85,67 +491,286 @@ def validate_files(file_dict, data_home, verbose):
                 checksum = file[tracks][1]
                 if filepath is not None:
                     local_path = os.path.join(data_home, filepath)
-                    exists, valid = validate(local_path, checksum)
-                    if not exists:
-                        if file_id not in missing.keys():
-                            missing[file_id] = []
-                        missing[file_id].append(local_path)
-                    elif not valid:
-                        if file_id not in invalid.keys():
-                            invalid[file_id] = []
-                        invalid[file_id].append(local_path)
-
-    return missing, invalid
-
-
-def validate_metadata(file_dict, data_home, verbose):
+                    size = _file_size(file[tracks])
+                    tasks.append((file_id, local_path, checksum, size))
+
+    return _check_tasks(
+        tasks, verbose, level, workers, chunk_size, executor, store, full
+    )
+
+
+def validate_metadata(
+    file_dict,
+    data_home,
+    verbose,
+    workers=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor="thread",
+    store=None,
+    full=False,
+    level="md5",
+):
     """Validate files
 
     Args:
         file_dict (dict): dictionary of file information
         data_home (str): path where the data lives
         verbose (bool): if True, show progress
+        workers (int): number of files hashed at the same time
+        chunk_size (int): number of bytes read at a time when hashing
+        executor (str): "thread" or "process", see check_files
+        store (ValidationStore or None): files which passed validation before,
+            see check_files
+        full (bool): if True, every file is hashed, even if it is in `store`
+        level (str): "md5" to compare checksums, or "quick" to only compare
+            file sizes, see check_sizes
 
     Returns:
         * dict - missing files
-        * dict - files with invalid checksums
+        * dict - files with invalid checksums (or sizes)
 
     """
-    missing = {}
-    invalid = {}
-    for file_id, file in tqdm.tqdm(file_dict.items(), disable=not verbose):
+    tasks = []
+    for file_id, file in file_dict.items():
         filepath = file[0]
         checksum = file[1]
         if filepath is not None:
             local_path = os.path.join(data_home, filepath)
-            exists, valid = validate(local_path, checksum)
-            if not exists:
-                if file_id not in missing.keys():
-                    missing[file_id] = []
-                missing[file_id].append(local_path)
-            elif not valid:
-                if file_id not in invalid.keys():
-                    invalid[file_id] = []
-                invalid[file_id].append(local_path)
+            tasks.append((file_id, local_path, checksum, _file_size(file)))
 
-    return missing, invalid
+    return _check_tasks(
+        tasks, verbose, level, workers, chunk_size, executor, store, full
+    )
+
+
+def _is_archive(filename):
+    """Check if a remote file is extracted after download, see downloader"""
+    extension = os.path.splitext(filename)[-1]
+    return any(ext in extension for ext in [".zip", ".gz", ".tar", ".bz2"])
 
 
-def validate_index(dataset_index, data_home, verbose=True):
+def index_files(dataset_index):
+    """Iterate over the files of an index
+
+    Yields:
+        tuple: (section, entry id, file key, path), where file key is None
+            for metadata files
+
+    """
+    metadata = dataset_index.get("metadata")
+    if metadata is not None:
+        for key, entry in metadata.items():
+            yield "metadata", key, None, entry[0]
+    for section in ["tracks", "multitracks"]:
+        if dataset_index.get(section) is None:
+            continue
+        for entry_id, files in dataset_index[section].items():
+            for file_key, entry in files.items():
+                # multitracks list their track ids under "tracks"
+                if section == "multitracks" and file_key == "tracks":
+                    continue
+                yield section, entry_id, file_key, entry[0]
+
+
+def _add_entry(entries, section, entry_id, file_key):
+    if section == "metadata":
+        entries.setdefault("metadata", []).append(entry_id)
+    else:
+        entries.setdefault(section, {}).setdefault(entry_id, []).append(file_key)
+
+
+def remote_file_map(dataset_index, remotes):
+    """Map each remote to the index entries of the files it provides
+
+    The mapping is read from the index's "remotes" section if it has one.
+    Otherwise it is derived from the remotes: a remote which is not an archive
+    provides the file it is saved as, an archive extracted in its own
+    ``destination_dir`` provides the files under that directory, and the only
+    remote of a dataset, if it is an archive extracted in data_home, provides
+    every file. Remotes for which this is
+    ambiguous (e.g. several archives extracted in data_home) are mapped to None.
+
+    Args:
+        dataset_index (dict): dataset index
+        remotes (dict or None): {remote key: download_utils.RemoteFileMetadata}
+
+    Returns:
+        dict: {remote key: entries or None}, where entries is a dictionary
+            {"metadata": [keys], "tracks": {track_id: [file keys]},
+            "multitracks": {mtrack_id: [file keys]}}
+
+    """
+    if not remotes:
+        return {}
+    if "remotes" in dataset_index:
+        return {key: dataset_index["remotes"].get(key) for key in remotes}
+
+    files = {}
+    folders = {}
+    for key, remote in remotes.items():
+        destination = os.path.normpath(remote.destination_dir or "")
+        if not _is_archive(remote.filename):
+            files[os.path.normpath(os.path.join(destination, remote.filename))] = key
+        else:
+            folders.setdefault(destination, []).append(key)
+
+    # archives extracted in data_home, or in the same folder, cannot be told
+    # apart, unless a single remote extracted in data_home provides the
+    # whole dataset
+    everything = None
+    if len(remotes) == 1 and list(folders) == [os.curdir]:
+        everything = folders[os.curdir][0]
+    mapping = {key: {} for key in remotes}
+    prefixes = {}
+    for destination, keys in folders.items():
+        if destination != os.curdir and len(keys) == 1:
+            prefixes[destination + os.sep] = keys[0]
+        elif everything is None:
+            for key in keys:
+                mapping[key] = None
+
+    for section, entry_id, file_key, path in index_files(dataset_index):
+        if path is None:
+            continue
+        path = os.path.normpath(path)
+        key = files.get(path, everything)
+        if key is None:
+            key = next((k for p, k in prefixes.items() if path.startswith(p)), None)
+        if key is not None:
+            _add_entry(mapping[key], section, entry_id, file_key)
+    return mapping
+
+
+def subset_index(dataset_index, track_ids=None, remote_entries=None, file_keys=None):
+    """Restrict a dataset index to some tracks and/or to the files of some remotes
+
+    Args:
+        dataset_index (dict): dataset index
+        track_ids (list or None): if given, only the files of these tracks
+            are kept (metadata and multitracks are dropped)
+        remote_entries (list or None): if given, only the files provided by
+            these remotes are kept, see remote_file_map
+        file_keys (list or None): if given, only the track and multitrack
+            files with these keys (e.g. "audio") are kept (metadata is dropped)
+
+    Returns:
+        dict: an index with the "metadata", "tracks" and "multitracks"
+            sections of the subset
+
+    Raises:
+        ValueError: if a track id or a file key is not in the index
+
+    """
+    if track_ids is not None:
+        track_ids = set(track_ids)
+        unknown = [t for t in track_ids if t not in dataset_index["tracks"]]
+        if unknown:
+            raise ValueError("{} are not valid track_ids".format(sorted(unknown)))
+
+    if file_keys is not None:
+        file_keys = set(file_keys)
+        known = {
+            file_key
+            for _, _, file_key, _ in index_files(dataset_index)
+            if file_key is not None
+        }
+        unknown = [k for k in file_keys if k not in known]
+        if unknown:
+            raise ValueError(
+                "{} are not valid file_keys, expected a subset of {}".format(
+                    sorted(unknown), sorted(known)
+                )
+            )
+
+    if remote_entries is None:
+        entries = {}
+        for section, entry_id, file_key, _ in index_files(dataset_index):
+            _add_entry(entries, section, entry_id, file_key)
+        remote_entries = [entries]
+
+    subset = {}
+    for entries in remote_entries:
+        if entries.get("metadata") and track_ids is None and file_keys is None:
+            metadata = subset.setdefault("metadata", {})
+            for key in entries["metadata"]:
+                metadata[key] = dataset_index["metadata"][key]
+        for section in ["tracks", "multitracks"]:
+            if section == "multitracks" and track_ids is not None:
+                continue
+            for entry_id, entry_keys in entries.get(section, {}).items():
+                if track_ids is not None and entry_id not in track_ids:
+                    continue
+                entry_files = dataset_index[section][entry_id]
+                for file_key in entry_keys:
+                    if file_keys is not None and file_key not in file_keys:
+                        continue
+                    files = subset.setdefault(section, {}).setdefault(entry_id, {})
+                    files[file_key] = entry_files[file_key]
+    return subset
+
+
+def index_paths(dataset_index):
+    """Get the normalized paths of the files of an index
+
+    Args:
+        dataset_index (dict): dataset index
+
+    Returns:
+        set: file paths, relative to data_home
+
+    """
+    return {
+        os.path.normpath(path)
+        for _, _, _, path in index_files(dataset_index)
+        if path is not None
+    }
+
+
+def validate_index(
+    dataset_index,
+    data_home,
+    verbose=True,
+    workers=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor="thread",
+    full=False,
+    level="md5",
+    cache=True,
+):
     """Validate files in a dataset's index
 
     Args:
         dataset_index (list): dataset indices
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if true, prints validation status while running
+        workers (int): number of files hashed at the same time
+        chunk_size (int): number of bytes read at a time when hashing
+        executor (str): "thread" or "process", see check_files
+        full (bool): if True, every file is hashed. Otherwise, files which
+            are unchanged (same size, mtime and inode) since they last passed
+            validation are not hashed again (see ValidationStore)
+        level (str): "md5" (default) to compare the checksums of the files,
+            or "quick" to only check that files exist and have the size
+            stored in the index, without reading them. Files without a size
+            in the index are checked with their md5 checksum instead.
+        cache (bool): if True (default), the files which pass validation are
+            recorded in a ValidationStore in data_home. If False, nothing is
+            written in data_home, and every file is checked.
 
     Returns:
         * dict - file paths that are in the index but missing locally
-        * dict - file paths with differing checksums
+        * dict - file paths with differing checksums (or sizes)
 
     """
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            "level must be one of {}, got {}".format(VALIDATION_LEVELS, level)
+        )
     missing_files = {}
     invalid_checksums = {}
+    store = None
+    if cache and os.path.isdir(data_home):
+        store = ValidationStore(data_home)
 
     # check index
     if "metadata" in dataset_index and dataset_index["metadata"] is not None:
@@ -153,6 +778,12 @@ def validate_index(dataset_index, data_home, verbose=True):
             dataset_index["metadata"],
             data_home,
             verbose,
+            workers=workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            store=store,
+            full=full,
+            level=level,
         )
         missing_files["metadata"] = missing_metadata
         invalid_checksums["metadata"] = invalid_metadata
@@ -162,6 +793,12 @@ def validate_index(dataset_index, data_home, verbose=True):
             dataset_index["tracks"],
             data_home,
             verbose,
+            workers=workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            store=store,
+            full=full,
+            level=level,
         )
         missing_files["tracks"] = missing_tracks
         invalid_checksums["tracks"] = invalid_tracks
@@ -171,6 +808,12 @@ def validate_index(dataset_index, data_home, verbose=True):
             dataset_index["multitracks"],
             data_home,
             verbose,
+            workers=workers,
+            chunk_size=chunk_size,
+            executor=executor,
+            store=store,
+            full=full,
+            level=level,
         )
         missing_files["multitracks"] = missing_multitracks
         invalid_checksums["multitracks"] = invalid_multitracks
@@ -178,7 +821,17 @@ def validate_index(dataset_index, data_home, verbose=True):
     return missing_files, invalid_checksums
 
 
-def validator(dataset_index, data_home, verbose=True):
+def validator(
+    dataset_index,
+    data_home,
+    verbose=True,
+    workers=1,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor="thread",
+    full=False,
+    level="md5",
+    cache=True,
+):
     """Checks the existence and validity of files stored locally with
     respect to the paths and file checksums stored in the reference index.
     Logs invalid checksums and missing files.
@@ -188,6 +841,12 @@ def validator(dataset_index, data_home, verbose=True):
         data_home (str): Local home path that the dataset is being stored
         verbose (bool): if True (default), prints missing and invalid files
             to stdout. Otherwise, this function is equivalent to validate_index.
+        workers (int): number of files hashed at the same time
+        chunk_size (int): number of bytes read at a time when hashing
+        executor (str): "thread" or "process", see check_files
+        full (bool): if True, every file is hashed, see validate_index
+        level (str): "md5" or "quick", see validate_index
+        cache (bool): if False, no ValidationStore is used, see validate_index
 
     Returns:
         missing_files (list): List of file paths that are in the dataset index
@@ -197,7 +856,17 @@ def validator(dataset_index, data_home, verbose=True):
             checksum.
 
     """
-    missing_files, invalid_checksums = validate_index(dataset_index, data_home, verbose)
+    missing_files, invalid_checksums = validate_index(
+        dataset_index,
+        data_home,
+        verbose,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor,
+        full=full,
+        level=level,
+        cache=cache,
+    )
 
     # print path of any missing files
     has_any_missing_file = False
@@ -213,7 +882,12 @@ def validator(dataset_index, data_home, verbose=True):
     has_any_invalid_checksum = False
     for file_id in invalid_checksums:
         if len(invalid_checksums[file_id]) > 0:
-            log_message("Invalid checksums for {}:".format(file_id), verbose)
+            log_message(
+                "Invalid {} for {}:".format(
+                    "sizes" if level == "quick" else "checksums", file_id
+                ),
+                verbose,
+            )
             for fpath in invalid_checksums[file_id]:
                 log_message(fpath, verbose)
             log_message("-" * 20, verbose)
@@ -0,0 +1,92 @@
+"""Add a "remotes" section to an existing dataset index
+
+The "remotes" section maps each remote of a dataset to the index entries of
+the files it provides, so `Dataset.validate(remote_keys=[...])` can validate
+a partial download. It is only needed when the mapping cannot be derived from
+the remotes' destination_dir (e.g. several archives extracted in data_home).
+
+The archives are read from a data_home where the dataset was downloaded with
+cleanup=False.
+
+Example:
+    python add_index_remotes.py irmas ../mirdata/datasets/indexes/irmas_index.json ~/mir_datasets/IRMAS
+
+"""
+import argparse
+import json
+import os
+import tarfile
+import zipfile
+
+import mirdata
+from mirdata import validate
+
+
+def remote_paths(remote, data_home):
+    """Get the paths (relative to data_home) of the files a remote provides
+
+    Args:
+        remote (download_utils.RemoteFileMetadata): the remote
+        data_home (str): path where the dataset was downloaded
+
+    Returns:
+        set: relative file paths
+
+    """
+    destination = remote.destination_dir or ""
+    path = os.path.join(data_home, destination, remote.filename)
+    extension = os.path.splitext(remote.filename)[-1]
+    if ".zip" in extension:
+        with zipfile.ZipFile(path) as zfile:
+            members = [m.filename for m in zfile.infolist() if not m.is_dir()]
+    elif ".gz" in extension or ".tar" in extension or ".bz2" in extension:
+        with tarfile.open(path) as tfile:
+            members = [m.name for m in tfile.getmembers() if m.isfile()]
+    else:
+        members = [remote.filename]
+    return {os.path.normpath(os.path.join(destination, m)) for m in members}
+
+
+def add_index_remotes(dataset_name, index_path, data_home):
+    """Add the "remotes" section to a json index
+
+    Args:
+        dataset_name (str): the dataset's name, e.g. "irmas"
+        index_path (str): path to the json index
+        data_home (str): path where the dataset was downloaded
+
+    """
+    remotes = mirdata.initialize(dataset_name).remotes
+    with open(index_path) as fhandle:
+        index = json.load(fhandle)
+
+    paths = {key: remote_paths(remote, data_home) for key, remote in remotes.items()}
+    mapping = {key: {} for key in remotes}
+    for section, entry_id, file_key, path in validate.index_files(index):
+        if path is None:
+            continue
+        path = os.path.normpath(path)
+        for key in remotes:
+            if path not in paths[key]:
+                continue
+            if section == "metadata":
+                mapping[key].setdefault("metadata", []).append(entry_id)
+            else:
+                entries = mapping[key].setdefault(section, {})
+                entries.setdefault(entry_id, []).append(file_key)
+    index["remotes"] = mapping
+
+    with open(index_path, "w") as fhandle:
+        json.dump(index, fhandle, indent=2)
+
+
+def main(args):
+    add_index_remotes(args.dataset_name, args.index_path, args.data_home)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(description="Add remotes to an index.")
+    PARSER.add_argument("dataset_name", type=str, help="Name of the dataset.")
+    PARSER.add_argument("index_path", type=str, help="Path to the json index.")
+    PARSER.add_argument("data_home", type=str, help="Path to the dataset.")
+    main(PARSER.parse_args())
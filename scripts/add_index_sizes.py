@@ -0,0 +1,83 @@
+"""Add file sizes to an existing dataset index
+
+Index entries are [path, md5] or [path, md5, size]. Sizes allow
+`Dataset.validate(level="quick")` to catch missing and truncated files
+without reading them. This script adds the size of every file of an index
+from a local copy of the dataset, after checking its md5 checksum.
+
+Example:
+    python add_index_sizes.py ../mirdata/datasets/indexes/orchset_index.json ~/mir_datasets/Orchset
+
+"""
+import argparse
+import json
+import os
+
+from tqdm import tqdm
+
+from mirdata.validate import md5
+
+
+def add_size(entry, data_home):
+    """Add the size to a [path, checksum] index entry
+
+    Args:
+        entry (list): [path, checksum] or [path, checksum, size]
+        data_home (str): path where the data lives
+
+    Returns:
+        list: [path, checksum, size], or the entry unchanged if the path is
+            None, or the file is missing or does not match the checksum
+
+    """
+    path, checksum = entry[:2]
+    if path is None:
+        return entry
+    local_path = os.path.join(data_home, path)
+    if not os.path.exists(local_path):
+        print("Missing file, size not added: {}".format(local_path))
+        return entry
+    if md5(local_path) != checksum:
+        print("Invalid checksum, size not added: {}".format(local_path))
+        return entry
+    return [path, checksum, os.path.getsize(local_path)]
+
+
+def add_index_sizes(index_path, data_home):
+    """Add file sizes to the metadata, tracks and multitracks of an index
+
+    Args:
+        index_path (str): path to a json index
+        data_home (str): path where the data lives
+
+    """
+    with open(index_path) as fhandle:
+        index = json.load(fhandle)
+
+    if index.get("metadata") is not None:
+        for key, entry in tqdm(index["metadata"].items()):
+            index["metadata"][key] = add_size(entry, data_home)
+
+    for section in ["tracks", "multitracks"]:
+        if index.get(section) is None:
+            continue
+        for files in tqdm(index[section].values()):
+            for key, entry in files.items():
+                # multitracks list their track ids under "tracks"
+                if key == "tracks":
+                    continue
+                files[key] = add_size(entry, data_home)
+
+    with open(index_path, "w") as fhandle:
+        json.dump(index, fhandle, indent=2)
+
+
+def main(args):
+    add_index_sizes(args.index_path, args.data_home)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(description="Add file sizes to an index.")
+    PARSER.add_argument("index_path", type=str, help="Path to the json index.")
+    PARSER.add_argument("data_home", type=str, help="Path to the dataset.")
+    main(PARSER.parse_args())
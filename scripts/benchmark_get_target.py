@@ -0,0 +1,121 @@
+"""Benchmark MultiTrack.get_target against the previous (stack and average) implementation
+
+Stems are synthetic and generated when they are accessed, as if they were
+decoded from disk. Peak memory is measured with tracemalloc, which tracks
+numpy allocations.
+
+Example:
+    python scripts/benchmark_get_target.py --n_stems 8 --duration 300
+
+"""
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from mirdata import core
+
+
+class SyntheticTrack(core.Track):
+    def __init__(self, n_channels, n_samples, seed):
+        self.n_channels = n_channels
+        self.n_samples = n_samples
+        self.seed = seed
+
+    @property
+    def audio(self):
+        rng = np.random.default_rng(self.seed)
+        audio = rng.standard_normal((self.n_channels, self.n_samples), np.float32)
+        return audio, 44100
+
+
+class SyntheticMultiTrack(core.MultiTrack):
+    def __init__(self, n_stems, n_channels, n_samples, unequal):
+        self.mtrack_id = "synthetic"
+        self.tracks = {}
+        for i in range(n_stems):
+            length = n_samples - (i * 4410 if unequal else 0)
+            self.tracks[str(i)] = SyntheticTrack(n_channels, length, i)
+        self.track_audio_property = "audio"
+
+
+def previous_get_target(mtrack, track_keys, weights=None, enforce_length=True):
+    """get_target before chunked mixing, for reference"""
+    signals = []
+    lengths = []
+    for k in track_keys:
+        audio, _ = getattr(mtrack.tracks[k], mtrack.track_audio_property)
+        signals.append(audio)
+        lengths.append(audio.shape[1])
+    max_length = np.max(lengths)
+    if any([l != max_length for l in lengths]):
+        if enforce_length:
+            raise ValueError("Tracks are not the same length")
+        signals = [
+            np.pad(signal, ((0, 0), (0, max_length - signal.shape[1])))
+            for signal in signals
+        ]
+    if weights is None:
+        weights = np.ones((len(track_keys),))
+    return np.average(signals, axis=0, weights=weights)
+
+
+def measure(func):
+    tracemalloc.start()
+    tic = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - tic
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main(args):
+    n_samples = int(args.duration * 44100)
+    stem_bytes = args.n_channels * n_samples * 4
+    print(
+        "{} stems, {} channels, {:.0f} s ({:.1f} MB per stem)".format(
+            args.n_stems, args.n_channels, args.duration, stem_bytes / 1e6
+        )
+    )
+    for unequal in [False, True]:
+        mtrack = SyntheticMultiTrack(args.n_stems, args.n_channels, n_samples, unequal)
+        keys = list(mtrack.tracks.keys())
+        weights = np.linspace(0.3, 1.0, len(keys))
+        enforce_length = not unequal
+
+        previous, previous_time, previous_peak = measure(
+            lambda: previous_get_target(mtrack, keys, weights, enforce_length)
+        )
+        del previous
+        current, current_time, current_peak = measure(
+            lambda: mtrack.get_target(keys, weights, enforce_length=enforce_length)
+        )
+        del current
+        print("enforce_length={}".format(enforce_length))
+        print(
+            "  previous: {:7.3f} s, peak {:8.1f} MB ({:.1f} stems)".format(
+                previous_time, previous_peak / 1e6, previous_peak / stem_bytes
+            )
+        )
+        print(
+            "  chunked:  {:7.3f} s, peak {:8.1f} MB ({:.1f} stems)".format(
+                current_time, current_peak / 1e6, current_peak / stem_bytes
+            )
+        )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Benchmark the memory and time of MultiTrack.get_target."
+    )
+    PARSER.add_argument("--n_stems", type=int, default=8, help="Number of stems.")
+    PARSER.add_argument(
+        "--n_channels", type=int, default=2, help="Number of channels per stem."
+    )
+    PARSER.add_argument(
+        "--duration", type=float, default=60.0, help="Stem duration in seconds."
+    )
+    main(PARSER.parse_args())
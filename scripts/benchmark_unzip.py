@@ -0,0 +1,121 @@
+"""Benchmark the throughput and memory use of zip extraction
+
+Creates a synthetic zip of large members, then extracts it with
+download_utils.extractall_unicode using different numbers of workers, and
+with the previous approach of reading each member in memory. Each run is in
+a fresh process so its peak resident memory (RSS) can be reported.
+
+Example:
+    python scripts/benchmark_unzip.py --n_files 4 --file_size 512
+
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import shutil
+import tempfile
+import time
+import zipfile
+
+from mirdata import download_utils
+
+
+def make_zip(zip_path, n_files, file_size, compression):
+    block = os.urandom(1024 * 1024)
+    with zipfile.ZipFile(zip_path, "w", compression=compression) as zfile:
+        for i in range(n_files):
+            with zfile.open("audio/{:04d}.wav".format(i), "w", force_zip64=True) as fd:
+                for _ in range(file_size):
+                    fd.write(block)
+
+
+def extract_in_memory(zfile, out_dir):
+    """Extraction reading each member in memory, as extractall_unicode used to"""
+    for m in zfile.infolist():
+        data = zfile.read(m)
+        disk_file_name = os.path.join(out_dir, m.filename)
+        os.makedirs(os.path.dirname(disk_file_name), exist_ok=True)
+        if not os.path.isdir(disk_file_name):
+            with open(disk_file_name, "wb") as fd:
+                fd.write(data)
+
+
+def run(zip_path, out_dir, workers, queue):
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tic = time.perf_counter()
+    with zipfile.ZipFile(zip_path, "r") as zfile:
+        if workers == 0:
+            extract_in_memory(zfile, out_dir)
+        else:
+            download_utils.extractall_unicode(zfile, out_dir, workers=workers)
+    elapsed = time.perf_counter() - tic
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kB on Linux
+    queue.put((elapsed, start_rss / 1024.0, peak_rss / 1024.0))
+
+
+def main(args):
+    work_dir = args.work_dir or tempfile.mkdtemp()
+    zip_path = os.path.join(work_dir, "benchmark.zip")
+    compression = zipfile.ZIP_DEFLATED if args.deflate else zipfile.ZIP_STORED
+    print(
+        "Creating a zip of {} files of {} MB in {}".format(
+            args.n_files, args.file_size, work_dir
+        )
+    )
+    make_zip(zip_path, args.n_files, args.file_size, compression)
+    total_mb = args.n_files * args.file_size
+
+    context = multiprocessing.get_context("spawn")
+    for workers in [0] + args.workers:
+        out_dir = os.path.join(work_dir, "out")
+        queue = context.Queue()
+        process = context.Process(target=run, args=(zip_path, out_dir, workers, queue))
+        process.start()
+        elapsed, start_rss, peak_rss = queue.get()
+        process.join()
+        shutil.rmtree(out_dir)
+        print(
+            "{:>12}: {:6.2f} s, {:7.1f} MB/s, peak RSS {:7.1f} MB "
+            "(+{:.1f} MB)".format(
+                "in memory" if workers == 0 else "workers={}".format(workers),
+                elapsed,
+                total_mb / elapsed,
+                peak_rss,
+                peak_rss - start_rss,
+            )
+        )
+
+    if args.work_dir is None:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Benchmark download_utils.extractall_unicode on a synthetic zip."
+    )
+    PARSER.add_argument("--n_files", type=int, default=4, help="Number of members.")
+    PARSER.add_argument(
+        "--file_size", type=int, default=256, help="Size of each member in MB."
+    )
+    PARSER.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Numbers of workers to benchmark.",
+    )
+    PARSER.add_argument(
+        "--deflate",
+        action="store_true",
+        help="Compress the members (they are stored by default).",
+    )
+    PARSER.add_argument(
+        "--work_dir",
+        type=str,
+        default=None,
+        help="Where to create the zip. Defaults to a temporary folder.",
+    )
+    main(PARSER.parse_args())
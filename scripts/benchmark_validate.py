@@ -0,0 +1,96 @@
+"""Benchmark the throughput of dataset validation on a synthetic tree
+
+Creates a folder of random files and an index with their checksums, then
+validates it with different numbers of workers and read sizes. The first
+run reads from disk, later runs are likely served by the page cache, so use
+--drop_caches (requires root) or a tree larger than memory for cold numbers.
+
+Example:
+    python scripts/benchmark_validate.py --n_files 200 --file_size 20
+
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+
+from mirdata import validate
+
+
+def make_tree(data_home, n_files, file_size):
+    tracks = {}
+    block = os.urandom(1024 * 1024)
+    for i in range(n_files):
+        path = "{:04d}.bin".format(i)
+        with open(os.path.join(data_home, path), "wb") as fhandle:
+            for _ in range(file_size):
+                fhandle.write(block)
+            fhandle.write(str(i).encode("utf-8"))
+        tracks[str(i)] = {"audio": [path, validate.md5(os.path.join(data_home, path))]}
+    return {"version": "1.0", "tracks": tracks}
+
+
+def main(args):
+    data_home = args.data_home or tempfile.mkdtemp()
+    print(
+        "Creating {} files of {} MB in {}".format(
+            args.n_files, args.file_size, data_home
+        )
+    )
+    index = make_tree(data_home, args.n_files, args.file_size)
+    total_mb = args.n_files * args.file_size
+
+    for chunk_size in [4096, validate.DEFAULT_CHUNK_SIZE]:
+        for workers in args.workers:
+            if args.drop_caches:
+                subprocess.run(["sh", "-c", "sync; echo 3 > /proc/sys/vm/drop_caches"])
+            tic = time.perf_counter()
+            missing, invalid = validate.validate_index(
+                index,
+                data_home,
+                verbose=False,
+                workers=workers,
+                chunk_size=chunk_size,
+                executor=args.executor,
+            )
+            elapsed = time.perf_counter() - tic
+            assert not missing["tracks"] and not invalid["tracks"]
+            print(
+                "chunk_size={:>8} workers={:>2}: {:6.2f} s, {:7.1f} MB/s".format(
+                    chunk_size, workers, elapsed, total_mb / elapsed
+                )
+            )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Benchmark validate.validate_index on a synthetic tree."
+    )
+    PARSER.add_argument("--n_files", type=int, default=100, help="Number of files.")
+    PARSER.add_argument(
+        "--file_size", type=int, default=10, help="Size of each file in MB."
+    )
+    PARSER.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8],
+        help="Numbers of workers to benchmark.",
+    )
+    PARSER.add_argument(
+        "--executor", type=str, default="thread", help="'thread' or 'process'."
+    )
+    PARSER.add_argument(
+        "--data_home",
+        type=str,
+        default=None,
+        help="Where to create the tree. Defaults to a temporary folder.",
+    )
+    PARSER.add_argument(
+        "--drop_caches",
+        action="store_true",
+        help="Drop the page cache before each run (Linux, requires root).",
+    )
+    main(PARSER.parse_args())
@@ -0,0 +1,43 @@
+"""Compile the json dataset indexes into the per-user index cache
+
+Indexes are otherwise compiled the first time they are loaded, see
+mirdata.index_utils.load_index.
+
+"""
+
+import argparse
+import glob
+import os
+
+from mirdata import index_utils
+
+INDEXES_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "mirdata", "datasets", "indexes"
+)
+
+
+def main(args):
+    for json_path in sorted(glob.glob(os.path.join(args.indexes_dir, "*.json"))):
+        compiled_path = index_utils.compile_index(json_path)
+        print(
+            "{} ({} bytes) -> {} ({} bytes)".format(
+                os.path.basename(json_path),
+                os.path.getsize(json_path),
+                os.path.basename(compiled_path),
+                os.path.getsize(compiled_path),
+            )
+        )
+
+
+if __name__ == "__main__":
+    PARSER = argparse.ArgumentParser(
+        description="Compile the json dataset indexes into memory-mapped indexes "
+        "in the per-user index cache."
+    )
+    PARSER.add_argument(
+        "--indexes_dir",
+        type=str,
+        default=INDEXES_DIR,
+        help="Path to the folder containing the json indexes.",
+    )
+    main(PARSER.parse_args())
@@ -51,7 +51,8 @@ def make_acousticbrainz_genre_index(data_path):
             f.write('  \"%s\": {\n' % (track_id,))
             f.write('    \"data\": [\n')
             f.write('      \"%s\",\n' % (ann_path.replace(data_path + '/', ''),))
-            f.write('      \"%s\"\n' % md5(ann_path))
+            f.write('      \"%s\",\n' % md5(ann_path))
+            f.write('      %d\n' % os.path.getsize(ann_path))
             f.write('    ]\n')
             is_the_last = dataset == datasets[-1] and dataset_type == dataset_types[-1] and line == len(read_tsv_list)-1
             if not is_the_last:
@@ -43,12 +43,12 @@ def make_beatport_key_index(data_path):
             if not os.path.exists(meta_path):
                 meta = (None, None)
             else:
-                meta = (meta_path.replace(data_path + '/', ''), md5(meta_path))
+                meta = (meta_path.replace(data_path + '/', ''), md5(meta_path), os.path.getsize(meta_path))
 
             beatport_key_index['tracks'][track_id] = {
-                'audio': (audio_path.replace(data_path + '/', ''), md5(audio_path)),
+                'audio': (audio_path.replace(data_path + '/', ''), md5(audio_path), os.path.getsize(audio_path)),
                 'meta': meta,
-                'key': (chord_path.replace(data_path + '/', ''), md5(chord_path)),
+                'key': (chord_path.replace(data_path + '/', ''), md5(chord_path), os.path.getsize(chord_path)),
             }
     with open(beatport_key_INDEX_PATH, 'w') as fhandle:
         json.dump(beatport_key_index, fhandle, indent=2)
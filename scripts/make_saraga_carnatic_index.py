@@ -68,7 +68,8 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_ghatam = (
                                         audio_ghatam_path,
-                                        audio_ghatam_checksum
+                                        audio_ghatam_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, audio_ghatam_path)),
                                     )
                                 if 'mridangam-left' in file:
                                     audio_mridangam_left_path = os.path.join('saraga1.5_carnatic', concert, song, file)
@@ -77,7 +78,8 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_mridangam_left = (
                                         audio_mridangam_left_path,
-                                        audio_mridangam_left_checksum
+                                        audio_mridangam_left_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, audio_mridangam_left_path)),
                                     )
                                 if 'mridangam-right' in file:
                                     mridangam_right_path = os.path.join('saraga1.5_carnatic', concert, song, file)
@@ -86,7 +88,8 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_mridangam_right = (
                                         mridangam_right_path,
-                                        mridangam_right_checksum
+                                        mridangam_right_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, mridangam_right_path)),
                                     )
                                 if 'violin' in file:
                                     audio_violin_path = os.path.join('saraga1.5_carnatic', concert, song, file)
@@ -95,7 +98,8 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_violin = (
                                         audio_violin_path,
-                                        audio_violin_checksum
+                                        audio_violin_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, audio_violin_path)),
                                     )
                                 if 'vocal-s' in file:
                                     audio_vocal_s_path = os.path.join('saraga1.5_carnatic', concert, song, file)
@@ -104,7 +108,8 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_vocal_s = (
                                         audio_vocal_s_path,
-                                        audio_vocal_s_checksum
+                                        audio_vocal_s_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, audio_vocal_s_path)),
                                     )
                                 if 'vocal.' in file:
                                     audio_vocal_path = os.path.join('saraga1.5_carnatic', concert, song, file)
@@ -113,46 +118,47 @@ def make_saraga_carnatic_index(dataset_data_path):
                                     )
                                     audio_vocal = (
                                         audio_vocal_path,
-                                        audio_vocal_checksum
+                                        audio_vocal_checksum,
+                                        os.path.getsize(os.path.join(dataset_data_path_prev, audio_vocal_path)),
                                     )
 
                             else:
                                 audio_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                                 audio_checksum = md5(os.path.join(dataset_data_path_prev, audio_path))
-                                audio = (audio_path, audio_checksum)
+                                audio = (audio_path, audio_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, audio_path)))
 
                         if 'ctonic.' in file:
                             ctonic_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             ctonic_checksum = md5(os.path.join(dataset_data_path_prev, ctonic_path))
-                            ctonic = (ctonic_path, ctonic_checksum)
+                            ctonic = (ctonic_path, ctonic_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, ctonic_path)))
                         if 'pitch.' in file:
                             pitch_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             pitch_checksum = md5(os.path.join(dataset_data_path_prev, pitch_path))
-                            pitch = (pitch_path, pitch_checksum)
+                            pitch = (pitch_path, pitch_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, pitch_path)))
                         if 'pitch-vocal' in file:
                             pitch_v_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             pitch_v_checksum = md5(os.path.join(dataset_data_path_prev, pitch_v_path))
-                            pitch_v = (pitch_v_path, pitch_v_checksum)
+                            pitch_v = (pitch_v_path, pitch_v_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, pitch_v_path)))
                         if 'tempo-manual' in file:
                             tempo_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             tempo_checksum = md5(os.path.join(dataset_data_path_prev, tempo_path))
-                            tempo = (tempo_path, tempo_checksum)
+                            tempo = (tempo_path, tempo_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, tempo_path)))
                         if 'sama-manual' in file:
                             sama_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             sama_checksum = md5(os.path.join(dataset_data_path_prev, sama_path))
-                            sama = (sama_path, sama_checksum)
+                            sama = (sama_path, sama_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, sama_path)))
                         if 'sections-manual-p.txt' in file:
                             sections_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             sections_checksum = md5(os.path.join(dataset_data_path_prev, sections_path))
-                            sections = (sections_path, sections_checksum)
+                            sections = (sections_path, sections_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, sections_path)))
                         if 'mphrase' in file:
                             phrases_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             phrases_checksum = md5(os.path.join(dataset_data_path_prev, phrases_path))
-                            phrases = (phrases_path, phrases_checksum)
+                            phrases = (phrases_path, phrases_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, phrases_path)))
                         if '.json' in file:
                             metadata_path = os.path.join('saraga1.5_carnatic', concert, song, file)
                             metadata_checksum = md5(os.path.join(dataset_data_path_prev, metadata_path))
-                            metadata = (metadata_path, metadata_checksum)
+                            metadata = (metadata_path, metadata_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, metadata_path)))
 
                         saraga_index['tracks'][index] = {
                             'audio-mix': audio,
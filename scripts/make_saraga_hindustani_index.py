@@ -56,35 +56,35 @@ def make_saraga_hindustani_index(dataset_data_path):
                         if '.mp3' in file:
                             audio_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             audio_checksum = md5(os.path.join(dataset_data_path_prev, audio_path))
-                            audio = (audio_path, audio_checksum)
+                            audio = (audio_path, audio_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, audio_path)))
                         if 'ctonic' in file:
                             ctonic_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             ctonic_checksum = md5(os.path.join(dataset_data_path_prev, ctonic_path))
-                            ctonic = (ctonic_path, ctonic_checksum)
+                            ctonic = (ctonic_path, ctonic_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, ctonic_path)))
                         if 'pitch.' in file:
                             pitch_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             pitch_checksum = md5(os.path.join(dataset_data_path_prev, pitch_path))
-                            pitch = (pitch_path, pitch_checksum)
+                            pitch = (pitch_path, pitch_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, pitch_path)))
                         if 'tempo-manual' in file:
                             tempo_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             tempo_checksum = md5(os.path.join(dataset_data_path_prev, tempo_path))
-                            tempo = (tempo_path, tempo_checksum)
+                            tempo = (tempo_path, tempo_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, tempo_path)))
                         if 'sama-manual' in file:
                             sama_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             sama_checksum = md5(os.path.join(dataset_data_path_prev, sama_path))
-                            sama = (sama_path, sama_checksum)
+                            sama = (sama_path, sama_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, sama_path)))
                         if 'sections-manual-p' in file:
                             sections_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             sections_checksum = md5(os.path.join(dataset_data_path_prev, sections_path))
-                            sections = (sections_path, sections_checksum)
+                            sections = (sections_path, sections_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, sections_path)))
                         if 'mphrase' in file:
                             phrases_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             phrases_checksum = md5(os.path.join(dataset_data_path_prev, phrases_path))
-                            phrases = (phrases_path, phrases_checksum)
+                            phrases = (phrases_path, phrases_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, phrases_path)))
                         if '.json' in file:
                             metadata_path = os.path.join('saraga1.5_hindustani/', concert, song, file)
                             metadata_checksum = md5(os.path.join(dataset_data_path_prev, metadata_path))
-                            metadata = (metadata_path, metadata_checksum)
+                            metadata = (metadata_path, metadata_checksum, os.path.getsize(os.path.join(dataset_data_path_prev, metadata_path)))
 
                         saraga_index['tracks'][index] = {
                             'audio': audio,
@@ -44,11 +44,11 @@ def make_classicalDB_index(data_path):
             key_path = os.path.join(key_dir, key_file)
 
             classicalDB_index[track_id] = {
-                'audio': (audio_path.replace(data_path + '/', ''), md5(audio_path)),
-                'key': (key_path.replace(data_path + '/', ''), md5(key_path)),
-                'spectrum': (spectrum_path.replace(data_path + '/', ''), md5(spectrum_path)),
-                'mb': (mb_path.replace(data_path + '/', ''), md5(mb_path)),
-                'HPCP': (HPCP_path.replace(data_path + '/', ''), md5(HPCP_path))
+                'audio': (audio_path.replace(data_path + '/', ''), md5(audio_path), os.path.getsize(audio_path)),
+                'key': (key_path.replace(data_path + '/', ''), md5(key_path), os.path.getsize(key_path)),
+                'spectrum': (spectrum_path.replace(data_path + '/', ''), md5(spectrum_path), os.path.getsize(spectrum_path)),
+                'mb': (mb_path.replace(data_path + '/', ''), md5(mb_path), os.path.getsize(mb_path)),
+                'HPCP': (HPCP_path.replace(data_path + '/', ''), md5(HPCP_path), os.path.getsize(HPCP_path))
             }
     with open(classicalDB_INDEX_PATH, 'w') as fhandle:
         json.dump(classicalDB_index, fhandle, indent=2)
@@ -34,6 +34,8 @@ if __name__ == "__main__":
             "tqdm",
             "librosa >= 0.8.0",
             "numpy>=1.16",
+            "soundfile",
+            "soxr",
             "jams",
             "requests",
             "pretty_midi >= 0.2.8",
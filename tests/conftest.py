@@ -20,6 +20,18 @@ def pytest_addoption(parser):
 #     return request.config.getoption('--local')
 
 
+@pytest.fixture(scope="session", autouse=True)
+def index_cache_dir(tmp_path_factory):
+    """Compile the indexes loaded by the tests in a temporary folder"""
+    from mirdata import index_utils
+
+    path = str(tmp_path_factory.mktemp("index_cache"))
+    previous = index_utils.INDEX_CACHE_DIR
+    index_utils.INDEX_CACHE_DIR = path
+    yield path
+    index_utils.INDEX_CACHE_DIR = previous
+
+
 @pytest.fixture(scope="session")
 def skip_local(request):
     if request.config.getoption("--local"):
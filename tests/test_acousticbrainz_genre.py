@@ -7,6 +7,18 @@ from mirdata.datasets import acousticbrainz_genre
 from tests.test_utils import run_track_tests
 
 
+def clean_remote_index():
+    index_path = os.path.join(
+        "mirdata", "datasets/indexes", "acousticbrainz_genre_dataset_little_test.json"
+    )
+    os.remove(index_path)
+    for path in [index_path, index_path + ".zip"]:
+        download_utils.remove_stamp(path)
+    macosx_path = os.path.join("mirdata", "datasets/indexes", "__MACOSX")
+    if os.path.exists(macosx_path):
+        shutil.rmtree(macosx_path)
+
+
 def test_track(httpserver):
     default_trackid = "tagtraum#validation#be9e01e5-8f93-494d-bbaa-ddcc5a52f629#2b6bfcfd-46a5-3f98-a58f-2c51d7c9e960#trance########"
     data_home = "tests/resources/mir_datasets/acousticbrainz_genre"
@@ -32,6 +44,12 @@ def test_track(httpserver):
         remote_index_name="acousticbrainz_genre_dataset_little_test.json",
     )
     track = dataset.track(default_trackid)
+    # only the index is left in the package's index folder
+    indexes_path = os.path.join("mirdata", "datasets/indexes")
+    assert not os.path.exists(os.path.join(indexes_path, "__MACOSX"))
+    assert not os.path.exists(
+        os.path.join(indexes_path, "acousticbrainz_genre_dataset_little_test.json.zip")
+    )
 
     expected_attributes = {
         "path": "tests/resources/mir_datasets/acousticbrainz_genre/acousticbrainz-mediaeval-validation/be/be9e01e5-8f93-494d-bbaa-ddcc5a52f629.json",
@@ -55,13 +73,7 @@ def test_track(httpserver):
     }
 
     run_track_tests(track, expected_attributes, expected_property_types)
-    os.remove(
-        os.path.join(
-            "mirdata",
-            "datasets/indexes",
-            "acousticbrainz_genre_dataset_little_test.json",
-        )
-    )
+    clean_remote_index()
 
 
 features = {
@@ -3954,13 +3966,7 @@ def test_to_jams(httpserver):
         }
     )
     jam = track.to_jams()
-    os.remove(
-        os.path.join(
-            "mirdata",
-            "datasets/indexes",
-            "acousticbrainz_genre_dataset_little_test.json",
-        )
-    )
+    clean_remote_index()
 
     assert jam_ground_truth == jam
 
@@ -4004,13 +4010,7 @@ def test_filter_index(httpserver):
     assert len(index) == 2
     index = dataset.load_discogs_validation()
     assert len(index) == 2
-    os.remove(
-        os.path.join(
-            "mirdata",
-            "datasets/indexes",
-            "acousticbrainz_genre_dataset_little_test.json",
-        )
-    )
+    clean_remote_index()
 
 
 # TODO Fix this test
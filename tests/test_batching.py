@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+import mirdata
+from mirdata import annotations, batching
+
+ORCHSET_HOME = "tests/resources/mir_datasets/orchset"
+ORCHSET_TRACK = "Beethoven-S3-I-ex1"
+
+
+def test_crop_annotation_times():
+    beats = annotations.BeatData(np.array([0.5, 1.0, 1.5, 2.0]), np.array([1, 2, 3, 4]))
+    cropped = batching.crop_annotation(beats, 1.0, 2.0)
+    assert isinstance(cropped, annotations.BeatData)
+    assert np.allclose(cropped.times, [0.0, 0.5])
+    assert np.array_equal(cropped.positions, [2, 3])
+    # the original annotation is unchanged
+    assert len(beats.times) == 4
+
+    beats = annotations.BeatData(np.array([0.5, 1.0]))
+    cropped = batching.crop_annotation(beats, 0.0, 0.7)
+    assert np.allclose(cropped.times, [0.5])
+    assert cropped.positions is None
+
+
+def test_crop_annotation_intervals():
+    chords = annotations.ChordData(
+        np.array([[0.0, 1.0], [1.0, 2.5], [2.5, 3.0]]), ["C:maj", "G:maj", "A:min"]
+    )
+    cropped = batching.crop_annotation(chords, 0.5, 2.0)
+    assert np.allclose(cropped.intervals, [[0.0, 0.5], [0.5, 1.5]])
+    assert cropped.labels == ["C:maj", "G:maj"]
+    assert cropped.confidence is None
+
+    cropped = batching.crop_annotation(chords, 5.0, 6.0)
+    assert cropped.intervals.shape == (0, 2)
+    assert cropped.labels == []
+
+
+def test_crop_annotation_other():
+    assert batching.crop_annotation(None, 0.0, 1.0) is None
+    assert batching.crop_annotation("E:minor", 0.0, 1.0) == "E:minor"
+
+
+def test_iter_batches(mocker):
+    dataset = mirdata.initialize("orchset", ORCHSET_HOME)
+    track = dataset.track(ORCHSET_TRACK)
+    melody = track.melody
+    spy = mocker.spy(mirdata.io.librosa, "load")
+
+    batches = dataset.iter_batches(
+        2,
+        0.5,
+        8000,
+        annotations=["melody"],
+        audio_property="audio_mono",
+        track_ids=[ORCHSET_TRACK],
+        crops_per_track=5,
+        seed=0,
+        workers=2,
+    )
+    assert repr(batches) == "BatchIterator(1 tracks, batch_size=2, duration=0.5)"
+    batch_list = list(batches)
+    assert [len(batch["track_ids"]) for batch in batch_list] == [2, 2, 1]
+
+    # only the crops are decoded, never the whole track
+    assert spy.call_count == 5
+    assert all(call[1]["duration"] == 0.5 for call in spy.call_args_list)
+
+    for batch in batch_list:
+        assert batch["audio"].shape[1:] == (4000,)
+        assert batch["audio"].flags["C_CONTIGUOUS"]
+        assert batch["audio"].dtype == np.float32
+        for i, offset in enumerate(batch["offsets"]):
+            expected, _ = mirdata.io.conform_audio(
+                track.get_audio(offset, 0.5, audio_property="audio_mono"),
+                sample_rate=8000,
+            )
+            assert np.array_equal(batch["audio"][i], expected[:4000])
+            expected = batching.crop_annotation(melody, offset, offset + 0.5)
+            assert np.array_equal(batch["melody"][i].times, expected.times)
+            assert np.all(batch["melody"][i].times < 0.5)
+
+    stats = batches.stats
+    assert stats["tracks"] == 1
+    assert stats["examples"] == 5
+    assert stats["batches"] == 3
+    assert stats["errors"] == 0
+    assert stats["examples_per_second"] > 0
+    assert stats["load_seconds"] > 0
+
+    # the same seed gives the same crops
+    offsets = np.sort(np.concatenate([batch["offsets"] for batch in batch_list]))
+    batches = dataset.iter_batches(
+        5,
+        0.5,
+        8000,
+        audio_property="audio_mono",
+        track_ids=[ORCHSET_TRACK],
+        crops_per_track=5,
+        seed=0,
+    )
+    assert np.array_equal(np.sort(next(batches)["offsets"]), offsets)
+    batches.close()
+
+
+def test_iter_batches_padding_and_channels():
+    dataset = mirdata.initialize("orchset", ORCHSET_HOME, sample_rate=8000)
+    # the track lasts 2 seconds, so the crop is zero-padded
+    with dataset.iter_batches(
+        4,
+        3.0,
+        8000,
+        audio_property="audio_stereo",
+        track_ids=[ORCHSET_TRACK],
+        mono=False,
+    ) as batches:
+        batch = next(batches)
+    assert batch["audio"].shape == (1, 2, 24000)
+    assert batch["offsets"][0] == 0
+    assert np.any(batch["audio"][0, :, :16000] != 0)
+    assert np.all(batch["audio"][0, :, 16000:] == 0)
+
+
+def test_iter_batches_errors():
+    dataset = mirdata.initialize("orchset", ORCHSET_HOME)
+    track_ids = dataset.track_ids[:5]
+    batches = dataset.iter_batches(
+        2, 0.5, 8000, audio_property="audio_mono", track_ids=track_ids, drop_last=True
+    )
+    # only one track exists in the test data, and its batch is dropped
+    assert list(batches) == []
+    assert sorted(batches.errors) == sorted(set(track_ids) - {ORCHSET_TRACK})
+    assert isinstance(list(batches.errors.values())[0], IOError)
+    assert batches.stats["errors"] == 4
+
+    with pytest.raises(ValueError):
+        dataset.iter_batches(0, 0.5, 8000)
+    with pytest.raises(ValueError):
+        dataset.iter_batches(2, 0.5, 8000, workers=0)
+
+
+def test_iter_batches_close():
+    dataset = mirdata.initialize("orchset", ORCHSET_HOME)
+    batches = dataset.iter_batches(
+        1,
+        0.1,
+        8000,
+        audio_property="audio_mono",
+        track_ids=[ORCHSET_TRACK],
+        crops_per_track=50,
+        queue_size=2,
+    )
+    next(batches)
+    # workers blocked on the full queue are stopped
+    batches.close()
+    with pytest.raises(StopIteration):
+        next(batches)
+
+
+def test_audio_duration(mocker):
+    dataset = mirdata.initialize("orchset", ORCHSET_HOME)
+    track = dataset.track(ORCHSET_TRACK)
+    assert np.isclose(batching.audio_duration(track, "audio_mono"), 2.0, atol=0.01)
+    assert batching.audio_duration(track, "melody") is None
+    assert batching.audio_duration(track, "missing") is None
+
+    # without a duration, the whole track is decoded and cropped
+    mocker.patch.object(batching, "audio_duration", return_value=None)
+    spy = mocker.spy(mirdata.io.librosa, "load")
+    with dataset.iter_batches(
+        3, 0.5, 8000, audio_property="audio_mono", track_ids=[ORCHSET_TRACK]
+    ) as batches:
+        batch = next(batches)
+    assert batch["audio"].shape == (1, 4000)
+    assert spy.call_count == 1
+    assert spy.call_args[1]["duration"] is None
@@ -0,0 +1,321 @@
+import os
+
+import numpy as np
+import pytest
+
+import mirdata
+from mirdata import annotations, cache, core, io, validate
+from mirdata.datasets import beatles, orchset
+
+BEATLES_AUDIO = (
+    "tests/resources/mir_datasets/beatles/audio/01_-_Please_Please_Me/"
+    "11_-_Do_You_Want_To_Know_A_Secret.wav"
+)
+ORCHSET_AUDIO = (
+    "tests/resources/mir_datasets/orchset/audio/stereo/Beethoven-S3-I-ex1.wav"
+)
+
+
+def assert_annotations_equal(annotation1, annotation2):
+    assert type(annotation1) == type(annotation2)
+    attributes1 = vars(annotation1)
+    attributes2 = vars(annotation2)
+    assert attributes1.keys() == attributes2.keys()
+    for name, value in attributes1.items():
+        if isinstance(value, np.ndarray):
+            assert value.dtype == attributes2[name].dtype
+            assert np.array_equal(value, attributes2[name])
+        else:
+            assert value == attributes2[name]
+            assert type(value) == type(attributes2[name])
+
+
+ANNOTATIONS = [
+    annotations.BeatData(np.array([1.0, 2.0]), np.array([3, 4])),
+    annotations.BeatData(np.array([1.0, 2.0]), None),
+    annotations.SectionData(np.array([[1.0, 2.0], [2.0, 3.0]]), ["a", "b"]),
+    annotations.NoteData(np.array([[1.0, 2.0]]), np.array([440.0]), np.array([0.5])),
+    annotations.ChordData(np.array([[1.0, 2.0]]), ["C:maj"]),
+    annotations.F0Data(np.array([1.0, 2.0]), np.array([100.0, 0.0])),
+    annotations.KeyData(np.array([[1.0, 2.0]]), ["Eb:minor"]),
+    annotations.LyricData(np.array([[1.0, 2.0]]), ["la"], ["l a"]),
+    annotations.TempoData(np.array([[1.0, 2.0]]), np.array([120.0])),
+    annotations.EventData(np.array([[1.0, 2.0]]), ["event"]),
+]
+
+
+@pytest.mark.parametrize("annotation", ANNOTATIONS)
+def test_annotation_roundtrip(annotation, tmpdir):
+    path = str(tmpdir.join("annotation.npz"))
+    cache.atomic_write(path, cache.annotation_to_bytes(annotation))
+    assert_annotations_equal(annotation, cache.annotation_from_file(path))
+
+
+def test_annotation_roundtrip_nested_list(tmpdir):
+    # MultiF0Data with empty frames, built without validation
+    annotation = annotations.MultiF0Data.__new__(annotations.MultiF0Data)
+    annotation.times = np.array([0.0, 0.1, 0.2])
+    annotation.frequency_list = [[100.0, 200.0], [], [300.0]]
+    annotation.confidence_list = None
+
+    path = str(tmpdir.join("annotation.npz"))
+    cache.atomic_write(path, cache.annotation_to_bytes(annotation))
+    assert_annotations_equal(annotation, cache.annotation_from_file(path))
+
+
+def test_annotation_to_bytes_unsupported():
+    annotation = annotations.BeatData(np.array([1.0]))
+    annotation.extra = {"a": 1}
+    assert cache.annotation_to_bytes(annotation) is None
+
+
+def test_annotation_cache(tmpdir):
+    annotation_cache = cache.AnnotationCache(str(tmpdir))
+    annotation = ANNOTATIONS[0]
+
+    assert annotation_cache.get("beatles", "Track.beats", "1234") is None
+    assert annotation_cache.put("beatles", "Track.beats", "1234", annotation)
+    assert os.path.exists(annotation_cache.path("beatles", "Track.beats", "1234"))
+    assert_annotations_equal(
+        annotation, annotation_cache.get("beatles", "Track.beats", "1234")
+    )
+    assert not annotation_cache.put(
+        "beatles", "Track.beats", "5678", "not an annotation"
+    )
+
+    # unreadable entries are ignored
+    with open(annotation_cache.path("beatles", "Track.beats", "1234"), "wb") as f:
+        f.write(b"garbage")
+    assert annotation_cache.get("beatles", "Track.beats", "1234") is None
+
+    annotation_cache.clear("beatles")
+    assert not os.path.exists(os.path.join(str(tmpdir), "annotations", "beatles"))
+    annotation_cache.clear()
+
+
+def test_track_annotation_cache(tmpdir, mocker):
+    cache_dir = str(tmpdir)
+    dataset = mirdata.initialize(
+        "beatles", "tests/resources/mir_datasets/beatles", annotation_cache=cache_dir
+    )
+    assert isinstance(dataset.annotation_cache, cache.AnnotationCache)
+    assert dataset.annotation_cache.cache_dir == cache_dir
+
+    track = dataset.track("0111")
+    beats = track.beats
+    # the entry is keyed on the checksum of the beats file
+    checksum = track._track_paths["beat"][1]
+    assert cache.property_checksum(track, type(track).beats.func) == checksum
+    entry = dataset.annotation_cache.path("beatles", "Track.beats", checksum)
+    assert os.path.exists(entry)
+
+    # a new track reads the annotation from the cache instead of parsing it
+    mock_load_beats = mocker.patch.object(
+        mirdata.datasets.beatles, "load_beats", side_effect=AssertionError
+    )
+    assert_annotations_equal(beats, dataset.track("0111").beats)
+
+    # changes to the track's other files do not invalidate the entry
+    track = dataset.track("0111")
+    audio_path = track._track_paths["audio"][0]
+    track._track_paths = dict(track._track_paths, audio=[audio_path, "changed"])
+    assert_annotations_equal(beats, track.beats)
+
+    # a different checksum of the beats file is a different cache entry
+    track = dataset.track("0111")
+    beat_path = track._track_paths["beat"][0]
+    track._track_paths = dict(track._track_paths, beat=[beat_path, "changed"])
+    mock_load_beats.side_effect = None
+    mock_load_beats.return_value = beats
+    track.beats
+    mock_load_beats.assert_called_once()
+    assert cache.property_checksum(track, type(track).beats.func) == "changed"
+
+
+def test_initialize_annotation_cache():
+    dataset = mirdata.initialize("beatles")
+    assert dataset.annotation_cache is None
+
+    dataset = mirdata.initialize("beatles", annotation_cache=True)
+    assert dataset.annotation_cache.cache_dir == cache.DEFAULT_CACHE_DIR
+
+
+def test_track_checksum():
+    class TestTrack(core.Track):
+        def __init__(self, track_paths):
+            self._track_paths = track_paths
+
+    assert cache.track_checksum(TestTrack(None)) is None
+    checksum = cache.track_checksum(TestTrack({"a": ["a.wav", "1"], "b": [None, None]}))
+    assert checksum == cache.track_checksum(
+        TestTrack({"b": [None, None], "a": ["a.wav", "1"]})
+    )
+    assert checksum != cache.track_checksum(TestTrack({"a": ["a.wav", "2"]}))
+
+
+def test_audio_cache(tmpdir, mocker):
+    audio_cache = cache.AudioCache(str(tmpdir))
+    audio, sr = beatles.load_audio(BEATLES_AUDIO)
+
+    with io.audio_options(audio_cache=audio_cache):
+        audio_first, sr_first = beatles.load_audio(BEATLES_AUDIO)
+        assert np.array_equal(audio, audio_first)
+        assert sr_first == sr
+
+        # the second read comes from the cache, memory-mapped
+        mock_load = mocker.patch.object(io.librosa, "load", side_effect=AssertionError)
+        audio_cached, sr_cached = beatles.load_audio(BEATLES_AUDIO)
+        assert isinstance(audio_cached, np.memmap)
+        assert audio_cached.dtype == np.float32
+        assert np.array_equal(audio, audio_cached)
+        assert sr_cached == sr
+        assert type(sr_cached) == type(sr)
+
+        # other decoding parameters are other entries
+        mock_load.side_effect = None
+        mock_load.return_value = (audio[:10], 22050)
+        assert io.load_audio(BEATLES_AUDIO, sr=22050)[1] == 22050
+        mock_load.assert_called_once()
+
+    checksum = validate.md5(BEATLES_AUDIO)
+    key = cache.AudioCache.key(checksum, None, True, np.float32)
+    assert key == "{}_native_mono_float32".format(checksum)
+    assert cache.AudioCache.key(
+        checksum, 22050, False, np.float64, "soxr_lq"
+    ) == "{}_22050-soxr_lq_multi_float64".format(checksum)
+    assert os.path.exists(audio_cache.path(key))
+    assert audio_cache.get(cache.AudioCache.key(checksum, 22050, True, np.float32))
+
+    # unreadable entries are ignored
+    with open(audio_cache.path(key), "wb") as fhandle:
+        fhandle.write(b"garbage")
+    assert audio_cache.get(key) is None
+
+    audio_cache.clear()
+    assert not os.path.exists(os.path.join(str(tmpdir), "audio"))
+
+
+def test_audio_cache_eviction(tmpdir):
+    audio_cache = cache.AudioCache(str(tmpdir), max_bytes=2500)
+    audio = np.zeros((1000,), dtype=np.float32)  # 4000 bytes
+    assert not audio_cache.put("aa_big", audio, 44100)
+    assert not os.path.exists(audio_cache.path("aa_big"))
+
+    audio = np.zeros((250,), dtype=np.float32)  # ~1100 bytes with the npy header
+    assert audio_cache.put("aa_1", audio, 44100)
+    assert audio_cache.put("bb_2", audio, 44100)
+    audio_cache.get("aa_1")  # aa_1 is now the most recently used entry
+    assert audio_cache.put("cc_3", audio, 44100)
+
+    assert audio_cache.get("aa_1") is not None
+    assert audio_cache.get("bb_2") is None
+    assert not os.path.exists(audio_cache.path("bb_2"))
+    assert audio_cache.get("cc_3") is not None
+
+
+def test_audio_cache_file_checksum(tmpdir, mocker):
+    audio_cache = cache.AudioCache(str(tmpdir.join("cache")))
+    path = str(tmpdir.join("audio.wav"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(b"abc")
+    checksum = audio_cache.file_checksum(path)
+    assert checksum == validate.md5(path)
+
+    # checksums are stored until the file changes
+    mock_md5 = mocker.patch.object(validate, "md5", return_value="1234")
+    assert audio_cache.file_checksum(path) == checksum
+    mock_md5.assert_not_called()
+
+    with open(path, "wb") as fhandle:
+        fhandle.write(b"abcd")
+    assert audio_cache.file_checksum(path) == "1234"
+
+    with pytest.raises(OSError):
+        audio_cache.file_checksum(str(tmpdir.join("missing.wav")))
+
+
+def test_track_audio_cache(tmpdir, mocker):
+    dataset = mirdata.initialize(
+        "orchset", "tests/resources/mir_datasets/orchset", audio_cache=str(tmpdir)
+    )
+    assert isinstance(dataset.audio_cache, cache.AudioCache)
+    assert dataset.audio_cache.cache_dir == str(tmpdir)
+    md5 = mocker.spy(validate, "md5")
+    track = dataset.track("Beethoven-S3-I-ex1")
+    audio, sr = track.audio_stereo
+    assert audio.shape[0] == 2
+
+    # entries are keyed by the checksum in the index, the file is not hashed
+    assert md5.call_count == 0
+    checksum = track._track_paths["audio_stereo"][1]
+    key = cache.AudioCache.key(checksum, None, False, np.float32)
+    assert os.path.exists(dataset.audio_cache.path(key))
+
+    mocker.patch.object(io.librosa, "load", side_effect=AssertionError)
+    audio_cached, sr_cached = dataset.track("Beethoven-S3-I-ex1").audio_stereo
+    assert np.array_equal(audio, audio_cached)
+    assert sr == sr_cached
+
+    # cached audio can be modified in place, without changing the cache entry
+    audio_cached *= 0
+    audio_again, _ = dataset.track("Beethoven-S3-I-ex1").audio_stereo
+    assert np.array_equal(audio, audio_again)
+
+    # module-level loaders do not use the dataset's cache
+    with pytest.raises(AssertionError):
+        orchset.load_audio_stereo(ORCHSET_AUDIO)
+
+
+def test_initialize_audio_cache(tmpdir):
+    dataset = mirdata.initialize("beatles")
+    assert dataset.audio_cache is None
+    assert not hasattr(dataset.track("0111"), "_audio_options")
+
+    dataset = mirdata.initialize("beatles", audio_cache=True)
+    assert dataset.audio_cache.cache_dir == cache.DEFAULT_CACHE_DIR
+
+    audio_cache = cache.AudioCache(str(tmpdir), max_bytes=1000)
+    dataset = mirdata.initialize("beatles", audio_cache=audio_cache)
+    assert dataset.audio_cache is audio_cache
+    assert dataset.track("0111")._audio_options == {"audio_cache": audio_cache}
+
+
+def test_audio_cache_resampled(tmpdir, mocker):
+    dataset = mirdata.initialize(
+        "orchset",
+        "tests/resources/mir_datasets/orchset",
+        audio_cache=str(tmpdir),
+        sample_rate=8000,
+        resample_quality="fast",
+    )
+    audio, sr = dataset.track("Beethoven-S3-I-ex1").audio_stereo
+    assert sr == 8000
+    key = cache.AudioCache.key(
+        dataset.track("Beethoven-S3-I-ex1")._track_paths["audio_stereo"][1],
+        8000,
+        False,
+        np.float32,
+        io.resample_type("fast"),
+    )
+    assert os.path.exists(dataset.audio_cache.path(key))
+
+    # resampled audio is read from the cache
+    mocker.patch.object(io.librosa, "load", side_effect=AssertionError)
+    audio_cached, sr_cached = dataset.track("Beethoven-S3-I-ex1").audio_stereo
+    assert sr_cached == 8000
+    assert np.array_equal(audio, audio_cached)
+
+
+def test_audio_cache_segment(tmpdir, mocker):
+    dataset = mirdata.initialize(
+        "orchset", "tests/resources/mir_datasets/orchset", audio_cache=str(tmpdir)
+    )
+    track = dataset.track("Beethoven-S3-I-ex1")
+    audio, sr = track.audio_stereo
+
+    # segments are cut from the cached audio, without decoding the file again
+    mocker.patch.object(io.librosa, "load", side_effect=AssertionError)
+    segment, sr_segment = track.get_audio(0.5, 0.25, audio_property="audio_stereo")
+    assert sr_segment == sr
+    assert isinstance(segment, np.memmap)
+    assert np.array_equal(segment, audio[:, 22050:33075])
@@ -1,8 +1,15 @@
+import hashlib
+import os
+import shutil
+import tarfile
+import time
+import zipfile
+
 import pytest
 import numpy as np
 
 import mirdata
-from mirdata import core
+from mirdata import annotations, core, download_utils, io, validate
 
 
 def test_track_repr():
@@ -70,6 +77,294 @@ def test_dataset_errors():
         d.choice_track()
 
 
+def test_dataset_validate_subset(tmp_path):
+    # validate a copy, so the validation database is not written in the resources
+    data_home = str(tmp_path / "guitarset")
+    shutil.copytree("tests/resources/mir_datasets/guitarset", data_home)
+    dataset = mirdata.initialize("guitarset", data_home)
+    track_id = "03_BN3-119-G_solo"
+    missing, invalid = dataset.validate(verbose=False, track_ids=[track_id])
+    assert missing == {"tracks": {}}
+    # the test files are cut versions of the original files
+    assert len(invalid["tracks"][track_id]) == 5
+
+    missing, invalid = dataset.validate(
+        verbose=False, track_ids=[track_id], remote_keys=["annotations", "audio_mic"]
+    )
+    assert missing == {"tracks": {}}
+
+    # other tracks were not downloaded
+    missing, invalid = dataset.validate(
+        verbose=False, remote_keys=["annotations"], level="quick"
+    )
+    assert len(missing["tracks"]) == len(dataset.track_ids) - 1
+    assert all(
+        path.endswith(".jams") for paths in missing["tracks"].values() for path in paths
+    )
+
+    with pytest.raises(ValueError):
+        dataset.validate(verbose=False, remote_keys=["not_a_remote"])
+    with pytest.raises(ValueError):
+        dataset.validate(verbose=False, track_ids=["not_a_track"])
+    with pytest.raises(ValueError):
+        mirdata.initialize("irmas").validate(remote_keys=["training_data"])
+
+
+def _remote_test_dataset(tmpdir):
+    """A dataset of a zip, a tar.gz and a csv file, downloaded from tmpdir"""
+    source = tmpdir.mkdir("source")
+    contents = {
+        "meta.csv": b"track_id\nt1\nt2\n",
+        "audio/t1.wav": b"audio 1",
+        "audio/t2.wav": b"audio 2",
+        "annot/t1.txt": b"annotation 1",
+        "annot/t2.txt": b"annotation 2",
+    }
+    with zipfile.ZipFile(str(source.join("audio.zip")), "w") as zfile:
+        for name in ["t1.wav", "t2.wav"]:
+            zfile.writestr(name, contents["audio/" + name])
+    with tarfile.open(str(source.join("annot.tar.gz")), "w:gz") as tfile:
+        for name in ["t1.txt", "t2.txt"]:
+            source.join(name).write_binary(contents["annot/" + name])
+            tfile.add(str(source.join(name)), arcname=name)
+    source.join("meta.csv").write_binary(contents["meta.csv"])
+
+    def remote(filename, destination_dir):
+        return download_utils.RemoteFileMetadata(
+            filename=filename,
+            url="file://" + str(source.join(filename)),
+            checksum=validate.md5(str(source.join(filename))),
+            destination_dir=destination_dir,
+        )
+
+    def entry(path):
+        return [path, hashlib.md5(contents[path]).hexdigest()]
+
+    index = {
+        "version": "1.0",
+        "metadata": {"meta": entry("meta.csv")},
+        "tracks": {
+            track_id: {
+                "audio": entry("audio/{}.wav".format(track_id)),
+                "annot": entry("annot/{}.txt".format(track_id)),
+            }
+            for track_id in ["t1", "t2"]
+        },
+    }
+    data_home = str(tmpdir.join("data"))
+    dataset = core.Dataset(
+        data_home,
+        index=index,
+        name="test",
+        remotes={
+            "audio": remote("audio.zip", "audio"),
+            "annot": remote("annot.tar.gz", "annot"),
+            "meta": remote("meta.csv", None),
+        },
+    )
+    return dataset, contents
+
+
+def _report_files(report, data_home):
+    """The paths (relative to data_home) of a missing or invalid files report"""
+    return sorted(
+        os.path.relpath(path, data_home)
+        for files in report.values()
+        for paths in files.values()
+        for path in paths
+    )
+
+
+def test_dataset_download_selection(tmpdir, mocker):
+    dataset, contents = _remote_test_dataset(tmpdir)
+    data_home = dataset.data_home
+    download_remote = mocker.spy(download_utils, "download_remote")
+
+    def downloaded():
+        return sorted(call.args[0].filename for call in download_remote.call_args_list)
+
+    def extracted():
+        return sorted(
+            os.path.relpath(os.path.join(root, name), data_home)
+            for root, _, names in os.walk(data_home)
+            for name in names
+            if name in ["meta.csv"] or name[:2] in ["t1", "t2"]
+        )
+
+    dataset.download(track_ids=["t1"], file_keys=["audio"])
+    assert downloaded() == ["audio.zip", "meta.csv"]
+    assert extracted() == ["audio/t1.wav", "meta.csv"]
+
+    # the audio of t1 is already there
+    download_remote.reset_mock()
+    dataset.download(track_ids=["t1"])
+    assert downloaded() == ["annot.tar.gz"]
+    assert extracted() == ["annot/t1.txt", "audio/t1.wav", "meta.csv"]
+
+    download_remote.reset_mock()
+    dataset.download(file_keys=["annot"], stream=True, cleanup=True)
+    assert downloaded() == ["annot.tar.gz"]
+    assert extracted() == ["annot/t1.txt", "annot/t2.txt", "audio/t1.wav", "meta.csv"]
+
+    # nothing left to download
+    download_remote.reset_mock()
+    dataset.download(file_keys=["annot"])
+    assert downloaded() == []
+
+    # a modified file is extracted again
+    with open(os.path.join(data_home, "annot", "t1.txt"), "wb") as fhandle:
+        fhandle.write(b"modified")
+    dataset.download(file_keys=["annot"], partial_download=["annot", "audio"])
+    assert downloaded() == ["annot.tar.gz"]
+    with open(os.path.join(data_home, "annot", "t1.txt"), "rb") as fhandle:
+        assert fhandle.read() == contents["annot/t1.txt"]
+
+    with pytest.raises(ValueError):
+        dataset.download(file_keys=["not_a_key"])
+    with pytest.raises(ValueError):
+        dataset.download(track_ids=["not_a_track"])
+
+
+def test_dataset_download_verify(tmpdir, mocker):
+    dataset, contents = _remote_test_dataset(tmpdir)
+    data_home = dataset.data_home
+    md5 = mocker.spy(validate, "md5")
+
+    # the extracted files are checked without being read again
+    missing, invalid = dataset.download(verify=True)
+    assert _report_files(missing, data_home) == []
+    assert _report_files(invalid, data_home) == []
+    assert md5.call_count == 0
+
+    # and later validations reuse their checksums
+    missing, invalid = dataset.validate(verbose=False)
+    assert _report_files(missing, data_home) == []
+    assert _report_files(invalid, data_home) == []
+    assert md5.call_count == 0
+
+    # files which do not match the index are reported, also when streaming
+    dataset._index["tracks"]["t2"]["annot"][1] = "0" * 32
+    missing, invalid = dataset.download(
+        file_keys=["annot"],
+        verify=True,
+        stream=True,
+        cleanup=True,
+        force_overwrite=True,
+    )
+    assert _report_files(missing, data_home) == []
+    assert _report_files(invalid, data_home) == [os.path.join("annot", "t2.txt")]
+    assert md5.call_count == 0
+
+    missing, invalid = dataset.validate(verbose=False)
+    assert _report_files(invalid, data_home) == [os.path.join("annot", "t2.txt")]
+    assert md5.call_count == 0
+
+
+def test_load_tracks():
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    tracks = dataset.load_tracks()
+    assert isinstance(tracks, core.TrackMapping)
+    assert len(tracks) == len(dataset.track_ids)
+    assert list(tracks.keys()) == dataset.track_ids
+    assert "Beethoven-S3-I-ex1" in tracks
+    assert "asdf" not in tracks
+    with pytest.raises(KeyError):
+        tracks["asdf"]
+
+    track = tracks["Beethoven-S3-I-ex1"]
+    assert isinstance(track, dataset._track_class)
+    assert track.track_id == "Beethoven-S3-I-ex1"
+    assert tracks["Beethoven-S3-I-ex1"] is track
+    assert dict(tracks.items())["Beethoven-S3-I-ex1"].track_id == track.track_id
+
+
+def test_track_mapping_cache():
+    created = []
+
+    def track_factory(track_id):
+        created.append(track_id)
+        return object()
+
+    track_ids = {"a": None, "b": None, "c": None}
+
+    tracks = core.TrackMapping(track_factory, track_ids, cache_size=2)
+    track_a = tracks["a"]
+    assert tracks["a"] is track_a
+    assert created == ["a"]
+
+    # iterating keeps at most cache_size tracks
+    assert [k for k, _ in tracks.items()] == ["a", "b", "c"]
+    assert len(tracks._cache) == 2
+    assert created == ["a", "b", "c"]
+    assert tracks["a"] is not track_a
+
+    tracks = core.TrackMapping(track_factory, track_ids, cache_size=0)
+    assert tracks["b"] is not tracks["b"]
+    assert len(tracks._cache) == 0
+
+    tracks = core.TrackMapping(track_factory, track_ids, cache_size=None)
+    list(tracks.values())
+    assert len(tracks._cache) == 3
+    assert repr(tracks) == "TrackMapping(3 tracks)"
+
+
+def test_track_mapping_equality_and_eviction():
+    created = []
+
+    def track_factory(track_id):
+        created.append(track_id)
+        return object()
+
+    track_ids = {"a": None, "b": None, "c": None}
+
+    # by default every track is kept, like in a dict
+    tracks = core.TrackMapping(track_factory, track_ids)
+    assert tracks.cache_size is None
+    snapshot = dict(tracks.items())
+    assert tracks == snapshot
+    assert dict(tracks.items()) == snapshot
+    assert created == ["a", "b", "c"]
+
+    # evicted tracks are created again, so they are different objects
+    del created[:]
+    tracks = core.TrackMapping(track_factory, track_ids, cache_size=2)
+    snapshot = dict(tracks.items())
+    assert list(tracks._cache) == ["b", "c"]
+    assert tracks["c"] is snapshot["c"]
+    assert tracks["a"] is not snapshot["a"]
+    # "b" was the least recently used track when "a" was created again
+    assert list(tracks._cache) == ["c", "a"]
+    assert created == ["a", "b", "c", "a"]
+    assert tracks != snapshot
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_tracks_prefetch(executor):
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    tracks = dataset.load_tracks(prefetch=["melody"], workers=2, executor=executor)
+    assert tracks.cache_size is None
+    assert len(tracks._cache) == len(dataset.track_ids)
+
+    # the only track in the test resources is loaded, the rest fail
+    track = tracks["Beethoven-S3-I-ex1"]
+    assert "melody" in track.__dict__
+    assert isinstance(track.melody, annotations.F0Data)
+    assert "Beethoven-S3-I-ex1" not in tracks.errors
+    assert len(tracks.errors) == len(dataset.track_ids) - 1
+    for track_errors in tracks.errors.values():
+        assert isinstance(track_errors["melody"], FileNotFoundError)
+
+
+def test_load_tracks_prefetch_errors():
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    with pytest.raises(ValueError):
+        dataset.load_tracks(prefetch=["audio_mono"])
+    with pytest.raises(ValueError):
+        dataset.load_tracks(prefetch=["melody"], executor="gpu")
+    with pytest.raises(ValueError):
+        dataset.load_tracks(cache_size=10).prefetch(["melody"])
+
+
 def test_multitrack_basic():
     class TestTrack(core.Track):
         def __init__(self, key):
@@ -295,3 +590,314 @@ def test_multitrack_mono():
     target1 = mtrack.get_target(["a", "c"], average=False)
     assert target1.shape == (1, 100)
     assert np.max(np.abs(target1)) <= 2
+
+
+def test_multitrack_target_chunked(tmpdir):
+    signals = {
+        "a": np.random.uniform(-1, 1, (2, 1000)).astype(np.float32),
+        "b": np.random.uniform(-1, 1, (2, 700)).astype(np.float32),
+        "c": np.random.uniform(-1, 1, (2, 1000)).astype(np.float32),
+    }
+
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            return signals[self.key], 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in ["a", "b", "c"]}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+    padded = {
+        k: np.pad(v, ((0, 0), (0, 1000 - v.shape[1]))) for k, v in signals.items()
+    }
+    weights = [0.2, 0.5, 0.3]
+    expected = np.average([padded[k] for k in "abc"], axis=0, weights=weights)
+
+    target = mtrack.get_target(
+        ["b", "a", "c"], weights=[0.5, 0.2, 0.3], enforce_length=False, chunk_size=64
+    )
+    assert target.shape == (2, 1000)
+    assert target.dtype == np.float32
+    assert np.allclose(target, expected, atol=1e-6)
+
+    target = mtrack.get_target(["a", "c"], average=False, chunk_size=300)
+    assert np.allclose(target, signals["a"] + signals["c"])
+
+    # write into an existing array, padding tracks to its length
+    out = np.full((2, 1200), np.nan, dtype=np.float32)
+    target = mtrack.get_target(["a", "b", "c"], weights, enforce_length=False, out=out)
+    assert target is out
+    assert np.allclose(out[:, :1000], expected, atol=1e-6)
+    assert np.all(out[:, 1000:] == 0)
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a"], out=np.zeros((1, 1000)))
+    with pytest.raises(ValueError):
+        mtrack.get_target(["b", "a"], enforce_length=False, out=np.zeros((2, 800)))
+    # tracks of the same length are padded to out's length, as with enforce_length
+    out = np.full((2, 1200), np.nan, dtype=np.float32)
+    mtrack.get_target(["a", "c"], average=False, out=out)
+    assert np.allclose(out[:, :1000], signals["a"] + signals["c"])
+    assert np.all(out[:, 1000:] == 0)
+
+    # write to disk, growing the file when a longer track comes
+    path = str(tmpdir.join("target.npy"))
+    target = mtrack.get_target(
+        ["b", "a", "c"], weights=[0.5, 0.2, 0.3], enforce_length=False, out=path
+    )
+    assert isinstance(target, np.memmap)
+    assert np.allclose(np.load(path), expected, atol=1e-6)
+    assert not os.path.exists(path + ".tmp.npy")
+
+    # a failed mix leaves no partial file
+    failed_path = str(tmpdir.join("failed.npy"))
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"], out=failed_path)
+    assert not os.path.exists(failed_path)
+
+    with pytest.raises(ValueError):
+        mtrack.get_target([])
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "b"], weights=[1.0])
+
+
+def test_multitrack_stem_workers_and_cache():
+    loads = []
+
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            loads.append(self.key)
+            time.sleep(0.05)
+            return np.full((2, 100), float(ord(self.key) - ord("a") + 1)), 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in "abcdefgh"}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+    serial = mtrack.get_target(list("abcdefgh"), average=False)
+    assert np.all(serial == 36)
+
+    # tracks are decoded concurrently, and mixed in order
+    loads.clear()
+    tic = time.perf_counter()
+    target = mtrack.get_target(list("abcdefgh"), average=False, workers=8)
+    assert time.perf_counter() - tic < 8 * 0.05
+    assert np.array_equal(target, serial)
+    assert sorted(loads) == list("abcdefgh")
+    assert "_stem_cache" not in mtrack.__dict__ or not mtrack._stem_cache
+
+    # invalid weights are rejected before decoding
+    with pytest.raises(ValueError):
+        mtrack.get_target(list("abc"), weights=[1.0, 1.0, 1.0, 1.0], workers=2)
+
+    # random targets reuse the decoded tracks
+    loads.clear()
+    target1, tracks1, weights1 = mtrack.get_random_target(workers=4)
+    target2, tracks2, weights2 = mtrack.get_random_target(workers=4)
+    assert sorted(loads) == list("abcdefgh")
+    assert not np.array_equal(weights1, weights2)
+    assert np.allclose(target2, mtrack.get_target(tracks2, weights=weights2))
+
+    mtrack.clear_stem_cache()
+    loads.clear()
+    mtrack.get_random_target(n_tracks=2, cache=False)
+    mtrack.get_random_target(n_tracks=2, cache=False)
+    assert len(loads) == 4
+
+    assert np.array_equal(mtrack.get_mix(workers=3), serial / 8)
+
+
+def test_multitrack_random_targets():
+    signals = {
+        k: np.random.uniform(-1, 1, (2, 1000)).astype(np.float32) for k in "abcd"
+    }
+    loads = []
+
+    class TestTrack(core.Track):
+        def __init__(self, key):
+            self.key = key
+
+        @property
+        def f(self):
+            loads.append(self.key)
+            return signals[self.key], 1000
+
+    class TestMultiTrack(core.MultiTrack):
+        def __init__(self, mtrack_id, data_home):
+            self.mtrack_id = mtrack_id
+            self._data_home = data_home
+            self.tracks = {t: TestTrack(t) for t in "abcd"}
+            self.track_audio_property = "f"
+
+    mtrack = TestMultiTrack("test", "foo")
+    mixes, targets, keys, weights, offsets = mtrack.get_random_targets(
+        8, duration=0.25, n_tracks=2, workers=2
+    )
+    assert mixes.shape == (8, 2, 250)
+    assert mixes.dtype == np.float32
+    assert targets.shape == (8, 4, 2, 250)
+    assert list(keys) == list("abcd")
+    assert weights.shape == (8, 4)
+    assert np.all(np.sum(weights > 0, axis=1) == 2)
+    assert np.all(weights[weights > 0] >= 0.3)
+    assert offsets.shape == (8,)
+    assert np.allclose(np.sum(targets, axis=1), mixes, atol=1e-6)
+
+    for i in range(8):
+        start = int(round(offsets[i] * 1000))
+        included = [k for k, w in zip(keys, weights[i]) if w > 0]
+        expected = mtrack.get_target(included, weights=weights[i][weights[i] > 0])
+        assert np.allclose(mixes[i], expected[:, start : start + 250], atol=1e-6)
+
+    # tracks are decoded once, and the cache holds views of the block
+    mixes, _, _, weights, offsets = mtrack.get_random_targets(3, average=False)
+    assert sorted(loads) == list("abcd")
+    assert mtrack._stem_cache["a"][0].base is mtrack._stem_block[1]
+    assert mixes.shape == (3, 2, 1000)
+    assert np.all(offsets == 0)
+    expected = np.einsum("bs,sct->bct", weights, np.stack([signals[k] for k in "abcd"]))
+    assert np.allclose(mixes, expected, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        mtrack.get_random_targets(2, duration=2.0)
+
+    mtrack.clear_stem_cache()
+    signals["d"] = signals["d"][:, :900]
+    with pytest.raises(ValueError):
+        mtrack.get_random_targets(2)
+    mixes, targets, _, _, _ = mtrack.get_random_targets(2, enforce_length=False)
+    assert mixes.shape == (2, 2, 1000)
+    assert np.all(targets[:, 3, :, 900:] == 0)
+    # padded tracks are replaced by views of the block, without their padding
+    assert mtrack._stem_cache["d"][0].shape == (2, 900)
+    assert mtrack._stem_cache["d"][0].base is mtrack._stem_block[1]
+    # the padded block is cached, but lengths are still checked
+    with pytest.raises(ValueError):
+        mtrack.get_random_targets(2)
+    with pytest.raises(ValueError):
+        mtrack.get_target(["a", "d"])
+    assert sorted(loads) == sorted(list("abcd") * 2)
+
+
+def test_load_audio_with_options():
+    def loader(path, gain=1.0):
+        return gain * np.ones((2, 100)), 100
+
+    audio, sr = core.load_audio_with_options(loader, {}, "path", gain=2.0)
+    assert audio.shape == (2, 100)
+    assert np.all(audio == 2.0)
+
+    audio, sr = core.load_audio_with_options(
+        loader, {"sample_rate": 50, "mono": True}, "path"
+    )
+    assert audio.shape == (50,)
+    assert sr == 50
+
+    # the options are set while the loader runs
+    def check_options(path, sr, mono):
+        assert io._AUDIO_OPTIONS.get() == {"mono": False}
+        return np.ones((1, 10)), 10
+
+    audio, sr = core.load_audio_with_options(
+        check_options, {"mono": False}, "path", None, True
+    )
+    assert audio.shape == (1, 10)
+    assert io._AUDIO_OPTIONS.get() == {}
+
+
+def test_dataset_audio_options():
+    dataset = mirdata.initialize(
+        "orchset",
+        "tests/resources/mir_datasets/orchset",
+        sample_rate=8000,
+        mono=True,
+        resample_quality="fast",
+    )
+    assert dataset.sample_rate == 8000
+    assert dataset.mono is True
+    assert dataset.resample_quality == "fast"
+    track = dataset.track("Beethoven-S3-I-ex1")
+    assert track._audio_options == {
+        "sample_rate": 8000,
+        "mono": True,
+        "resample_quality": "fast",
+    }
+
+    # every loader follows the dataset's sample rate and channel layout
+    for audio, sr in [
+        track.audio_mono,
+        track.audio_stereo,
+        dataset.load_audio_stereo(track.audio_path_stereo),
+    ]:
+        assert sr == 8000
+        assert audio.shape == (16000,)
+
+    dataset.mono = False
+    audio, sr = dataset.track("Beethoven-S3-I-ex1").audio_mono
+    assert audio.shape == (1, 16000)
+
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    assert dataset._audio_options == {}
+    audio, sr = dataset.track("Beethoven-S3-I-ex1").audio_stereo
+    assert sr == 44100
+    assert audio.shape == (2, 88200)
+
+
+def test_track_get_audio():
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    track = dataset.track("Beethoven-S3-I-ex1")
+    audio, sr = track.audio_stereo
+
+    segment, sr_segment = track.get_audio(0.5, 0.25, audio_property="audio_stereo")
+    assert sr_segment == sr
+    assert segment.shape == (2, 11025)
+    assert np.allclose(segment, audio[:, 22050:33075])
+
+    # the segment only applies to this read
+    assert track.audio_stereo[0].shape == audio.shape
+
+    # the dataset's audio options are applied to segments
+    dataset.sample_rate = 22050
+    dataset.mono = True
+    track = dataset.track("Beethoven-S3-I-ex1")
+    segment, sr_segment = track.get_audio(offset=1.0, audio_property="audio_stereo")
+    assert sr_segment == 22050
+    assert segment.shape == (22050,)
+
+    with pytest.raises(AttributeError):
+        track.get_audio(audio_property="audio")
+
+
+def test_track_audio_stream():
+    dataset = mirdata.initialize("orchset", "tests/resources/mir_datasets/orchset")
+    track = dataset.track("Beethoven-S3-I-ex1")
+    audio, sr = track.audio_stereo
+    stream = track.audio_stereo_stream(2048, 512, offset=1.0)
+    assert stream.sample_rate == sr
+    block = next(iter(stream))
+    assert np.allclose(block, audio[:, 44100 : 44100 + 2048])
+
+    # the dataset's audio options are applied to streams
+    dataset.sample_rate = 22050
+    dataset.mono = True
+    track = dataset.track("Beethoven-S3-I-ex1")
+    stream = track.audio_stereo_stream(2048)
+    assert stream.sample_rate == 22050
+    blocks = list(stream)
+    assert blocks[0].shape == (2048,)
+    assert sum(len(block) for block in blocks) == 44100
@@ -0,0 +1,171 @@
+import bz2
+import gzip
+import os
+import random
+import tarfile
+
+import pytest
+
+from mirdata import decompress, download_utils
+
+
+def _text(n_words, seed=0):
+    # compressible, but not too much, so bzip2 makes several blocks
+    rng = random.Random(seed)
+    words = ["{:08x}".format(rng.getrandbits(32)) for _ in range(2000)]
+    return " ".join(rng.choice(words) for _ in range(n_words)).encode("utf-8")
+
+
+def _read_all(file_path, size=-1, **kwargs):
+    chunks = []
+    with decompress.open_decompressed(file_path, **kwargs) as fileobj:
+        while True:
+            chunk = fileobj.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b"".join(chunks)
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_bz2(tmpdir, executor):
+    data = _text(100000)
+    # level 1 makes 100 kB blocks; concatenated streams as made by pbzip2
+    compressed = bz2.compress(data, 1) + bz2.compress(data[:1000], 9)
+    assert len(list(decompress._bz2_blocks(compressed))) > 3
+    path = str(tmpdir.join("data.bz2"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(compressed)
+
+    assert decompress.compression(path) == "bz2"
+    expected = data + data[:1000]
+    assert _read_all(path, workers=2, executor=executor) == expected
+    assert _read_all(path, size=10240, workers=3, executor=executor) == expected
+
+
+def test_bz2_search_windows(mocker):
+    compressed = bz2.compress(_text(30000), 1)
+    boundaries = list(decompress._bz2_boundaries(compressed))
+    assert len(boundaries) > 2
+    # magics on the edge of a search window are found once
+    for offset, _ in boundaries[1:]:
+        for window in range(offset // 8 - 6, offset // 8 + 2):
+            mocker.patch.object(decompress, "SEARCH_WINDOW", window)
+            assert list(decompress._bz2_boundaries(compressed)) == boundaries
+
+
+def test_bz2_corrupted(tmpdir):
+    compressed = bytearray(bz2.compress(_text(50000), 1))
+    compressed[len(compressed) // 2] ^= 0xFF
+    path = str(tmpdir.join("data.bz2"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(compressed)
+    with pytest.raises(IOError):
+        _read_all(path, workers=2, executor="thread")
+
+
+def test_gzip(tmpdir, mocker):
+    data = _text(50000)
+    # stored members contain gzip headers which are not members, some of
+    # them valid enough to be taken as candidates
+    fake_headers = b"a\x1f\x8b\x08b" * 1000
+    fake_headers += b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff" * 100
+    members = [data[i : i + 100000] for i in range(0, len(data), 100000)]
+    compressed = b"".join(gzip.compress(member) for member in members)
+    compressed += gzip.compress(fake_headers, compresslevel=0)
+    compressed += gzip.compress(data[:1000]) + b"\x00" * 16
+    path = str(tmpdir.join("data.gz"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(compressed)
+
+    assert decompress.compression(path) == "gz"
+    expected = data + fake_headers + data[:1000]
+    assert _read_all(path, workers=2, executor="thread") == expected
+    assert _read_all(path, size=10240, workers=2) == expected
+
+    # large members are decompressed by the reader
+    mocker.patch.object(decompress, "MAX_GZIP_SEGMENT", 1000)
+    assert _read_all(path, workers=2, executor="thread") == expected
+
+    # members which are not candidates are decompressed by the reader
+    mocker.patch.object(decompress.time, "time", return_value=0)
+    # only the fake headers, with an mtime of 0, are left
+    assert len(list(decompress._gzip_candidates(compressed))) == 100
+    assert _read_all(path, workers=2, executor="thread") == expected
+    mocker.stopall()
+
+    with open(path, "ab") as fhandle:
+        fhandle.write(b"garbage")
+    with pytest.raises(IOError):
+        _read_all(path, workers=2, executor="thread")
+
+
+def test_gzip_candidates():
+    first = gzip.compress(b"first")
+    compressed = first + b"\x1f\x8b\x08" + gzip.compress(b"second")
+    assert list(decompress._gzip_candidates(compressed)) == [0, len(first) + 3]
+
+    header = bytearray(first[:10])
+    assert decompress._is_gzip_header(header, 0)
+    for index, value in [(3, 0x20), (8, 1), (9, 100), (7, 0xFF)]:
+        invalid = bytearray(header)
+        invalid[index] = value
+        assert not decompress._is_gzip_header(invalid, 0)
+    assert not decompress._is_gzip_header(header[:9], 0)
+
+
+def test_not_compressed(tmpdir):
+    path = str(tmpdir.join("data.txt"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(b"not compressed")
+    assert decompress.compression(path) is None
+    with pytest.raises(IOError):
+        decompress.open_decompressed(path)
+
+
+@pytest.mark.parametrize("mode", ["w:bz2", "w:gz"])
+def test_untar_workers(tmpdir, mode, caplog):
+    source = tmpdir.mkdir("source")
+    for i in range(5):
+        source.mkdir("dir{}".format(i)).join("file.txt").write_binary(
+            _text(20000, seed=i)
+        )
+    tar_path = str(tmpdir.join("archive.tar"))
+    with tarfile.open(tar_path, mode) as tfile:
+        tfile.add(str(source), arcname="data")
+
+    def extracted(out_dir):
+        files = {}
+        for root, _, names in os.walk(out_dir):
+            for name in names:
+                if name != "archive.tar":
+                    with open(os.path.join(root, name), "rb") as fhandle:
+                        files[os.path.relpath(os.path.join(root, name), out_dir)] = (
+                            fhandle.read()
+                        )
+        return files
+
+    expected_dir = str(tmpdir.mkdir("expected"))
+    with tarfile.open(tar_path) as tfile:
+        tfile.extractall(expected_dir)
+
+    out_dir = tmpdir.mkdir("out")
+    out_path = str(out_dir.join("archive.tar"))
+    os.rename(tar_path, out_path)
+    download_utils.untar(out_path, cleanup=False, workers=2)
+    # no fallback to tarfile
+    assert "Parallel decompression" not in caplog.text
+    assert extracted(str(out_dir)) == extracted(expected_dir)
+    assert len(extracted(expected_dir)) == 5
+
+    # only some members
+    subset_dir = tmpdir.mkdir("subset")
+    subset_path = str(subset_dir.join("archive.tar"))
+    os.rename(out_path, subset_path)
+    download_utils.untar(
+        subset_path, cleanup=True, members={"data/dir1/file.txt"}, workers=2
+    )
+    assert list(extracted(str(subset_dir))) == [
+        os.path.join("data", "dir1", "file.txt")
+    ]
+    assert not os.path.exists(subset_path)
@@ -1,12 +1,19 @@
+import hashlib
+import io
+import json
 import os
 import shutil
 import sys
+import tarfile
+import time
 import zipfile
 import re
 
 from mirdata import download_utils
+from mirdata.validate import md5
 
 import pytest
+from pytest_localserver.http import WSGIServer
 
 if sys.version_info.major == 3:
     builtin_module_name = "builtins"
@@ -41,6 +48,67 @@ def mock_path(mocker, mock_download_from_remote):
     return mocker.patch.object(Path, "mkdir")
 
 
+@pytest.fixture
+def file_server():
+    """A threaded local server serving `server.files` = {name: (data, delay)},
+    where each 8 KiB chunk of a file is sent after `delay` seconds.
+    Range requests are supported while `server.ranges` is True, and the
+    Range header of each GET request is recorded in `server.requests`.
+    """
+    files = {}
+    requests = []
+
+    def app(environ, start_response):
+        name = environ["PATH_INFO"].lstrip("/")
+        if name not in files:
+            start_response("404 Not Found", [("Content-Length", "0")])
+            return [b""]
+        data, delay = files[name]
+        headers = [("Accept-Ranges", "bytes")] if server.ranges else []
+        if environ["REQUEST_METHOD"] == "HEAD":
+            start_response("200 OK", headers + [("Content-Length", str(len(data)))])
+            return [b""]
+
+        requests.append(environ.get("HTTP_RANGE"))
+        match = re.match(r"bytes=(\d+)-(\d*)$", environ.get("HTTP_RANGE", ""))
+        if match is None or not server.ranges:
+            start_response("200 OK", headers + [("Content-Length", str(len(data)))])
+        else:
+            start = int(match.group(1))
+            end = int(match.group(2)) + 1 if match.group(2) else len(data)
+            if start >= len(data):
+                start_response(
+                    "416 Range Not Satisfiable",
+                    [("Content-Range", "bytes */{}".format(len(data)))],
+                )
+                return [b""]
+            content_range = "bytes {}-{}/{}".format(start, end - 1, len(data))
+            start_response(
+                "206 Partial Content",
+                headers
+                + [
+                    ("Content-Range", content_range),
+                    ("Content-Length", str(end - start)),
+                ],
+            )
+            data = data[start:end]
+
+        def chunks():
+            for start in range(0, len(data), 8192):
+                time.sleep(delay)
+                yield data[start : start + 8192]
+
+        return chunks()
+
+    server = WSGIServer(application=app, threaded=True)
+    server.files = files
+    server.requests = requests
+    server.ranges = True
+    server.start()
+    yield server
+    server.stop()
+
+
 def test_downloader(mocker, mock_path):
     mock_zip = mocker.patch.object(download_utils, "download_zip_file")
     mock_tar = mocker.patch.object(download_utils, "download_tar_file")
@@ -344,6 +412,53 @@ def test_extractall_unicode(mocker, mock_download_from_remote, mock_unzip):
         os.remove(expected_file_location)
 
 
+def test_extractall_unicode_parallel(tmpdir):
+    zip_path = os.path.join(str(tmpdir), "archive.zip")
+    members = {"a/{}.bin".format(i): os.urandom(3 * 1024 * 1024 + i) for i in range(4)}
+    with zipfile.ZipFile(zip_path, "w") as zfile:
+        zfile.writestr("a/", b"")
+        for name, data in members.items():
+            zfile.writestr(name, data)
+
+    download_utils.unzip(zip_path, cleanup=True, workers=3)
+    assert not os.path.exists(zip_path)
+    for name, data in members.items():
+        with open(os.path.join(str(tmpdir), name), "rb") as fhandle:
+            assert fhandle.read() == data
+
+    out_dir = os.path.join(str(tmpdir), "utf")
+    with zipfile.ZipFile("tests/resources/utfissue.zip", "r") as zfile:
+        download_utils.extractall_unicode(zfile, out_dir, workers=2)
+    assert os.path.exists(os.path.join(out_dir, "Benoît.txt"))
+
+
+def test_extract_checksums(tmpdir):
+    data = {"a/x.bin": os.urandom(1000), "a/b/y.bin": os.urandom(2000)}
+    for name, payload in data.items():
+        tmpdir.join("src", name).write_binary(payload, ensure=True)
+    zip_path = str(tmpdir.join("archive.zip"))
+    tar_path = str(tmpdir.join("archive.tar.gz"))
+    with zipfile.ZipFile(zip_path, "w") as zfile, tarfile.open(
+        tar_path, "w:gz"
+    ) as tfile:
+        for name in data:
+            zfile.write(str(tmpdir.join("src", name)), arcname=name)
+            tfile.add(str(tmpdir.join("src", name)), arcname=name)
+
+    for extract, path in [
+        (download_utils.unzip, zip_path),
+        (download_utils.untar, tar_path),
+    ]:
+        checksums = {}
+        extract(path, cleanup=True, checksums=checksums)
+        assert checksums == {
+            os.path.abspath(str(tmpdir.join(name))): hashlib.md5(payload).hexdigest()
+            for name, payload in data.items()
+        }
+        for name in checksums:
+            assert md5(name) == checksums[name]
+
+
 def test_extractall_cp437(mocker, mock_download_from_remote, mock_unzip):
     zfile = zipfile.ZipFile("tests/resources/utfissue.zip", "r")
     zfile.extractall(os.path.dirname("tests/resources/"))
@@ -361,3 +476,306 @@ def test_extractall_cp437(mocker, mock_download_from_remote, mock_unzip):
         true_file_location = os.path.join("tests", "resources", true_file)
         os.remove(true_file_location)
     shutil.rmtree(os.path.join("tests", "resources", "__MACOSX"))
+
+
+def test_downloader_concurrent(file_server, tmpdir):
+    remotes = {}
+    for name in ["remote.wav", "remote.zip", "remote.tar.gz"]:
+        with open(os.path.join("tests", "resources", name), "rb") as fhandle:
+            file_server.files[name] = (fhandle.read(), 0)
+        remotes[name] = download_utils.RemoteFileMetadata(
+            filename=name,
+            url="{}/{}".format(file_server.url, name),
+            checksum=md5(os.path.join("tests", "resources", name)),
+            destination_dir=name.split(".")[-1],
+        )
+
+    save_dir = str(tmpdir)
+    download_utils.downloader(save_dir, remotes=remotes, max_workers=3)
+    assert os.path.exists(os.path.join(save_dir, "wav", "remote.wav"))
+    assert os.path.exists(os.path.join(save_dir, "zip", "remote.zip"))
+    assert os.path.exists(os.path.join(save_dir, "gz", "remote.tar.gz"))
+    assert len(os.listdir(os.path.join(save_dir, "zip"))) > 1
+    assert len(os.listdir(os.path.join(save_dir, "gz"))) > 1
+
+
+def test_downloader_concurrent_cancel(file_server, tmpdir):
+    file_server.files["bad.wav"] = (b"not the expected data", 0)
+    file_server.files["slow.wav"] = (b"x" * 8192 * 1000, 0.01)
+    remotes = {
+        "bad": download_utils.RemoteFileMetadata(
+            filename="bad.wav",
+            url="{}/bad.wav".format(file_server.url),
+            checksum="1234",
+            destination_dir=None,
+        ),
+        "slow": download_utils.RemoteFileMetadata(
+            filename="slow.wav",
+            url="{}/slow.wav".format(file_server.url),
+            checksum="1234",
+            destination_dir=None,
+        ),
+    }
+
+    save_dir = str(tmpdir)
+    start = time.time()
+    with pytest.raises(IOError, match="bad.wav"):
+        download_utils.downloader(save_dir, remotes=remotes, max_workers=2)
+    # the slow download (10 s) was stopped, and its partial file kept
+    assert time.time() - start < 5
+    assert not os.path.exists(os.path.join(save_dir, "slow.wav"))
+    assert os.path.exists(os.path.join(save_dir, "slow.wav.part"))
+
+
+def test_aggregate_progress_bar():
+    progress = download_utils.AggregateProgressBar(total=0, file=io.StringIO())
+    hook1 = progress.hook()
+    hook2 = progress.hook()
+    hook1(0, 100, 250)
+    hook2(0, 100, 1000)
+    hook1(1, 100, 250)
+    hook1(3, 100, 250)
+    hook2(2, 100, 1000)
+    assert progress.total == 1250
+    assert progress.n == 450
+    progress.cancel()
+    with pytest.raises(download_utils.DownloadCancelled):
+        hook2(3, 100, 1000)
+    progress.close()
+
+
+def test_fetch_resume(file_server, tmpdir):
+    data = os.urandom(100000)
+    file_server.files["file.bin"] = (data, 0)
+    url = file_server.url + "/file.bin"
+    download_path = os.path.join(str(tmpdir), "file.bin")
+
+    # resume from a part file
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(data[:30000])
+    download_utils.fetch(url, download_path)
+    assert file_server.requests == ["bytes=30000-"]
+    assert not os.path.exists(download_path + ".part")
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+    # the part file is already complete
+    os.rename(download_path, download_path + ".part")
+    download_utils.fetch(url, download_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+    # the server ignores range requests: start over
+    file_server.ranges = False
+    os.remove(download_path)
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(b"garbage")
+    download_utils.fetch(url, download_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+    # an incomplete download keeps its part file
+    def cancel(b, done, total):
+        if done > 50000:
+            raise download_utils.DownloadCancelled()
+
+    file_server.ranges = True
+    os.remove(download_path)
+    with pytest.raises(download_utils.DownloadCancelled):
+        download_utils.fetch(url, download_path, reporthook=cancel)
+    assert not os.path.exists(download_path)
+    assert os.path.getsize(download_path + ".part") > 50000
+    download_utils.fetch(url, download_path)
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+
+def test_fetch_segments(file_server, tmpdir, mocker):
+    mocker.patch.object(download_utils, "MIN_SEGMENT_SIZE", 65536)
+    data = os.urandom(300000)
+    file_server.files["file.bin"] = (data, 0)
+    url = file_server.url + "/file.bin"
+    download_path = os.path.join(str(tmpdir), "file.bin")
+
+    # the state is saved when segments start and finish, not after each chunk
+    mocker.patch.object(download_utils, "DOWNLOAD_CHUNK_SIZE", 10000)
+    dump = mocker.spy(download_utils.json, "dump")
+    download_utils.fetch(url, download_path, connections=3)
+    assert sorted(file_server.requests) == [
+        "bytes=0-99999",
+        "bytes=100000-199999",
+        "bytes=200000-299999",
+    ]
+    assert dump.call_count == 5
+    mocker.stopall()
+    mocker.patch.object(download_utils, "MIN_SEGMENT_SIZE", 65536)
+    assert not os.path.exists(download_path + ".part")
+    assert not os.path.exists(download_path + ".part.json")
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+    # resume an interrupted segmented download
+    del file_server.requests[:]
+    os.remove(download_path)
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(data[:150000] + bytes(150000))
+    with open(download_path + ".part.json", "w") as fhandle:
+        json.dump(
+            {"url": url, "segments": [[0, 150000, 150000], [150000, 300000, 0]]},
+            fhandle,
+        )
+    download_utils.fetch(url, download_path, connections=3)
+    assert file_server.requests == ["bytes=150000-299999"]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+    # a server which now ignores the range of a resumed segment restarts it
+    del file_server.requests[:]
+    os.remove(download_path)
+    with open(download_path + ".part", "wb") as fhandle:
+        fhandle.write(bytes(150000) + data[150000:200000] + bytes(100000))
+    with open(download_path + ".part.json", "w") as fhandle:
+        json.dump(
+            {"url": url, "segments": [[0, 150000, 0], [150000, 300000, 50000]]},
+            fhandle,
+        )
+    file_server.ranges = False
+    download_utils.fetch(url, download_path, connections=3)
+    assert file_server.requests[-1] is None
+    assert 1 <= len(file_server.requests[:-1]) <= 2
+    assert set(file_server.requests[:-1]) <= {"bytes=0-149999", "bytes=200000-299999"}
+    assert not os.path.exists(download_path + ".part")
+    assert not os.path.exists(download_path + ".part.json")
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+    file_server.ranges = True
+
+    # small files and servers without range support use one connection
+    del file_server.requests[:]
+    os.remove(download_path)
+    file_server.files["small.bin"] = (data[:100000], 0)
+    download_utils.fetch(file_server.url + "/small.bin", download_path, connections=3)
+    assert file_server.requests == [None]
+
+    del file_server.requests[:]
+    os.remove(download_path)
+    file_server.ranges = False
+    download_utils.fetch(url, download_path, connections=3)
+    assert file_server.requests == [None]
+    with open(download_path, "rb") as fhandle:
+        assert fhandle.read() == data
+
+
+def test_downloader_connections(file_server, tmpdir, mocker):
+    mocker.patch.object(download_utils, "MIN_SEGMENT_SIZE", 65536)
+    data = os.urandom(300000)
+    file_server.files["file.bin"] = (data, 0)
+    remote = download_utils.RemoteFileMetadata(
+        filename="file.bin",
+        url=file_server.url + "/file.bin",
+        checksum=hashlib.md5(data).hexdigest(),
+        destination_dir=None,
+    )
+    save_dir = str(tmpdir)
+    download_utils.downloader(save_dir, remotes={"b": remote}, connections=2)
+    assert len(file_server.requests) == 2
+    assert md5(os.path.join(save_dir, "file.bin")) == remote.checksum
+
+
+def test_download_from_remote_stamp(file_server, tmpdir, mocker):
+    data = os.urandom(100000)
+    file_server.files["file.bin"] = (data, 0)
+    remote = download_utils.RemoteFileMetadata(
+        filename="file.bin",
+        url=file_server.url + "/file.bin",
+        checksum=hashlib.md5(data).hexdigest(),
+        destination_dir=None,
+    )
+    save_dir = str(tmpdir)
+    mock_md5 = mocker.patch.object(download_utils, "md5", side_effect=md5)
+
+    # the checksum is computed while downloading, and stamped
+    download_path = download_utils.download_from_remote(remote, save_dir, False)
+    assert mock_md5.call_count == 0
+    assert download_utils.read_stamp(download_path) == remote.checksum
+
+    # an existing verified file is not hashed again
+    download_utils.download_from_remote(remote, save_dir, False)
+    assert mock_md5.call_count == 0
+    assert len(file_server.requests) == 1
+
+    # a modified file is hashed, and rejected
+    with open(download_path, "ab") as fhandle:
+        fhandle.write(b"x")
+    assert download_utils.read_stamp(download_path) is None
+    with pytest.raises(IOError):
+        download_utils.download_from_remote(remote, save_dir, False)
+    assert mock_md5.call_count == 1
+    assert not os.path.exists(download_path + ".stamp")
+
+    download_utils.download_from_remote(remote, save_dir, True)
+    assert download_utils.read_stamp(download_path) == remote.checksum
+
+
+def _archive_remote(file_server, name, checksum=None):
+    with open(os.path.join("tests", "resources", name), "rb") as fhandle:
+        file_server.files[name] = (fhandle.read(), 0)
+    return download_utils.RemoteFileMetadata(
+        filename=name,
+        url="{}/{}".format(file_server.url, name),
+        checksum=checksum or md5(os.path.join("tests", "resources", name)),
+        destination_dir="data",
+    )
+
+
+def test_downloader_stream(file_server, tmpdir):
+    remotes = {
+        "tar": _archive_remote(file_server, "remote.tar.gz"),
+        "zip": _archive_remote(file_server, "remote.zip"),
+    }
+    save_dir = str(tmpdir)
+    data_dir = os.path.join(save_dir, "data")
+
+    # the archives are never written to disk
+    download_utils.downloader(save_dir, remotes=remotes, cleanup=True, stream=True)
+    assert sorted(os.listdir(data_dir)) == ["remote.wav"]
+
+    # a streamed tar file is kept and stamped without cleanup
+    shutil.rmtree(data_dir)
+    download_utils.downloader(save_dir, remotes=remotes, stream=True)
+    assert sorted(os.listdir(data_dir)) == [
+        "remote.tar.gz",
+        "remote.tar.gz.stamp",
+        "remote.wav",
+        "remote.zip",
+        "remote.zip.stamp",
+    ]
+    assert download_utils.read_stamp(os.path.join(data_dir, "remote.tar.gz")) == (
+        remotes["tar"].checksum
+    )
+
+    # existing archives are not downloaded again
+    del file_server.requests[:]
+    download_utils.downloader(save_dir, remotes=remotes, stream=True)
+    assert file_server.requests == []
+
+
+def test_stream_checksum_mismatch(file_server, tmpdir):
+    save_dir = str(tmpdir)
+    data_dir = os.path.join(save_dir, "data")
+    # zip files are only streamed when they are not kept
+    for name, cleanup in [("remote.tar.gz", False), ("remote.zip", True)]:
+        remote = _archive_remote(file_server, name, checksum="1234")
+        with pytest.raises(IOError):
+            download_utils.download_remote(
+                remote, save_dir, False, cleanup, stream=True
+            )
+        # nothing is left behind
+        assert os.listdir(data_dir) == []
+
+    # a corrupted tar file is reported as a checksum mismatch
+    remote = _archive_remote(file_server, "remote.tar.gz")
+    file_server.files["remote.tar.gz"] = (b"not a tar file" * 1000, 0)
+    with pytest.raises(IOError, match="MD5 checksum"):
+        download_utils.download_tar_file(remote, save_dir, False, True, stream=True)
+    assert os.listdir(data_dir) == []
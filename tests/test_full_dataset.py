@@ -2,6 +2,8 @@
 This test takes a long time, but it makes sure that the datset can be locally downloaded,
 validated successfully, and loaded.
 """
+
+from collections.abc import Mapping
 import os
 import pytest
 import tqdm
@@ -59,7 +61,9 @@ def test_load(skip_remote, dataset):
     # run load
     all_data = dataset.load_tracks()
 
-    assert isinstance(all_data, dict)
+    assert isinstance(all_data, Mapping)
+    # every track is kept, so the mapping is equal to a dict of its items
+    assert all_data == dict(all_data.items())
 
     track_ids = dataset.track_ids
     assert set(track_ids) == set(all_data.keys())
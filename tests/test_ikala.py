@@ -53,6 +53,17 @@ def test_track():
     assert mix.shape == (44100 * 2,)
     assert np.array_equal(mix, instrumental + vocal)
 
+    # streamed audio matches the loaded audio
+    for stream, (audio, _) in [
+        (track.vocal_audio_stream(4096), (vocal, sr_vocal)),
+        (track.instrumental_audio_stream(4096), (instrumental, sr_instrumental)),
+        (track.mix_audio_stream(4096), (mix, sr_mix)),
+    ]:
+        assert stream.sample_rate == 44100
+        blocks = list(stream)
+        assert blocks[0].shape == (4096,)
+        assert np.allclose(np.concatenate(blocks), audio)
+
 
 def test_to_jams():
 
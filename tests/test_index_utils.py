@@ -0,0 +1,123 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from mirdata import index_utils
+
+TEST_INDEX = {
+    "version": "1.0",
+    "tracks": {
+        "b": {"audio": ["audio/b.wav", "1234"], "notes": [None, None]},
+        "a": {"audio": ["audio/ä.wav", "5678"]},
+        "c": {"audio": ["audio/c.wav", "9012"], "beats": ["beats/c.txt", "3456"]},
+    },
+    "metadata": {"meta": ["meta.csv", "7890"]},
+    "multitracks": {"mt": {"tracks": ["a", "b"], "mix": ["mix.wav", "1111"]}},
+}
+
+
+@pytest.fixture(autouse=True)
+def index_cache_dir(tmpdir, monkeypatch):
+    path = str(tmpdir.join("index_cache"))
+    monkeypatch.setattr(index_utils, "INDEX_CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def json_index(tmpdir):
+    path = str(tmpdir.join("test_index.json"))
+    with open(path, "w") as fhandle:
+        json.dump(TEST_INDEX, fhandle)
+    return path
+
+
+def test_compile_index(json_index, index_cache_dir):
+    compiled_path = index_utils.compile_index(json_index)
+    assert os.path.dirname(compiled_path) == index_cache_dir
+    assert os.path.basename(compiled_path).startswith("test_index-")
+    assert compiled_path.endswith(".mdx")
+    # nothing is written next to the json index
+    assert sorted(os.listdir(os.path.dirname(json_index))) == [
+        "index_cache",
+        "test_index.json",
+    ]
+
+    index = index_utils.CompiledIndex(compiled_path)
+    assert index == TEST_INDEX
+    assert list(index.keys()) == list(TEST_INDEX.keys())
+    assert index["version"] == "1.0"
+
+    tracks = index["tracks"]
+    assert len(tracks) == 3
+    assert list(tracks.keys()) == ["b", "a", "c"]
+    assert tracks["a"] == {"audio": ["audio/ä.wav", "5678"]}
+    assert tracks["b"]["notes"] == [None, None]
+    assert "c" in tracks
+    assert "d" not in tracks
+    assert 1 not in tracks
+    with pytest.raises(KeyError):
+        tracks["d"]
+
+    assert index["metadata"]["meta"] == ["meta.csv", "7890"]
+    assert index["multitracks"]["mt"] == TEST_INDEX["multitracks"]["mt"]
+
+    unpickled = pickle.loads(pickle.dumps(index))
+    assert unpickled == TEST_INDEX
+
+
+def test_compile_index_sizes(tmpdir):
+    sized_index = {
+        "version": "1.0",
+        "tracks": {
+            "a": {"audio": ["a.wav", "1234", 4096], "notes": [None, None, None]},
+            "b": {"audio": ["b.wav", "5678"]},
+        },
+        "metadata": {"meta": ["meta.csv", "7890", 0]},
+    }
+    path = str(tmpdir.join("sized_index.json"))
+    with open(path, "w") as fhandle:
+        json.dump(sized_index, fhandle)
+
+    index = index_utils.CompiledIndex(index_utils.compile_index(path))
+    assert index == sized_index
+    assert index["tracks"]["a"]["audio"] == ["a.wav", "1234", 4096]
+    assert index["tracks"]["b"]["audio"] == ["b.wav", "5678"]
+
+
+def test_compiled_index_invalid(tmpdir):
+    path = str(tmpdir.join("bad.mdx"))
+    with open(path, "wb") as fhandle:
+        fhandle.write(b"not an index")
+    with pytest.raises(IOError):
+        index_utils.CompiledIndex(path)
+
+
+def test_load_index(json_index):
+    index = index_utils.load_index(json_index)
+    assert isinstance(index, index_utils.CompiledIndex)
+    assert index == TEST_INDEX
+
+    # the compiled index is reused while the json index is unchanged
+    compiled_path = index_utils.compiled_index_path(json_index)
+    mtime = os.stat(compiled_path).st_mtime_ns
+    assert index_utils.load_index(json_index) == TEST_INDEX
+    assert os.stat(compiled_path).st_mtime_ns == mtime
+
+    # and recompiled when it changes
+    new_index = dict(TEST_INDEX, version="2.0.0")
+    with open(json_index, "w") as fhandle:
+        json.dump(new_index, fhandle)
+    assert index_utils.load_index(json_index)["version"] == "2.0.0"
+
+    # a compiled index can be used without its json index
+    os.remove(json_index)
+    assert index_utils.load_index(json_index) == new_index
+
+
+def test_load_index_readonly(json_index, mocker):
+    mocker.patch.object(index_utils, "compile_index", side_effect=PermissionError)
+    index = index_utils.load_index(json_index)
+    assert isinstance(index, dict)
+    assert index == TEST_INDEX
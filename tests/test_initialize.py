@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from mirdata import core
@@ -19,3 +22,37 @@ def test_initialize():
 
     with pytest.raises(ValueError):
         initialize("asdfasdfasdfa")
+
+
+# datasets importing librosa, jams, pretty_midi or DALI in their loaders
+LAZY_IMPORT_DATASETS = [
+    "beatles",
+    "dali",
+    "giantsteps_tempo",
+    "groove_midi",
+    "guitarset",
+    "maestro",
+    "orchset",
+    "saraga_carnatic",
+]
+
+
+def test_initialize_lazy_imports():
+    # run in a fresh interpreter, this test session already imported everything
+    code = "\n".join(
+        [
+            "import sys",
+            "import mirdata",
+            "for name in {}:".format(LAZY_IMPORT_DATASETS),
+            "    mirdata.initialize(name).track_ids",
+            "print(' '.join(sorted(sys.modules)))",
+        ]
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, stdout=subprocess.PIPE
+    ).stdout.decode()
+    modules = output.split()
+
+    assert "mirdata.datasets.orchset" in modules
+    for heavy in ["librosa", "jams", "pretty_midi", "DALI", "mir_eval", "scipy"]:
+        assert heavy not in modules, "{} was imported by initialize".format(heavy)
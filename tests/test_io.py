@@ -1,10 +1,13 @@
 import tempfile
 from io import BufferedReader, BytesIO, StringIO, TextIOWrapper
 
+import numpy as np
 import pytest
 
 from mirdata import io
 
+AUDIO_PATH = "tests/resources/mir_datasets/orchset/audio/stereo/Beethoven-S3-I-ex1.wav"
+
 
 def test_coerce_to_string_with_none():
     @io.coerce_to_string_io
@@ -69,6 +72,18 @@ def test_coerce_to_bytes_io_with_bytesio():
         func(f)
 
 
+def test_coerce_to_bytes_io_with_arguments():
+    @io.coerce_to_bytes_io
+    def func(fh, offset, duration=None):
+        return fh.read(), offset, duration
+
+    with tempfile.NamedTemporaryFile() as f:
+        f.write(b"abc")
+        f.flush()
+        assert func(f.name, 1.0, duration=2.0) == (b"abc", 1.0, 2.0)
+    assert func(BytesIO(b"abc"), 1.0) == (b"abc", 1.0, None)
+
+
 def test_invalid_coerce_to_bytes_io():
     @io.coerce_to_bytes_io
     def func(fh):
@@ -76,3 +91,178 @@ def test_invalid_coerce_to_bytes_io():
 
     with pytest.raises(ValueError):
         func(123)
+
+
+def test_load_audio():
+    audio, sr = io.load_audio(AUDIO_PATH, sr=None, mono=False)
+    assert audio.shape == (2, 88200)
+    assert audio.dtype == np.float32
+    assert sr == 44100
+
+    with open(AUDIO_PATH, "rb") as fhandle:
+        audio_fhandle, _ = io.load_audio(fhandle, sr=None, mono=False)
+    assert np.array_equal(audio, audio_fhandle)
+
+    audio, sr = io.load_audio(AUDIO_PATH, sr=22050, mono=True)
+    assert audio.shape == (44100,)
+    assert sr == 22050
+
+
+def test_audio_options(mocker):
+    mock_load = mocker.patch.object(
+        io.librosa, "load", return_value=(np.zeros((10,)), 8000)
+    )
+    with io.audio_options(sample_rate=8000, resample_quality="fast"):
+        with io.audio_options(mono=True, offset=1.0):
+            io.load_audio(AUDIO_PATH, sr=None, mono=False, offset=2.0, duration=3.0)
+        mock_load.assert_called_once_with(
+            AUDIO_PATH,
+            sr=8000,
+            mono=False,
+            dtype=np.float32,
+            offset=1.0,
+            duration=3.0,
+            res_type="soxr_lq",
+        )
+
+    # options are reset when leaving the context
+    io.load_audio(AUDIO_PATH, sr=None, mono=False)
+    mock_load.assert_called_with(
+        AUDIO_PATH, sr=None, mono=False, dtype=np.float32, offset=0.0, duration=None
+    )
+
+
+def test_load_audio_segment():
+    audio, sr = io.load_audio(AUDIO_PATH, sr=None, mono=False)
+    segment, sr_segment = io.load_audio(
+        AUDIO_PATH, sr=None, mono=False, offset=0.5, duration=0.25
+    )
+    assert sr_segment == sr
+    assert segment.shape == (2, 11025)
+    assert np.allclose(segment, audio[:, 22050:33075])
+
+    segment, _ = io.load_audio(AUDIO_PATH, sr=None, mono=False, offset=1.5)
+    assert segment.shape == (2, 22050)
+
+
+def test_crop_audio():
+    audio = np.arange(20).reshape(2, 10)
+    assert np.array_equal(io.crop_audio(audio, 10), audio)
+    assert np.array_equal(io.crop_audio(audio, 10, offset=0.2), audio[:, 2:])
+    assert np.array_equal(
+        io.crop_audio(audio, 10, offset=0.2, duration=0.5), audio[:, 2:7]
+    )
+    assert np.array_equal(io.crop_audio(audio[0], 10, duration=0.3), audio[0, :3])
+
+
+def test_resample_type():
+    assert io.resample_type(None) is None
+    assert io.resample_type("best") == "soxr_vhq"
+    assert io.resample_type("fast") == "soxr_lq"
+    assert io.resample_type("polyphase") == "polyphase"
+
+
+def test_resample_type_old_librosa(mocker):
+    mocker.patch.object(io, "_librosa_has_soxr", return_value=False)
+    assert io.resample_type(None) is None
+    assert io.resample_type("best") == "kaiser_best"
+    assert io.resample_type("fast") == "kaiser_fast"
+    assert io.resample_type("polyphase") == "polyphase"
+
+
+def test_conform_audio():
+    stereo = np.ones((2, 100), dtype=np.float32)
+    stereo[1] = 0
+    mono = np.ones((100,), dtype=np.float32)
+
+    assert io.conform_audio(None, sample_rate=10, mono=True) is None
+
+    audio, sr = io.conform_audio((stereo, 100))
+    assert audio is stereo
+    assert sr == 100
+
+    audio, sr = io.conform_audio((stereo, 100), mono=True)
+    assert audio.shape == (100,)
+    assert np.allclose(audio, 0.5)
+
+    audio, sr = io.conform_audio((mono, 100), mono=False)
+    assert audio.shape == (1, 100)
+    audio, sr = io.conform_audio((stereo, 100), mono=False)
+    assert audio is stereo
+
+    audio, sr = io.conform_audio((stereo, 100), sample_rate=50, resample_quality="fast")
+    assert audio.shape == (2, 50)
+    assert sr == 50
+    audio, sr = io.conform_audio((mono, 100), sample_rate=100)
+    assert audio is mono
+
+
+def test_stream_audio():
+    audio, sr = io.load_audio(AUDIO_PATH, sr=None, mono=False)
+
+    stream = io.stream_audio(AUDIO_PATH, 4096, 1024, sr=None, mono=False)
+    assert isinstance(stream, io.AudioStream)
+    assert stream.sample_rate == sr
+    blocks = list(stream)
+    assert len(blocks) == 84
+    for i, block in enumerate(blocks):
+        assert np.array_equal(block, audio[:, i * 1024 : i * 1024 + 4096])
+    # the last block is shorter, unless a fill value is given
+    assert blocks[-1].shape == (2, 88200 - 83 * 1024)
+    blocks = list(io.stream_audio(AUDIO_PATH, 4096, 1024, sr=None, fill_value=0))
+    assert blocks[-1].shape == (4096,)
+    assert np.all(blocks[-1][88200 - 83 * 1024 :] == 0)
+
+    # streams can be iterated several times
+    assert len(list(stream)) == 84
+
+    # hop larger than the block size, on a segment of a file object
+    with open(AUDIO_PATH, "rb") as fhandle:
+        stream = io.stream_audio(
+            fhandle, 5000, 7000, sr=None, mono=True, offset=0.5, duration=1.0
+        )
+        assert stream.sample_rate == sr
+        blocks = list(stream)
+    mono, _ = io.load_audio(AUDIO_PATH, sr=None, mono=True, offset=0.5, duration=1.0)
+    assert [len(block) for block in blocks] == [5000] * 6 + [44100 - 42000]
+    for i, block in enumerate(blocks):
+        assert np.allclose(block, mono[i * 7000 : i * 7000 + 5000])
+
+
+def test_stream_audio_resampled():
+    audio, _ = io.load_audio(AUDIO_PATH, sr=22050, mono=True)
+    stream = io.stream_audio(AUDIO_PATH, 1000, sr=22050, mono=True)
+    assert stream.sample_rate == 22050
+    streamed = np.concatenate(list(stream))
+    assert streamed.shape == audio.shape
+    assert np.allclose(streamed, audio, atol=1e-4)
+
+
+def test_stream_audio_options():
+    with io.audio_options(sample_rate=8000, mono=False, offset=1.0):
+        stream = io.stream_audio(AUDIO_PATH, 1000, sr=None, mono=True)
+    assert stream.sample_rate == 8000
+    blocks = list(stream)
+    assert blocks[0].shape == (1, 1000)
+    assert sum(block.shape[-1] for block in blocks) == 8000
+
+    with io.audio_options(mono=True):
+        stream = io.stream_audio(
+            AUDIO_PATH, 1000, sr=None, mono=False, transform=lambda block: block * 2
+        )
+    audio, _ = io.load_audio(AUDIO_PATH, sr=None, mono=True)
+    assert np.allclose(next(iter(stream)), 2 * audio[:1000])
+
+    with io.audio_options(resample_quality="polyphase"):
+        with pytest.raises(ValueError):
+            io.stream_audio(AUDIO_PATH, 1000)
+
+
+def test_stream_audio_invalid():
+    assert io.stream_audio(None, 1000) is None
+    with pytest.raises(IOError):
+        io.stream_audio("a/fake/filepath", 1000)
+    with pytest.raises(ValueError):
+        io.stream_audio(AUDIO_PATH, 0)
+    with pytest.raises(ValueError):
+        io.stream_audio(AUDIO_PATH, 1000, hop=0)
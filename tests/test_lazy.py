@@ -0,0 +1,19 @@
+import sys
+
+from mirdata import lazy
+
+
+def test_import_module():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy.import_module("colorsys")
+    assert "colorsys" not in sys.modules
+    assert repr(colorsys) == "<lazy module 'colorsys'>"
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert "colorsys" in sys.modules
+    assert "rgb_to_hsv" in dir(colorsys)
+
+
+def test_is_installed():
+    assert lazy.is_installed("json")
+    assert not lazy.is_installed("not_a_module_1234")
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 import importlib
 import inspect
 from inspect import signature
@@ -9,7 +10,7 @@ import requests
 
 
 import mirdata
-from mirdata import core, download_utils
+from mirdata import core, download_utils, index_utils
 from tests.test_utils import DEFAULT_DATA_HOME
 
 DATASETS = mirdata.DATASETS
@@ -62,11 +63,14 @@ def create_remote_index(httpserver, dataset_name):
 
 
 def clean_remote_dataset(dataset_name):
-    os.remove(
-        os.path.join(
-            "mirdata/datasets/indexes", REMOTE_DATASETS[dataset_name]["filename"]
-        )
+    index_path = os.path.join(
+        "mirdata/datasets/indexes", REMOTE_DATASETS[dataset_name]["filename"]
     )
+    os.remove(index_path)
+    download_utils.remove_stamp(index_path)
+    compiled_path = index_utils.compiled_index_path(index_path)
+    if os.path.exists(compiled_path):
+        os.remove(compiled_path)
 
 
 def test_dataset_attributes(httpserver):
@@ -92,9 +96,9 @@ def test_dataset_attributes(httpserver):
         assert (
             isinstance(dataset.remotes, dict) or dataset.remotes is None
         ), "{}.REMOTES must be a dictionary".format(dataset_name)
-        assert isinstance(dataset._index, dict), "{}.DATA is not properly set".format(
-            dataset_name
-        )
+        assert isinstance(
+            dataset._index, Mapping
+        ), "{}.DATA is not properly set".format(dataset_name)
         assert (
             isinstance(dataset._download_info, str) or dataset._download_info is None
         ), "{}.DOWNLOAD_INFO must be a string".format(dataset_name)
@@ -226,17 +230,17 @@ def test_validate(skip_local, httpserver):
             # dataset_default = module.Dataset(data_home=None, index=remote_index)
 
         try:
-            dataset.validate()
+            dataset.validate(cache=False)
         except:
             assert False, "{}: {}".format(dataset_name, sys.exc_info()[0])
 
         try:
-            dataset.validate(verbose=False)
+            dataset.validate(verbose=False, cache=False)
         except:
             assert False, "{}: {}".format(dataset_name, sys.exc_info()[0])
 
         try:
-            dataset_default.validate(verbose=False)
+            dataset_default.validate(verbose=False, cache=False)
         except:
             assert False, "{}: {}".format(dataset_name, sys.exc_info()[0])
 
@@ -281,9 +285,9 @@ def test_load_and_trackids(httpserver):
             except:
                 assert False, "{}: {}".format(dataset_name, sys.exc_info()[0])
 
-            assert (
-                type(dataset_data) is dict
-            ), "{}.load should return a dictionary".format(dataset_name)
+            assert isinstance(
+                dataset_data, Mapping
+            ), "{}.load_tracks should return a mapping".format(dataset_name)
             assert (
                 len(dataset_data.keys()) == trackid_len
             ), "the dictionary returned {}.load() does not have the same number of elements as {}.track_ids()".format(
@@ -439,6 +443,43 @@ def test_load_methods(httpserver):
                     load_method("a/fake/filepath")
 
 
+def test_load_audio_segments():
+    for dataset_name in DATASETS:
+        module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+        audio_loaders = [
+            getattr(module, name)
+            for name in dir(module)
+            if name.startswith("load_") and "audio" in name
+        ]
+        for loader in audio_loaders:
+            parameters = signature(loader).parameters
+            assert "offset" in parameters, "{}.{} has no offset".format(
+                dataset_name, loader.__name__
+            )
+            assert parameters["offset"].default == 0.0
+            assert "duration" in parameters, "{}.{} has no duration".format(
+                dataset_name, loader.__name__
+            )
+            assert parameters["duration"].default is None
+
+
+def test_stream_audio():
+    for dataset_name in DATASETS:
+        module = importlib.import_module("mirdata.datasets.{}".format(dataset_name))
+        audio_loaders = [
+            name for name in dir(module) if name.startswith("load_") and "audio" in name
+        ]
+        for loader_name in audio_loaders:
+            streamer_name = "stream_" + loader_name[len("load_") :]
+            assert hasattr(module, streamer_name), "{} has no {}".format(
+                dataset_name, streamer_name
+            )
+            streamer = getattr(module, streamer_name)
+            assert streamer.__doc__ is not None
+            with pytest.raises(IOError):
+                streamer("a/fake/filepath", 1024)
+
+
 CUSTOM_TEST_MTRACKS = {}
 
 
@@ -1,10 +1,11 @@
+import hashlib
 import itertools
 import os
 import sys
 import types
 
 import mirdata
-from mirdata import core, validate, download_utils
+from mirdata import core, validate, download_utils, index_utils
 
 import json
 import pytest
@@ -105,6 +106,14 @@ def test_remote_index(httpserver):
     ind = DATA.index
     assert len(ind["tracks"]) == 16
     os.remove("mirdata/datasets/indexes/acousticbrainz_genre_dataset_little_test.json")
+    download_utils.remove_stamp(
+        "mirdata/datasets/indexes/acousticbrainz_genre_dataset_little_test.json"
+    )
+    os.remove(
+        index_utils.compiled_index_path(
+            "mirdata/datasets/indexes/acousticbrainz_genre_dataset_little_test.json"
+        )
+    )
 
 
 def test_md5(mocker):
@@ -136,18 +145,53 @@ def test_md5(mocker):
         ),
     ],
 )
-def test_validate_index(test_index, expected_missing, expected_inv_checksum):
+def test_validate_index(mocker, test_index, expected_missing, expected_inv_checksum):
     index_path = os.path.join("tests/indexes", test_index)
     with open(index_path) as index_file:
         test_index = json.load(index_file)
 
+    # nothing is written in the test resources
     missing_files, invalid_checksums = validate.validate_index(
-        test_index, "tests/resources/"
+        test_index, "tests/resources/", cache=False
+    )
+    assert not os.path.exists(
+        os.path.join("tests/resources", validate.VALIDATION_DB_NAME)
     )
 
     assert expected_missing == missing_files
     assert expected_inv_checksum == invalid_checksums
 
+    # the same results are found when hashing files in parallel
+    for executor in ["thread", "process"]:
+        missing_files, invalid_checksums = validate.validate_index(
+            test_index,
+            "tests/resources/",
+            verbose=False,
+            workers=2,
+            chunk_size=1000,
+            executor=executor,
+            cache=False,
+        )
+        assert expected_missing == missing_files
+        assert expected_inv_checksum == invalid_checksums
+
+    # files with a size in the index are checked without being hashed
+    md5 = mocker.spy(validate, "md5")
+    missing_files, invalid_checksums = validate.validate_index(
+        test_index, "tests/resources/", verbose=False, level="quick", cache=False
+    )
+    assert expected_missing == missing_files
+    assert expected_inv_checksum == invalid_checksums
+    sized = [
+        os.path.join("tests/resources/", entry[0])
+        for files in test_index["tracks"].values()
+        for entry in files.values()
+        if len(entry) > 2
+    ]
+    assert sized
+    hashed = [call.args[0] for call in md5.call_args_list]
+    assert not set(sized) & set(hashed)
+
 
 @pytest.mark.parametrize(
     "missing_files,invalid_checksums",
@@ -169,4 +213,202 @@ def test_validator(mocker, mock_validate_index, missing_files, invalid_checksums
     m, c = validate.validator("foo", "bar", False)
     assert m == missing_files
     assert c == invalid_checksums
-    mock_validate_index.assert_called_once_with("foo", "bar", False)
+    mock_validate_index.assert_called_once_with(
+        "foo",
+        "bar",
+        False,
+        workers=1,
+        chunk_size=validate.DEFAULT_CHUNK_SIZE,
+        executor="thread",
+        full=False,
+        level="md5",
+        cache=True,
+    )
+
+
+def test_validate_parallel(tmpdir):
+    file_dict = {}
+    for i in range(20):
+        path = str(tmpdir.join("{}.bin".format(i)))
+        with open(path, "wb") as fhandle:
+            fhandle.write(os.urandom(3000 + i))
+        checksum = validate.md5(path, chunk_size=512)
+        if i % 5 == 0:
+            checksum = "invalid"
+        file_dict["track{}".format(i)] = {"audio": ["{}.bin".format(i), checksum]}
+    file_dict["missing"] = {"audio": ["missing.bin", "1234"]}
+
+    expected = validate.validate_files(file_dict, str(tmpdir), False)
+    assert list(expected[0].keys()) == ["missing"]
+    assert list(expected[1].keys()) == ["track0", "track5", "track10", "track15"]
+    for workers in [2, 8]:
+        assert expected == validate.validate_files(
+            file_dict, str(tmpdir), False, workers=workers, chunk_size=100
+        )
+    with pytest.raises(ValueError):
+        validate.validate_files(file_dict, str(tmpdir), False, executor="fiber")
+
+
+def test_validate_incremental(tmpdir, mocker):
+    data_home = str(tmpdir)
+    index = {"tracks": {}}
+    for i in range(5):
+        path = "{}.bin".format(i)
+        with open(os.path.join(data_home, path), "wb") as fhandle:
+            fhandle.write(os.urandom(1000))
+        checksum = validate.md5(os.path.join(data_home, path))
+        index["tracks"][str(i)] = {"audio": [path, checksum if i else "invalid"]}
+
+    invalid = {"tracks": {"0": [os.path.join(data_home, "0.bin")]}}
+    # without the cache, nothing is written in data_home
+    report = validate.validate_index(index, data_home, False, cache=False)
+    assert report == ({"tracks": {}}, invalid)
+    assert not os.path.exists(os.path.join(data_home, validate.VALIDATION_DB_NAME))
+
+    assert validate.validate_index(index, data_home, False) == ({"tracks": {}}, invalid)
+    assert os.path.exists(os.path.join(data_home, validate.VALIDATION_DB_NAME))
+
+    # unchanged files which passed are not hashed again
+    md5 = mocker.spy(validate, "md5")
+    assert validate.validate_index(index, data_home, False) == ({"tracks": {}}, invalid)
+    assert [call.args[0] for call in md5.call_args_list] == [
+        os.path.join(data_home, "0.bin")
+    ]
+
+    # modified files are hashed again
+    md5.reset_mock()
+    with open(os.path.join(data_home, "3.bin"), "ab") as fhandle:
+        fhandle.write(b"x")
+    invalid["tracks"]["3"] = [os.path.join(data_home, "3.bin")]
+    assert validate.validate_index(index, data_home, False) == ({"tracks": {}}, invalid)
+    assert md5.call_count == 2
+
+    # a changed checksum in the index is detected without hashing
+    md5.reset_mock()
+    index["tracks"]["1"]["audio"][1] = "changed"
+    invalid["tracks"]["1"] = [os.path.join(data_home, "1.bin")]
+    missing, found = validate.validate_index(index, data_home, False)
+    assert sorted(found["tracks"]) == ["0", "1", "3"]
+    assert md5.call_count == 2
+
+    # full validations hash every file
+    md5.reset_mock()
+    validate.validate_index(index, data_home, False, full=True, workers=2)
+    assert md5.call_count == 5
+
+    store = validate.ValidationStore(data_home)
+    assert store.lookup(os.path.join(data_home, "2.bin")) == validate.md5(
+        os.path.join(data_home, "2.bin")
+    )
+    assert store.lookup(os.path.join(data_home, "3.bin")) is None
+    store.clear()
+    assert not os.path.exists(store.path)
+
+
+def test_validation_store_readonly(tmpdir, mocker):
+    store = validate.ValidationStore(str(tmpdir.join("missing_folder")))
+    assert store.lookup(str(tmpdir.join("a.bin"))) is None
+    # errors are logged, and validation goes on without the store
+    store.update([(str(tmpdir.join("a.bin")), (1, 2, 3), "1234")], [])
+    assert store.lookup(str(tmpdir.join("a.bin"))) is None
+
+
+def test_validate_quick(tmpdir, mocker):
+    data_home = str(tmpdir)
+    os.mkdir(os.path.join(data_home, "audio"))
+    index = {"tracks": {}, "metadata": {"meta": ["meta.csv", "1234", 3]}}
+    for i in range(4):
+        path = os.path.join("audio", "{}.bin".format(i))
+        with open(os.path.join(data_home, path), "wb") as fhandle:
+            fhandle.write(b"x" * 100)
+        index["tracks"][str(i)] = {"audio": [path, "1234", 100]}
+    with open(os.path.join(data_home, "meta.csv"), "wb") as fhandle:
+        fhandle.write(b"abc")
+
+    # truncated, missing, and without a size in the index
+    index["tracks"]["1"]["audio"][2] = 200
+    index["tracks"]["2"]["audio"][0] = os.path.join("audio", "missing.bin")
+    index["tracks"]["3"]["audio"] = [
+        index["tracks"]["3"]["audio"][0],
+        hashlib.md5(b"x" * 100).hexdigest(),
+    ]
+    index["tracks"]["4"] = {"audio": [os.path.join("audio", "0.bin"), "1234"]}
+
+    md5 = mocker.spy(validate, "md5")
+    missing, invalid = validate.validate_index(index, data_home, False, level="quick")
+    assert missing == {
+        "metadata": {},
+        "tracks": {"2": [os.path.join(data_home, "audio", "missing.bin")]},
+    }
+    # files without a size are checked with their checksum instead
+    assert invalid == {
+        "metadata": {},
+        "tracks": {
+            "1": [os.path.join(data_home, "audio", "1.bin")],
+            "4": [os.path.join(data_home, "audio", "0.bin")],
+        },
+    }
+    assert md5.call_count == 2
+
+    # and are not hashed again while they are unchanged
+    validate.validate_index(index, data_home, False, level="quick")
+    assert md5.call_count == 3
+
+    with pytest.raises(ValueError):
+        validate.validate_index(index, data_home, False, level="sha1")
+
+
+def test_remote_file_map_and_subset():
+    index = {
+        "metadata": {"meta": ["meta.csv", "1"]},
+        "tracks": {
+            "a": {"audio": ["audio/a.wav", "2"], "beats": ["beats/a.txt", "3"]},
+            "b": {"audio": ["audio/b.wav", "4"], "beats": [None, None]},
+        },
+    }
+    remotes = {
+        "audio": download_utils.RemoteFileMetadata("audio.zip", "url", "5", "audio"),
+        "beats": download_utils.RemoteFileMetadata("beats.zip", "url", "6", None),
+        "extra": download_utils.RemoteFileMetadata("extra.zip", "url", "7", "."),
+        "meta": download_utils.RemoteFileMetadata("meta.csv", "url", "1", None),
+    }
+    mapping = validate.remote_file_map(index, remotes)
+    assert mapping == {
+        "audio": {"tracks": {"a": ["audio"], "b": ["audio"]}},
+        "beats": None,
+        "extra": None,
+        "meta": {"metadata": ["meta"]},
+    }
+
+    # a single remote provides everything
+    mapping = validate.remote_file_map(index, {"beats": remotes["beats"]})
+    assert mapping["beats"]["tracks"] == {"a": ["audio", "beats"], "b": ["audio"]}
+
+    # unless it is extracted in its own folder, as the beatles annotations
+    mapping = validate.remote_file_map(index, {"audio": remotes["audio"]})
+    assert mapping == {"audio": {"tracks": {"a": ["audio"], "b": ["audio"]}}}
+    beatles = mirdata.initialize("beatles")
+    for files in beatles._remote_files["annotations"]["tracks"].values():
+        assert "audio" not in files
+
+    # an explicit mapping in the index is used as is
+    index["remotes"] = {"beats": {"tracks": {"a": ["beats"]}}}
+    mapping = validate.remote_file_map(index, remotes)
+    assert mapping["beats"] == {"tracks": {"a": ["beats"]}}
+    assert mapping["audio"] is None
+
+    subset = validate.subset_index(index, track_ids=["b"])
+    assert subset == {"tracks": {"b": index["tracks"]["b"]}}
+    subset = validate.subset_index(
+        index, remote_entries=[mapping["beats"], {"metadata": ["meta"]}]
+    )
+    assert subset == {
+        "metadata": {"meta": ["meta.csv", "1"]},
+        "tracks": {"a": {"beats": ["beats/a.txt", "3"]}},
+    }
+    subset = validate.subset_index(
+        index, track_ids=["b"], remote_entries=[mapping["beats"]]
+    )
+    assert subset == {}
+    with pytest.raises(ValueError):
+        validate.subset_index(index, track_ids=["c"])